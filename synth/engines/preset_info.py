@@ -11,8 +11,13 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Self
 
+import numpy as np
+
 from .region_descriptor import RegionDescriptor
 
+# Below this many regions a plain Python scan beats building NumPy masks
+_VECTORIZED_MATCH_MIN_REGIONS = 16
+
 
 @dataclass(slots=True)
 class PresetInfo:
@@ -52,6 +57,9 @@ class PresetInfo:
     # Additional engine-specific parameters
     extra_params: dict[str, Any] = field(default_factory=dict)
 
+    # (n, 4) table of key_lo, key_hi, vel_lo, vel_hi, built on first large match
+    _range_table: np.ndarray | None = field(default=None, init=False, repr=False, compare=False)
+
     # ========== REGION SELECTION METHODS ==========
 
     def get_matching_descriptors(self, note: int, velocity: int) -> list[RegionDescriptor]:
@@ -65,7 +73,37 @@ class PresetInfo:
         Returns:
             List of region descriptors that should play for this note/velocity
         """
-        return [d for d in self.region_descriptors if d.should_play_for_note(note, velocity)]
+        descriptors = self.region_descriptors
+        if len(descriptors) < _VECTORIZED_MATCH_MIN_REGIONS:
+            return [d for d in descriptors if d.should_play_for_note(note, velocity)]
+
+        table = self._get_range_table()
+        mask = (
+            (table[:, 0] <= note)
+            & (note <= table[:, 1])
+            & (table[:, 2] <= velocity)
+            & (velocity <= table[:, 3])
+        )
+        return [descriptors[i] for i in np.flatnonzero(mask)]
+
+    def _get_range_table(self) -> np.ndarray:
+        """
+        Get the key/velocity bounds of all regions as one array.
+
+        Descriptors are treated as immutable once built; the table is only
+        rebuilt when regions are added or removed.
+
+        Returns:
+            int16 array of shape (n, 4): key_lo, key_hi, vel_lo, vel_hi
+        """
+        table = self._range_table
+        if table is None or len(table) != len(self.region_descriptors):
+            table = np.array(
+                [(*d.key_range, *d.velocity_range) for d in self.region_descriptors],
+                dtype=np.int16,
+            ).reshape(-1, 4)
+            self._range_table = table
+        return table
 
     def get_crossfade_groups(self, note: int, velocity: int) -> list[list[RegionDescriptor]]:
         """
@@ -212,6 +212,57 @@ if TYPE_CHECKING:
     from ..engine.modern_xg_synthesizer import ModernXGSynthesizer
 
 
+# Default SF2 partial parameters; get_default_partial_params() hands out copies
+_DEFAULT_PARTIAL_PARAMS: dict[str, Any] = {
+    "level": 1.0,
+    "pan": 0.0,
+    "coarse_tune": 0,
+    "fine_tune": 0,
+    "scale_tuning": 100,
+    "overriding_root_key": -1,
+    "key_range_low": 0,
+    "key_range_high": 127,
+    "velocity_range_low": 0,
+    "velocity_range_high": 127,
+    "filter_cutoff": 1000.0,
+    "filter_resonance": 0.7,
+    "filter_type": "lowpass",
+    "filter_key_follow": 0.5,
+    "use_filter_env": True,
+    "filter_attack": 0.1,
+    "filter_decay": 0.5,
+    "filter_sustain": 0.6,
+    "filter_release": 0.8,
+    "use_pitch_env": False,
+    "pitch_attack": 0.05,
+    "pitch_decay": 0.1,
+    "pitch_sustain": 0.0,
+    "pitch_release": 0.05,
+    "pitch_envelope_depth": 1200.0,
+    "amp_attack": 0.01,
+    "amp_decay": 0.3,
+    "amp_sustain": 0.7,
+    "amp_release": 0.5,
+    "amp_delay": 0.0,
+    "amp_hold": 0.0,
+    # SF2-specific additions
+    "reverb_send": 0.0,
+    "chorus_send": 0.0,
+    "exclusive_class": 0,
+    "sample_mode": 0,
+}
+
+# Top-level fields of the fallback voice; _get_default_voice_params() adds fresh partials
+_DEFAULT_VOICE_PARAMS: dict[str, Any] = {
+    "name": "Default SF2 Voice",
+    "key_range_low": 0,
+    "key_range_high": 127,
+    "master_level": 1.0,
+    "pan": 0.0,
+    "assign_mode": 1,  # Polyphonic
+}
+
+
 class SF2Engine(SynthesisEngine):
     """
     SF2 wavetable synthesis engine.
@@ -248,6 +299,8 @@ class SF2Engine(SynthesisEngine):
         self.soundfont_manager = SF2SoundFontManager(
             cache_memory_mb=max_memory_mb, max_loaded_files=10
         )
+        # (bank, program) -> (manager state version, preset info)
+        self._preset_info_cache: dict[tuple[int, int], tuple[int, PresetInfo]] = {}
 
         # Load initial soundfont if provided
         if sf2_file_path:
@@ -388,20 +441,41 @@ class SF2Engine(SynthesisEngine):
         Returns:
             PresetInfo with all region descriptors, or None if not found
         """
+        cache_key = (bank, program)
+        state_version = self.soundfont_manager.state_version
+        cached = self._preset_info_cache.get(cache_key)
+        if cached is not None and cached[0] == state_version:
+            return cached[1]
+
+        preset_info = self._build_preset_info(bank, program)
+        if preset_info is not None:
+            self._preset_info_cache[cache_key] = (state_version, preset_info)
+        return preset_info
+
+    def _build_preset_info(self, bank: int, program: int) -> PresetInfo | None:
+        """
+        Build preset info by walking the preset and instrument zones.
 
-        # Search through loaded soundfonts
-        for filepath in self.soundfont_manager.file_order:
+        Args:
+            bank: MIDI bank number
+            program: MIDI program number
+
+        Returns:
+            PresetInfo with all region descriptors, or None if not found
+        """
+        # Apply bank remapping if configured
+        remapped_bank = bank
+        remapped_program = program
+        key = (bank, program)
+        if key in self.soundfont_manager.file_remapping:
+            remapped_bank, remapped_program = self.soundfont_manager.file_remapping[key]
+
+        # Search through the loaded soundfonts that define this program
+        for filepath in self.soundfont_manager.get_program_files(remapped_bank, remapped_program):
             soundfont = self.soundfont_manager.loaded_files.get(filepath)
             if not soundfont:
                 continue
 
-            # Get or load preset, applying bank remapping if configured
-            remapped_bank = bank
-            remapped_program = program
-            key = (bank, program)
-            if key in self.soundfont_manager.file_remapping:
-                remapped_bank, remapped_program = self.soundfont_manager.file_remapping[key]
-
             preset = soundfont._get_or_load_preset(remapped_bank, remapped_program)
             if not preset:
                 continue
@@ -874,56 +948,11 @@ class SF2Engine(SynthesisEngine):
 
     def get_default_partial_params(self) -> dict:
         """Get default SF2 partial parameters."""
-        return {
-            "level": 1.0,
-            "pan": 0.0,
-            "coarse_tune": 0,
-            "fine_tune": 0,
-            "scale_tuning": 100,
-            "overriding_root_key": -1,
-            "key_range_low": 0,
-            "key_range_high": 127,
-            "velocity_range_low": 0,
-            "velocity_range_high": 127,
-            "filter_cutoff": 1000.0,
-            "filter_resonance": 0.7,
-            "filter_type": "lowpass",
-            "filter_key_follow": 0.5,
-            "use_filter_env": True,
-            "filter_attack": 0.1,
-            "filter_decay": 0.5,
-            "filter_sustain": 0.6,
-            "filter_release": 0.8,
-            "use_pitch_env": False,
-            "pitch_attack": 0.05,
-            "pitch_decay": 0.1,
-            "pitch_sustain": 0.0,
-            "pitch_release": 0.05,
-            "pitch_envelope_depth": 1200.0,
-            "amp_attack": 0.01,
-            "amp_decay": 0.3,
-            "amp_sustain": 0.7,
-            "amp_release": 0.5,
-            "amp_delay": 0.0,
-            "amp_hold": 0.0,
-            # SF2-specific additions
-            "reverb_send": 0.0,
-            "chorus_send": 0.0,
-            "exclusive_class": 0,
-            "sample_mode": 0,
-        }
+        return dict(_DEFAULT_PARTIAL_PARAMS)
 
     def _get_default_voice_params(self) -> dict:
         """Get default XG voice parameters."""
-        return {
-            "name": "Default SF2 Voice",
-            "key_range_low": 0,
-            "key_range_high": 127,
-            "master_level": 1.0,
-            "pan": 0.0,
-            "assign_mode": 1,  # Polyphonic
-            "partials": [self.get_default_partial_params()],
-        }
+        return {**_DEFAULT_VOICE_PARAMS, "partials": [self.get_default_partial_params()]}
 
     def get_engine_info(self) -> dict[str, Any]:
         """Get SF2 engine information."""
@@ -1082,6 +1111,7 @@ class SF2Engine(SynthesisEngine):
     def clear_cache(self):
         """Clear SF2 sample cache to free memory."""
         self.soundfont_manager.clear_all_caches()
+        self._preset_info_cache.clear()
         logger.info("SF2 engine cache cleared")
 
     # ===== MODERN SYNTH INTEGRATION METHODS =====
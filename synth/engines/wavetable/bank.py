@@ -137,7 +137,8 @@ class WavetableBank:
             elif bits_per_sample == 16:
                 dtype = np.int16
                 data = np.frombuffer(data_chunk, dtype=dtype)
-                data = data.astype(np.float32) / 32768.0
+                data = data.astype(np.float32)
+                data *= np.float32(1.0 / 32768.0)
             elif bits_per_sample == 24:
                 # 24-bit is tricky - need to handle manually
                 data = np.zeros(len(data_chunk) // 3, dtype=np.float32)
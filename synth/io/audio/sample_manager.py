@@ -275,6 +275,7 @@ import logging
 
 import os
 import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
@@ -290,54 +291,50 @@ class SampleCache:
     def __init__(self, max_memory_mb: float = 512.0):
         self.max_memory_bytes = int(max_memory_mb * 1024 * 1024)
         self.current_memory_bytes = 0
-        self.cache: dict[str, Any] = {}
-        self.access_times: dict[str, float] = {}
+        # key -> (item, size in bytes), least recently used first
+        self.cache: OrderedDict[str, tuple[Any, int]] = OrderedDict()
         self.lock = threading.RLock()
 
     def get(self, key: str) -> Any | None:
-        """Get item from cache, updating access time"""
+        """Get item from cache, marking it most recently used"""
         with self.lock:
-            if key in self.cache:
-                self.access_times[key] = self._current_time()
-                return self.cache[key]
+            entry = self.cache.get(key)
+            if entry is not None:
+                self.cache.move_to_end(key)
+                return entry[0]
         return None
 
     def put(self, key: str, item: Any) -> None:
         """Put item in cache, evicting if necessary"""
         with self.lock:
-            # Calculate item size (approximate)
+            # Size is estimated once and stored, so eviction never re-probes the item
             item_size = self._estimate_size(item)
 
+            # Replace an existing entry without double counting it
+            previous = self.cache.pop(key, None)
+            if previous is not None:
+                self.current_memory_bytes -= previous[1]
+
             # Evict items if needed
             while self.current_memory_bytes + item_size > self.max_memory_bytes and self.cache:
                 self._evict_lru()
 
             # Add item
-            self.cache[key] = item
-            self.access_times[key] = self._current_time()
+            self.cache[key] = (item, item_size)
             self.current_memory_bytes += item_size
 
     def clear(self) -> None:
         """Clear all cached items"""
         with self.lock:
             self.cache.clear()
-            self.access_times.clear()
             self.current_memory_bytes = 0
 
     def _evict_lru(self) -> None:
         """Evict least recently used item"""
-        if not self.access_times:
+        if not self.cache:
             return
 
-        # Find LRU item
-        lru_key = min(self.access_times, key=self.access_times.get)
-
-        # Remove it
-        item = self.cache[lru_key]
-        item_size = self._estimate_size(item)
-
-        del self.cache[lru_key]
-        del self.access_times[lru_key]
+        _, (_, item_size) = self.cache.popitem(last=False)
         self.current_memory_bytes -= item_size
 
     def _estimate_size(self, item: Any) -> int:
@@ -349,12 +346,6 @@ class SampleCache:
         else:
             return 1024  # Default estimate
 
-    def _current_time(self) -> float:
-        """Get current time for LRU tracking"""
-        import time
-
-        return time.time()
-
 
 class StreamingSample:
     """Streaming sample for large audio files"""
@@ -101,19 +101,19 @@ SF2_GENERATORS: dict[int, dict[str, Any]] = {
 }
 
 # SF2 Modulator Sources (SF2.01 Specification Section 8.2.1)
+# General controller names are listed after the MIDI controller range so they
+# take precedence for the indices both palettes share.
 SF2_MODULATOR_SOURCES: dict[int, str] = {
+    # MIDI Controllers 0-127
+    **{i: f"cc{i}" for i in range(128)},
     # General Controllers
     0: "none",
     2: "velocity",
     3: "key",
-    10: "pan",
+    10: "poly_pressure",
     13: "channel_pressure",
     14: "pitch_wheel",
-    16: "timbre",  # Brightness
-    17: "pitch",  # Coarse tune
-    18: "fine_tune",
-    # MIDI Controllers 0-127
-    **{i: f"cc{i}" for i in range(128)},
+    16: "pitch_wheel_sensitivity",
     # Internal Sources (negative values)
     0x80: "link",  # For stereo samples
 }
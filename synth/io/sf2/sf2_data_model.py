@@ -10,6 +10,177 @@ from __future__ import annotations
 from typing import Any
 
 import numpy as np
+from numba import njit
+
+
+def decode_24bit_pcm(data: bytes) -> np.ndarray:
+    """
+    Decode packed little-endian signed 24-bit PCM into normalized float32.
+
+    Trailing bytes that do not form a complete 3-byte sample are ignored.
+
+    Args:
+        data: Packed 24-bit sample bytes
+
+    Returns:
+        Flat float32 array in the range [-1.0, 1.0)
+    """
+    frames = np.frombuffer(data, dtype=np.uint8, count=len(data) // 3 * 3).reshape(-1, 3)
+    values = frames[:, 0].astype(np.int32)
+    values |= frames[:, 1].astype(np.int32) << 8
+    values |= frames[:, 2].view(np.int8).astype(np.int32) << 16
+    samples = values.astype(np.float32)
+    samples *= np.float32(1.0 / 8388608.0)
+    return samples
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _pcm16_to_float32(samples: np.ndarray, channels: int) -> np.ndarray:
+    """
+    Scale 16-bit PCM to float32 frames in one pass.
+
+    Trailing samples that do not form a complete frame are dropped. The
+    loop runs over the flat buffer so LLVM can vectorize it; a nested
+    frame/channel loop defeats SIMD and is over 10x slower.
+
+    Args:
+        samples: Flat int16 sample array
+        channels: Number of interleaved channels
+
+    Returns:
+        float32 array of shape (frames, channels)
+    """
+    scale = np.float32(1.0 / 32768.0)
+    frames = samples.size // channels
+    out = np.empty(frames * channels, dtype=np.float32)
+    for i in range(out.size):
+        out[i] = samples[i] * scale
+    return out.reshape(frames, channels)
+
+
+def decode_16bit_pcm(data: bytes, channels: int = 1) -> np.ndarray:
+    """
+    Decode packed little-endian signed 16-bit PCM into normalized float32 frames.
+
+    A trailing odd byte and samples that do not form a complete frame are
+    ignored.
+
+    Args:
+        data: Packed 16-bit sample bytes
+        channels: Number of interleaved channels
+
+    Returns:
+        float32 array of shape (frames, channels) in the range [-1.0, 1.0)
+    """
+    return _pcm16_to_float32(np.frombuffer(data, dtype=np.int16, count=len(data) // 2), channels)
+
+
+def _mono_as_stereo(mono: np.ndarray) -> np.ndarray:
+    """
+    Present a mono channel as read-only (frames, 2) stereo data.
+
+    Both columns are views of the same buffer, so mono samples cost half
+    the memory of a duplicated copy.
+
+    Args:
+        mono: Flat float32 sample array
+
+    Returns:
+        Read-only float32 view of shape (frames, 2)
+    """
+    return np.broadcast_to(mono.reshape(-1, 1), (len(mono), 2))
+
+
+def _range_to_mask(low: int, high: int) -> int:
+    """
+    Build a bitmask with bits low..high set (inclusive).
+
+    Args:
+        low: Lowest set bit
+        high: Highest set bit
+
+    Returns:
+        Integer mask, or 0 for an empty range
+    """
+    if low > high:
+        return 0
+    return ((1 << (high - low + 1)) - 1) << low
+
+
+_FULL_RANGE_MASK = _range_to_mask(0, 127)
+
+# Zone counts from which one numpy range comparison beats per-zone checks
+_VECTORIZED_MATCH_MIN_ZONES = 16
+
+
+def _build_zone_range_table(zones: list[SF2Zone]) -> np.ndarray:
+    """
+    Gather zone key/velocity ranges into one array for vectorized matching.
+
+    Args:
+        zones: Zones in lookup order
+
+    Returns:
+        int16 array of shape (len(zones), 4): key low/high, velocity low/high
+    """
+    return np.array(
+        [(*zone.key_range, *zone.velocity_range) for zone in zones], dtype=np.int16
+    ).reshape(-1, 4)
+
+
+def _first_matching_zone(
+    zones: list[SF2Zone], range_table: np.ndarray | None, note: int, velocity: int
+) -> SF2Zone | None:
+    """
+    Find the first zone accepting a note and velocity.
+
+    Args:
+        zones: Zones in lookup order
+        range_table: Table from _build_zone_range_table, or None to check
+            each zone in turn
+        note: MIDI note (0-127)
+        velocity: MIDI velocity (0-127)
+
+    Returns:
+        First matching zone or None
+    """
+    if range_table is None:
+        return next((z for z in zones if z.matches_note_velocity(note, velocity)), None)
+
+    hits = _zone_range_hits(range_table, note, velocity)
+    return zones[hits[0]] if hits.size else None
+
+
+def _matching_zones(
+    zones: list[SF2Zone], range_table: np.ndarray | None, note: int, velocity: int
+) -> list[SF2Zone]:
+    """
+    Find every zone accepting a note and velocity.
+
+    Args:
+        zones: Zones in lookup order
+        range_table: Table from _build_zone_range_table, or None to check
+            each zone in turn
+        note: MIDI note (0-127)
+        velocity: MIDI velocity (0-127)
+
+    Returns:
+        Matching zones in lookup order
+    """
+    if range_table is None:
+        return [z for z in zones if z.matches_note_velocity(note, velocity)]
+
+    return [zones[i] for i in _zone_range_hits(range_table, note, velocity).tolist()]
+
+
+def _zone_range_hits(range_table: np.ndarray, note: int, velocity: int) -> np.ndarray:
+    """Indices of the range table rows accepting a note and velocity."""
+    return np.flatnonzero(
+        (range_table[:, 0] <= note)
+        & (note <= range_table[:, 1])
+        & (range_table[:, 2] <= velocity)
+        & (velocity <= range_table[:, 3])
+    )
 
 
 class SF2Zone:
@@ -20,6 +191,23 @@ class SF2Zone:
     with complete SF2 specification compliance.
     """
 
+    # Immutable defaults live on the class, so constructing one of the many
+    # zones in a large soundfont only stores what parsing actually sets
+    sample_id: int = -1
+
+    # Key/Velocity ranges (extracted from generators 43/44), each mirrored
+    # by a bitmask of accepted values so matching is a shift and an AND
+    _key_range: tuple[int, int] = (0, 127)
+    _velocity_range: tuple[int, int] = (0, 127)
+    _key_mask: int = _FULL_RANGE_MASK
+    _velocity_mask: int = _FULL_RANGE_MASK
+
+    # Zone type classification
+    is_global: bool = False  # True if zone has no sample and full key/vel range
+
+    # Instrument linking (for preset zones)
+    instrument_index: int = -1
+
     def __init__(self, level_type: str = "preset"):
         """
         Initialize SF2 zone.
@@ -32,21 +220,26 @@ class SF2Zone:
         # Core zone data
         self.generators: dict[int, int] = {}  # gen_type -> gen_amount
         self.modulators: list[dict[str, Any]] = []  # List of modulator dicts
-        self.sample_id: int = -1
 
-        # Key/Velocity ranges (extracted from generators 42/43)
-        self.key_range: tuple[int, int] = (0, 127)
-        self.velocity_range: tuple[int, int] = (0, 127)
+    @property
+    def key_range(self) -> tuple[int, int]:
+        """MIDI note range (low, high) this zone responds to."""
+        return self._key_range
 
-        # Zone type classification
-        self.is_global: bool = False  # True if zone has no sample and full key/vel range
+    @key_range.setter
+    def key_range(self, value: tuple[int, int]) -> None:
+        self._key_range = value
+        self._key_mask = _range_to_mask(value[0], value[1])
 
-        # Instrument linking (for preset zones)
-        self.instrument_index: int = -1
+    @property
+    def velocity_range(self) -> tuple[int, int]:
+        """MIDI velocity range (low, high) this zone responds to."""
+        return self._velocity_range
 
-        # Cached matching results for performance
-        self._last_match: tuple[int, int] | None = None
-        self._match_result: bool = False
+    @velocity_range.setter
+    def velocity_range(self, value: tuple[int, int]) -> None:
+        self._velocity_range = value
+        self._velocity_mask = _range_to_mask(value[0], value[1])
 
     def add_generator(self, gen_type: int, gen_amount: int) -> None:
         """
@@ -77,6 +270,18 @@ class SF2Zone:
         """
         self.modulators.append(modulator_data.copy())
 
+    def add_modulators(self, modulators: list[dict[str, Any]]) -> None:
+        """
+        Add a batch of freshly parsed modulators to this zone.
+
+        Unlike add_modulator(), the dictionaries are taken over without being
+        copied, so callers must not share them with other zones.
+
+        Args:
+            modulators: Modulator data dictionaries owned by this zone
+        """
+        self.modulators.extend(modulators)
+
     def finalize(self) -> None:
         """
         Finalize zone after all generators/modulators are added.
@@ -121,22 +326,9 @@ class SF2Zone:
         Returns:
             True if zone matches, False otherwise
         """
-        # Use cached result if same as last check
-        current_match = (note, velocity)
-        if self._last_match == current_match:
-            return self._match_result
-
-        # Check ranges
-        matches = (
-            self.key_range[0] <= note <= self.key_range[1]
-            and self.velocity_range[0] <= velocity <= self.velocity_range[1]
-        )
-
-        # Cache result
-        self._last_match = current_match
-        self._match_result = matches
-
-        return matches
+        if note < 0 or velocity < 0:
+            return False
+        return bool((self._key_mask >> note) & (self._velocity_mask >> velocity) & 1)
 
     def get_generator_value(self, gen_type: int, default: int = -1) -> int:
         """
@@ -201,6 +393,8 @@ class SF2Instrument:
 
         # Zone lookup caches
         self._zone_cache: dict[tuple[int, int], list[SF2Zone]] = {}
+        self._first_zone_cache: dict[tuple[int, int], SF2Zone | None] = {}
+        self._range_table: np.ndarray | None = None
 
     def add_zone(self, zone: SF2Zone) -> None:
         """
@@ -216,6 +410,32 @@ class SF2Instrument:
 
         # Clear cache when zones change
         self._zone_cache.clear()
+        self._first_zone_cache.clear()
+        self._range_table = None
+
+    def find_first_matching_zone(self, note: int, velocity: int) -> SF2Zone | None:
+        """
+        Get the first local (non-global) zone matching the note/velocity.
+
+        Large zone lists are matched with one vectorized range comparison,
+        and each result is cached per note/velocity until the zones change.
+
+        Args:
+            note: MIDI note (0-127)
+            velocity: MIDI velocity (0-127)
+
+        Returns:
+            First matching zone or None
+        """
+        cache_key = (note, velocity)
+        if cache_key in self._first_zone_cache:
+            return self._first_zone_cache[cache_key]
+
+        if len(self.zones) >= _VECTORIZED_MATCH_MIN_ZONES and self._range_table is None:
+            self._range_table = _build_zone_range_table(self.zones)
+        zone = _first_matching_zone(self.zones, self._range_table, note, velocity)
+        self._first_zone_cache[cache_key] = zone
+        return zone
 
     def get_matching_zones(self, note: int, velocity: int) -> list[SF2Zone]:
         """
@@ -240,9 +460,9 @@ class SF2Instrument:
             matching_zones.append(self.global_zone)
 
         # Add specific zones that match
-        for zone in self.zones:
-            if zone.matches_note_velocity(note, velocity):
-                matching_zones.append(zone)
+        if len(self.zones) >= _VECTORIZED_MATCH_MIN_ZONES and self._range_table is None:
+            self._range_table = _build_zone_range_table(self.zones)
+        matching_zones.extend(_matching_zones(self.zones, self._range_table, note, velocity))
 
         # Cache result
         self._zone_cache[cache_key] = matching_zones
@@ -298,6 +518,8 @@ class SF2Preset:
 
         # Zone lookup caches
         self._zone_cache: dict[tuple[int, int], list[SF2Zone]] = {}
+        self._first_zone_cache: dict[tuple[int, int], SF2Zone | None] = {}
+        self._range_table: np.ndarray | None = None
 
     def add_zone(self, zone: SF2Zone) -> None:
         """
@@ -313,6 +535,32 @@ class SF2Preset:
 
         # Clear cache when zones change
         self._zone_cache.clear()
+        self._first_zone_cache.clear()
+        self._range_table = None
+
+    def find_first_matching_zone(self, note: int, velocity: int) -> SF2Zone | None:
+        """
+        Get the first local (non-global) zone matching the note/velocity.
+
+        Large zone lists are matched with one vectorized range comparison,
+        and each result is cached per note/velocity until the zones change.
+
+        Args:
+            note: MIDI note (0-127)
+            velocity: MIDI velocity (0-127)
+
+        Returns:
+            First matching zone or None
+        """
+        cache_key = (note, velocity)
+        if cache_key in self._first_zone_cache:
+            return self._first_zone_cache[cache_key]
+
+        if len(self.zones) >= _VECTORIZED_MATCH_MIN_ZONES and self._range_table is None:
+            self._range_table = _build_zone_range_table(self.zones)
+        zone = _first_matching_zone(self.zones, self._range_table, note, velocity)
+        self._first_zone_cache[cache_key] = zone
+        return zone
 
     def get_matching_zones(self, note: int, velocity: int) -> list[SF2Zone]:
         """
@@ -337,9 +585,9 @@ class SF2Preset:
             matching_zones.append(self.global_zone)
 
         # Add specific zones that match
-        for zone in self.zones:
-            if zone.matches_note_velocity(note, velocity):
-                matching_zones.append(zone)
+        if len(self.zones) >= _VECTORIZED_MATCH_MIN_ZONES and self._range_table is None:
+            self._range_table = _build_zone_range_table(self.zones)
+        matching_zones.extend(_matching_zones(self.zones, self._range_table, note, velocity))
 
         # Cache result
         self._zone_cache[cache_key] = matching_zones
@@ -457,58 +705,22 @@ class SF2Sample:
             return False
 
     def _convert_16bit_sample(self, data: bytes) -> np.ndarray:
-        """Convert 16-bit sample data to float32 stereo interleaved."""
-        samples = np.frombuffer(data, dtype=np.int16)
+        """Convert 16-bit sample data to float32 stereo interleaved (mono as a view)."""
+        # SF2 sample end offset can be off by one, producing an odd sample
+        # count for stereo data. The kernel drops the last sample when this
+        # happens (SF2 spec §3.4: sample end is exclusive, but some
+        # authoring tools write it as inclusive).
         if self.is_stereo:
-            # SF2 sample end offset can be off by one, producing an odd sample
-            # count that can't be reshaped to (-1, 2). Drop the last sample
-            # when this happens (SF2 spec §3.4: sample end is exclusive, but
-            # some authoring tools write it as inclusive).
-            if len(samples) % 2 == 1:
-                samples = samples[:-1]
-            return samples.reshape(-1, 2).astype(np.float32) / 32768.0
-        mono = samples.astype(np.float32) / 32768.0
-        return np.column_stack([mono, mono])
+            return decode_16bit_pcm(data, 2)
+        return _mono_as_stereo(decode_16bit_pcm(data)[:, 0])
 
     def _convert_24bit_sample(self, data: bytes) -> np.ndarray:
-        """Convert 24-bit sample data to float32 stereo interleaved."""
-        samples = []
-
+        """Convert 24-bit sample data to float32 stereo interleaved (mono as a view)."""
+        samples = decode_24bit_pcm(data)
         if self.is_stereo:
-            for i in range(0, len(data), 6):
-                if i + 6 > len(data):
-                    break
-
-                left_bytes = data[i : i + 3]
-                left_int = int.from_bytes(left_bytes, byteorder="little", signed=True)
-                if left_int & 0x800000:
-                    left_int |= 0xFF000000
-                left_sample = left_int / 8388608.0
-
-                right_bytes = data[i + 3 : i + 6]
-                right_int = int.from_bytes(right_bytes, byteorder="little", signed=True)
-                if right_int & 0x800000:
-                    right_int |= 0xFF000000
-                right_sample = right_int / 8388608.0
-
-                samples.extend([left_sample, right_sample])
-
-            return np.array(samples, dtype=np.float32).reshape(-1, 2)
-        else:
-            mono = []
-            for i in range(0, len(data), 3):
-                if i + 3 > len(data):
-                    break
-
-                sample_bytes = data[i : i + 3]
-                sample_int = int.from_bytes(sample_bytes, byteorder="little", signed=True)
-                if sample_int & 0x800000:
-                    sample_int |= 0xFF000000
-                sample = sample_int / 8388608.0
-                mono.append(sample)
-
-            mono_arr = np.array(mono, dtype=np.float32)
-            return np.column_stack([mono_arr, mono_arr])
+            # Only complete stereo frames are kept
+            return samples[: len(samples) // 2 * 2].reshape(-1, 2)
+        return _mono_as_stereo(samples)
 
     def get_loop_samples(self) -> np.ndarray | None:
         """Get loop section of sample data."""
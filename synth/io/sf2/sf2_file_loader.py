@@ -9,13 +9,92 @@ Optimized for large soundfonts with 100% SF2 specification compliance.
 from __future__ import annotations
 
 import logging
+import mmap
+import os
 import struct
 import threading
+from collections.abc import Iterable
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# SF2 shdr record layout (46 bytes), built once so header parsing does not
+# reconstruct the dtype on every call.
+_SHDR_DTYPE = np.dtype(
+    [
+        ("name", "S20"),
+        ("start", "<u4"),
+        ("end", "<u4"),
+        ("start_loop", "<u4"),
+        ("end_loop", "<u4"),
+        ("sample_rate", "<u4"),
+        ("original_pitch", "i1"),
+        ("pitch_correction", "i1"),
+        ("sample_link", "<u2"),
+        ("sample_type", "<u2"),
+    ]
+)
+_SHDR_SIZE = _SHDR_DTYPE.itemsize
+
+# SF2 phdr record layout (38 bytes), read as columns when whole tables are scanned
+_PHDR_DTYPE = np.dtype(
+    [
+        ("name", "S20"),
+        ("program", "<u2"),
+        ("bank", "<u2"),
+        ("bag_index", "<u2"),
+        ("library", "<u4"),
+        ("genre", "<u4"),
+        ("morphology", "<u4"),
+    ]
+)
+
+# Precompiled record layouts, so parsing loops skip format-string lookups
+_RIFF_HEADER = struct.Struct("<4sI4s")  # "RIFF", size, "sfbk"
+_CHUNK_HEADER = struct.Struct("<4sI")  # chunk id, size
+_PHDR_FIELDS = struct.Struct("<HHH")  # phdr program, bank, bag index (offset 20)
+_INST_BAG_INDEX = struct.Struct("<H")  # inst bag index (offset 20)
+_BAG_RECORD = struct.Struct("<HH")  # gen index, mod index
+_GEN_RECORD = struct.Struct("<Hh")  # gen type, signed amount
+_MOD_RECORD = struct.Struct("<HHhHH")  # src, dest, amount, amount src, transform
+
+# Positional reads leave the shared file handle's offset alone (POSIX only)
+_HAS_PREAD = hasattr(os, "pread")
+
+
+@lru_cache(maxsize=64)
+def _compiled_struct(format_string: str) -> struct.Struct:
+    """Get a compiled struct for an arbitrary format string."""
+    return struct.Struct(format_string)
+
+
+def _unpack_records(
+    record: struct.Struct, data: bytes, start: int = 0, end: int | None = None
+) -> list[tuple[int, ...]]:
+    """
+    Unpack the complete fixed-size records in ``[start, end)`` in one pass.
+
+    Args:
+        record: Compiled record layout
+        data: Chunk data
+        start: First record index (inclusive)
+        end: Last record index (exclusive), clamped to the whole records in
+            data; None reads to the end of the chunk
+
+    Returns:
+        List of unpacked record tuples
+    """
+    size = record.size
+    count = len(data) // size
+    end = count if end is None else min(end, count)
+    if start >= end:
+        return []
+    return list(record.iter_unpack(memoryview(data)[start * size : end * size]))
+
 
 class SF2BinaryChunk:
     """
@@ -67,8 +146,8 @@ class SF2BinaryChunk:
         Returns:
             Tuple of parsed values
         """
-        data_slice = self.get_data_slice(offset, struct.calcsize(format_string))
-        return struct.unpack(format_string, data_slice)
+        layout = _compiled_struct(format_string)
+        return layout.unpack(self.get_data_slice(offset, layout.size))
 
     def parse_string(self, offset: int, max_length: int) -> str:
         """
@@ -213,6 +292,7 @@ class SF2FileLoader:
 
         # File handle and locking
         self._file_handle: Any | None = None
+        self._mmap: mmap.mmap | None = None
         self._file_lock = threading.RLock()
 
         # Chunk storage
@@ -221,6 +301,11 @@ class SF2FileLoader:
 
         # Sample data chunk locations (for lazy loading)
         self.sample_data_chunks: dict[str, tuple[int, int]] = {}  # chunk_id -> (offset, size)
+        # (start, end) ranges whose read already failed, so each is logged once
+        self._failed_sample_reads: set[tuple[int, int]] = set()
+
+        # (bank, program) -> phdr record index, built on first preset lookup
+        self._preset_index: dict[tuple[int, int], int] | None = None
 
         # Metadata
         self.version: tuple[int, int] = (0, 0)
@@ -246,12 +331,14 @@ class SF2FileLoader:
         try:
             # Open file and verify (keep file handle open for sample data access)
             self._file_handle = open(self.filepath, "rb")
+            self._mmap = self._map_file()
 
             if not self._verify_sf2_header():
                 self._cleanup()
                 return False
 
             # Parse RIFF structure (only indexes chunks, doesn't load sample data)
+            self._preset_index = None
             self._parse_riff_structure_lazy()
 
             # Load INFO metadata (small metadata chunks)
@@ -280,7 +367,7 @@ class SF2FileLoader:
         if len(riff_header) < 12:
             return False
 
-        riff_id, file_size, sfbk_id = struct.unpack("<4sI4s", riff_header)
+        riff_id, file_size, sfbk_id = _RIFF_HEADER.unpack(riff_header)
 
         if riff_id != b"RIFF" or sfbk_id != b"sfbk":
             return False
@@ -303,7 +390,7 @@ class SF2FileLoader:
             if len(chunk_header) < 8:
                 break
 
-            chunk_id, chunk_size = struct.unpack("<4sI", chunk_header)
+            chunk_id, chunk_size = _CHUNK_HEADER.unpack(chunk_header)
             chunk_id_str = chunk_id.decode("ascii", errors="ignore")
 
             # Handle LIST chunks specially
@@ -329,37 +416,31 @@ class SF2FileLoader:
                 else:
                     # For sdta (sample data), parse nested chunks to find smpl/sm24
                     if list_type == "sdta":
-                        # Parse the nested LIST to find smpl and sm24 chunks
-                        sdta_start = self._file_handle.tell()  # Already after LIST type
+                        # Walk nested chunk headers with positional reads; only
+                        # their 8-byte headers are needed, so the handle is not
+                        # seeked back and forth per subchunk.
+                        sdta_start = file_pos + 12  # After LIST header and type
                         list_data_size = actual_chunk_size  # Already excludes list type
 
-                        # Parse nested chunks within LIST sdta
                         nested_pos = 0
                         while nested_pos < list_data_size - 8:
-                            self._file_handle.seek(sdta_start + nested_pos)
-                            nested_header = self._file_handle.read(8)
+                            nested_header = self._read_at(sdta_start + nested_pos, 8)
                             if len(nested_header) < 8:
                                 break
-                            nested_id, nested_size = struct.unpack("<4sI", nested_header)
+                            nested_id, nested_size = _CHUNK_HEADER.unpack(nested_header)
                             nested_id_str = nested_id.decode("ascii", errors="ignore")
 
-                            if nested_id_str in ["smpl", "sm24"]:
+                            if nested_id_str in ("smpl", "sm24"):
                                 # Found sample data chunk - store its location
-                                chunk_start = sdta_start + nested_pos + 8
                                 self.sample_data_chunks[nested_id_str] = (
-                                    chunk_start - 8,
+                                    sdta_start + nested_pos,
                                     nested_size + 8,
                                 )
-                                # Skip past this chunk's data
-                                self._file_handle.seek(nested_size, 1)
-                                if nested_size % 2 == 1:
-                                    self._file_handle.seek(1, 1)
 
-                            nested_pos += 8 + nested_size
-                            if nested_size % 2 == 1:  # Pad to word boundary
-                                nested_pos += 1
+                            nested_pos += 8 + nested_size + (nested_size & 1)
 
-                    # After nested parsing, file position should be at next chunk
+                    # Single seek to the next top-level chunk
+                    self._file_handle.seek(file_pos + chunk_size + 8)
 
                 file_pos += chunk_size + 8  # Skip entire LIST chunk
 
@@ -424,7 +505,9 @@ class SF2FileLoader:
 
         return chunk_id in metadata_chunks or chunk_id in metadata_lists
 
-    def _parse_list_subchunks(self, list_type: str, list_data: bytes, base_offset: int) -> None:
+    def _parse_list_subchunks(
+        self, list_type: str, list_data: bytes | bytearray, base_offset: int
+    ) -> None:
         """
         Parse subchunks within a LIST chunk.
 
@@ -443,8 +526,7 @@ class SF2FileLoader:
             if data_pos + 8 > len(list_data):
                 break
 
-            subchunk_header = list_data[data_pos : data_pos + 8]
-            subchunk_id, subchunk_size = struct.unpack("<4sI", subchunk_header)
+            subchunk_id, subchunk_size = _CHUNK_HEADER.unpack_from(list_data, data_pos)
             subchunk_id_str = subchunk_id.decode("ascii", errors="ignore")
 
             data_pos += 8
@@ -461,23 +543,73 @@ class SF2FileLoader:
 
             data_pos += subchunk_size
 
-    def _read_chunk_data(self, size: int) -> bytes:
+    def _map_file(self) -> mmap.mmap | None:
+        """
+        Memory-map the open SF2 file read-only.
+
+        Sample data is then paged in by the OS on access instead of being
+        fetched with a seek + read system call pair per request.
+
+        Returns:
+            Read-only mapping, or None if the file cannot be mapped
+        """
+        try:
+            return mmap.mmap(self._file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            # Empty files and some special filesystems cannot be mapped
+            logger.debug("Falling back to file reads for %s: %s", self.filepath, e)
+            return None
+
+    def _read_at(self, offset: int, size: int) -> bytes:
+        """
+        Read bytes at an absolute file offset.
+
+        Slices the memory map when the file is mapped. Otherwise uses os.pread
+        where available so the shared handle's position is left untouched, and
+        falls back to seek + read. Only that last fallback moves the shared
+        file position, so it is the only path that takes the file lock.
+
+        Args:
+            offset: Absolute file offset
+            size: Number of bytes to read
+
+        Returns:
+            Bytes read (shorter than size at end of file)
+        """
+        mapping = self._mmap
+        if mapping is not None:
+            return mapping[offset : offset + size]
+
+        file_handle = self._file_handle
+        if file_handle is None:
+            return b""
+
+        if _HAS_PREAD:
+            return os.pread(file_handle.fileno(), size, offset)
+
+        with self._file_lock:
+            file_handle.seek(offset)
+            return file_handle.read(size)
+
+    def _read_chunk_data(self, size: int) -> bytearray:
         """
         Read chunk data from file.
 
+        The data is read straight into a preallocated buffer, so multi-MB
+        pdta chunks are not copied again and short reads stay zero-padded.
+
         Args:
             size: Size of data to read
 
         Returns:
-            Raw chunk data bytes
+            Raw chunk data buffer
         """
         if self._file_handle is None:
-            return b""
+            return bytearray()
 
-        data = self._file_handle.read(size)
-        # Pad if necessary (some chunks may be padded to even boundaries)
-        if len(data) < size:
-            data += b"\x00" * (size - len(data))
+        # Zero-initialised, so a truncated chunk is padded without a re-copy
+        data = bytearray(size)
+        self._file_handle.readinto(data)
         return data
 
     def _load_info_metadata(self) -> None:
@@ -535,29 +667,26 @@ class SF2FileLoader:
         if not phdr_chunk:
             return []
 
-        presets = []
         data = phdr_chunk.data
 
-        # Each preset header is 38 bytes
-        for i in range(0, len(data), 38):
-            if i + 38 > len(data):
-                break
+        # Each preset header is 38 bytes; the record count is known upfront,
+        # so the result list is sized once instead of grown per append
+        num_presets = len(data) // 38
+        presets: list[dict[str, Any]] = [None] * num_presets  # type: ignore[list-item]
 
-            # Parse preset header
-            header_data = data[i : i + 38]
-            preset_name = header_data[:20].decode("ascii", errors="ignore").rstrip("\x00")
-            preset_num, bank_num, bag_ndx = struct.unpack("<HHH", header_data[20:26])
+        for i in range(num_presets):
+            offset = i * 38
+            preset_name = data[offset : offset + 20].decode("ascii", errors="ignore").rstrip("\x00")
+            preset_num, bank_num, bag_ndx = _PHDR_FIELDS.unpack_from(data, offset + 20)
 
             # Skip library, genre, morphology for now
-            presets.append(
-                {
-                    "name": preset_name,
-                    "program": preset_num,
-                    "bank": bank_num,
-                    "bag_index": bag_ndx,
-                    "header_index": i // 38,  # Store index for selective access
-                }
-            )
+            presets[i] = {
+                "name": preset_name,
+                "program": preset_num,
+                "bank": bank_num,
+                "bag_index": bag_ndx,
+                "header_index": i,  # Store index for selective access
+            }
 
         return presets
 
@@ -567,6 +696,7 @@ class SF2FileLoader:
 
         This method only parses the preset header that matches the requested
         bank/program, avoiding parsing of all preset headers for large soundfonts.
+        Lookups go through a (bank, program) index built on the first call.
 
         Args:
             bank: MIDI bank number
@@ -579,34 +709,37 @@ class SF2FileLoader:
         if not phdr_chunk:
             return None
 
-        data = phdr_chunk.data
-        num_presets = len(data) // 38
+        preset_index = self._preset_index
+        if preset_index is None:
+            preset_index = self._build_preset_index(phdr_chunk.data)
 
-        # Search for matching preset
-        for i in range(num_presets):
-            offset = i * 38
-            if offset + 26 > len(data):  # Need at least up to bag_ndx
-                break
+        index = preset_index.get((bank, program))
+        if index is None:
+            return None
+        return self.parse_preset_header_at_index(index)
+
+    def _build_preset_index(self, data: bytes) -> dict[tuple[int, int], int]:
+        """
+        Build the (bank, program) -> phdr record index map.
 
-            # Parse just the bank/program part (offsets 20-25)
-            header_data = data[offset + 20 : offset + 26]
-            preset_num, bank_num = struct.unpack("<HH", header_data[:4])
+        The first header wins when a file defines the same bank/program twice,
+        matching the order of a front-to-back scan.
 
-            if preset_num == program and bank_num == bank:
-                # Found match - parse the full header
-                full_header = data[offset : offset + 38]
-                preset_name = full_header[:20].decode("ascii", errors="ignore").rstrip("\x00")
-                bag_ndx = struct.unpack("<H", full_header[24:26])[0]
+        Args:
+            data: Raw phdr chunk data
 
-                return {
-                    "name": preset_name,
-                    "program": preset_num,
-                    "bank": bank_num,
-                    "bag_index": bag_ndx,
-                    "header_index": i,
-                }
+        Returns:
+            Mapping of (bank, program) to preset header index
+        """
+        count = len(data) // _PHDR_DTYPE.itemsize
+        records = np.frombuffer(data, dtype=_PHDR_DTYPE, count=count)
+        keys = zip(records["bank"].tolist(), records["program"].tolist(), strict=True)
 
-        return None
+        # Inserting back to front lets the first header overwrite later duplicates
+        preset_index = dict(zip(reversed(list(keys)), range(count - 1, -1, -1), strict=True))
+
+        self._preset_index = preset_index
+        return preset_index
 
     def parse_preset_header_at_index(self, index: int) -> dict[str, Any] | None:
         """
@@ -629,7 +762,7 @@ class SF2FileLoader:
         # Parse specific header
         header_data = phdr_chunk.data[offset : offset + 38]
         preset_name = header_data[:20].decode("ascii", errors="ignore").rstrip("\x00")
-        preset_num, bank_num, bag_ndx = struct.unpack("<HHH", header_data[20:26])
+        preset_num, bank_num, bag_ndx = _PHDR_FIELDS.unpack_from(header_data, 20)
 
         return {
             "name": preset_name,
@@ -653,26 +786,22 @@ class SF2FileLoader:
         if not inst_chunk:
             return []
 
-        instruments = []
         data = inst_chunk.data
 
-        # Each instrument header is 22 bytes
-        for i in range(0, len(data), 22):
-            if i + 22 > len(data):
-                break
+        # Each instrument header is 22 bytes; size the result list once
+        num_instruments = len(data) // 22
+        instruments: list[dict[str, Any]] = [None] * num_instruments  # type: ignore[list-item]
 
-            # Parse instrument header
-            header_data = data[i : i + 22]
-            inst_name = header_data[:20].decode("ascii", errors="ignore").rstrip("\x00")
-            bag_ndx = struct.unpack("<H", header_data[20:22])[0]
-
-            instruments.append(
-                {
-                    "name": inst_name,
-                    "bag_index": bag_ndx,
-                    "header_index": i // 22,  # Store index for selective access
-                }
-            )
+        for i in range(num_instruments):
+            offset = i * 22
+            inst_name = data[offset : offset + 20].decode("ascii", errors="ignore").rstrip("\x00")
+            bag_ndx = _INST_BAG_INDEX.unpack_from(data, offset + 20)[0]
+
+            instruments[i] = {
+                "name": inst_name,
+                "bag_index": bag_ndx,
+                "header_index": i,  # Store index for selective access
+            }
 
         return instruments
 
@@ -697,7 +826,7 @@ class SF2FileLoader:
         # Parse specific header
         header_data = inst_chunk.data[offset : offset + 22]
         inst_name = header_data[:20].decode("ascii", errors="ignore").rstrip("\x00")
-        bag_ndx = struct.unpack("<H", header_data[20:22])[0]
+        bag_ndx = _INST_BAG_INDEX.unpack_from(header_data, 20)[0]
 
         return {"name": inst_name, "bag_index": bag_ndx, "header_index": index}
 
@@ -715,54 +844,13 @@ class SF2FileLoader:
         if not shdr_chunk:
             return []
 
-        samples = []
         data = shdr_chunk.data
+        records = np.frombuffer(data, dtype=_SHDR_DTYPE, count=len(data) // _SHDR_SIZE)
 
-        # Each sample header is 46 bytes
-        for i in range(0, len(data), 46):
-            if i + 46 > len(data):
-                break
-
-            # Parse sample header
-            header_data = data[i : i + 46]
-            sample_name = header_data[:20].decode("ascii", errors="ignore").rstrip("\x00")
-
-            (
-                start,
-                end,
-                start_loop,
-                end_loop,
-                sample_rate,
-                orig_pitch,
-                pitch_corr,
-                sample_link,
-                sample_type,
-            ) = struct.unpack("<IIIIIbbHH", header_data[20:46])
-
-            # SF2 spec stores loop points as absolute sample positions.
-            # Convert to sample-relative offsets (matching sf2utils convention
-            # and what downstream load_sample() expects, since sample data is
-            # loaded as a window from start..end with 0-based indexing).
-            rel_start_loop = max(0, start_loop - start)
-            rel_end_loop = max(0, end_loop - start)
-
-            samples.append(
-                {
-                    "name": sample_name,
-                    "start": start,
-                    "end": end,
-                    "start_loop": rel_start_loop,
-                    "end_loop": rel_end_loop,
-                    "sample_rate": sample_rate,
-                    "original_pitch": orig_pitch,
-                    "pitch_correction": pitch_corr,
-                    "sample_link": sample_link,
-                    "sample_type": sample_type,
-                    "header_index": i // 46,  # Store index for selective access
-                }
-            )
-
-        return samples
+        return [
+            self._sample_header_to_dict(record, index)
+            for index, record in enumerate(records.tolist())
+        ]
 
     def parse_sample_header_at_index(self, index: int) -> dict[str, Any] | None:
         """
@@ -778,15 +866,56 @@ class SF2FileLoader:
         if not shdr_chunk:
             return None
 
-        offset = index * 46
-        if offset + 46 > len(shdr_chunk.data):
+        offset = index * _SHDR_SIZE
+        if index < 0 or offset + _SHDR_SIZE > len(shdr_chunk.data):
             return None
 
-        # Parse specific header
-        header_data = shdr_chunk.data[offset : offset + 46]
-        sample_name = header_data[:20].decode("ascii", errors="ignore").rstrip("\x00")
+        record = np.frombuffer(shdr_chunk.data, dtype=_SHDR_DTYPE, count=1, offset=offset)
+        return self._sample_header_to_dict(record.tolist()[0], index)
+
+    def parse_sample_headers_at_indices(self, indices: Iterable[int]) -> dict[int, dict[str, Any]]:
+        """
+        Parse several sample headers by index in one pass.
+
+        The requested shdr records are gathered with a single structured-array
+        view and converted together, instead of one view per header.
+
+        Args:
+            indices: Sample header indices (0-based); invalid ones are skipped
+
+        Returns:
+            Mapping of index to sample header dictionary
+        """
+        shdr_chunk = self.get_chunk("shdr", "pdta")
+        if not shdr_chunk:
+            return {}
+
+        data = shdr_chunk.data
+        count = len(data) // _SHDR_SIZE
+        valid = [index for index in dict.fromkeys(indices) if 0 <= index < count]
+        if not valid:
+            return {}
+
+        records = np.frombuffer(data, dtype=_SHDR_DTYPE, count=count)[valid]
+        return {
+            index: self._sample_header_to_dict(record, index)
+            for index, record in zip(valid, records.tolist(), strict=True)
+        }
+
+    @staticmethod
+    def _sample_header_to_dict(record: tuple, index: int) -> dict[str, Any]:
+        """
+        Convert a decoded shdr record into a sample header dictionary.
+
+        Args:
+            record: Field tuple in _SHDR_DTYPE order
+            index: Sample header index (0-based)
 
+        Returns:
+            Sample header dictionary
+        """
         (
+            name,
             start,
             end,
             start_loop,
@@ -796,15 +925,17 @@ class SF2FileLoader:
             pitch_corr,
             sample_link,
             sample_type,
-        ) = struct.unpack("<IIIIIbbHH", header_data[20:46])
+        ) = record
 
-        # Convert absolute loop points to sample-relative offsets
-        # (see parse_sample_headers for rationale).
+        # SF2 spec stores loop points as absolute sample positions.
+        # Convert to sample-relative offsets (matching sf2utils convention
+        # and what downstream load_sample() expects, since sample data is
+        # loaded as a window from start..end with 0-based indexing).
         rel_start_loop = max(0, start_loop - start)
         rel_end_loop = max(0, end_loop - start)
 
         return {
-            "name": sample_name,
+            "name": name.decode("ascii", errors="ignore").rstrip("\x00"),
             "start": start,
             "end": end,
             "start_loop": rel_start_loop,
@@ -814,15 +945,17 @@ class SF2FileLoader:
             "pitch_correction": pitch_corr,
             "sample_link": sample_link,
             "sample_type": sample_type,
-            "header_index": index,
+            "header_index": index,  # Store index for selective access
         }
 
     def get_sample_data(
         self, sample_start: int, sample_end: int, is_24bit: bool = False
-    ) -> bytes | None:
+    ) -> bytes | memoryview | None:
         """
         Get raw sample data from smpl and sm24 chunks with proper 24-bit reconstruction.
         Reads data directly from file on-demand to avoid loading large sample data into memory.
+        When the file is memory-mapped, 16-bit data is returned as a zero-copy view.
+        Reads are positional, so concurrent voices do not serialize on the file lock.
 
         Args:
             sample_start: Sample start index
@@ -830,29 +963,33 @@ class SF2FileLoader:
             is_24bit: Whether sample is 24-bit (requires sm24 + smpl combination)
 
         Returns:
-            Raw sample data bytes or None
+            Raw sample data bytes (or a read-only view of the mapping) or None
         """
         if self._file_handle is None or not self._is_loaded:
             return None
 
-        with self._file_lock:
-            if is_24bit:
-                # For 24-bit samples, combine data from both smpl and sm24 chunks
-                return self._read_24bit_sample_data_from_file(sample_start, sample_end)
-            else:
-                # 16-bit samples
-                return self._read_16bit_sample_data_from_file(sample_start, sample_end)
+        if is_24bit:
+            # For 24-bit samples, combine data from both smpl and sm24 chunks
+            return self._read_24bit_sample_data_from_file(sample_start, sample_end)
+        else:
+            # 16-bit samples
+            return self._read_16bit_sample_data_from_file(sample_start, sample_end)
 
-    def _read_16bit_sample_data_from_file(self, sample_start: int, sample_end: int) -> bytes | None:
+    def _read_16bit_sample_data_from_file(
+        self, sample_start: int, sample_end: int
+    ) -> bytes | memoryview | None:
         """
         Read 16-bit sample data directly from file.
 
+        With a memory-mapped file the smpl range is returned as a memoryview
+        over the mapping, so no bytes are copied until the caller decodes them.
+
         Args:
             sample_start: Sample start index
             sample_end: Sample end index
 
         Returns:
-            Raw 16-bit sample data bytes
+            Raw 16-bit sample data bytes or view
         """
         if "smpl" not in self.sample_data_chunks:
             return None
@@ -875,17 +1012,20 @@ class SF2FileLoader:
         if data_size <= 0:
             return b""
 
+        mapping = self._mmap
+        if mapping is not None:
+            return memoryview(mapping)[sample_data_start:sample_data_end]
+
         # Read data directly from file
-        self._file_handle.seek(sample_data_start)
-        return self._file_handle.read(data_size)
+        return self._read_at(sample_data_start, data_size)
 
     def _read_24bit_sample_data_from_file(self, sample_start: int, sample_end: int) -> bytes | None:
         """
         Read and combine 24-bit sample data from both smpl and sm24 chunks directly from file.
 
         According to SF2 specification:
-        - smpl chunk contains 16-bit samples (LSB)
-        - sm24 chunk contains MSB of 24-bit samples
+        - smpl chunk contains the upper 16 bits of each sample
+        - sm24 chunk contains the lower 8 bits of each sample
 
         Args:
             sample_start: Sample start index
@@ -905,71 +1045,51 @@ class SF2FileLoader:
         if num_samples <= 0:
             return b""
 
-        # Each 24-bit sample needs: 2 bytes from smpl + 1 byte from sm24 = 3 bytes total
-        combined_data = bytearray(num_samples * 3)
+        # smpl holds the upper 16 bits and sm24 the lower 8 bits of each sample;
+        # both offsets skip the 8-byte chunk header
+        smpl_data_start = smpl_offset + 8 + (sample_start * 2)
+        smpl_data_size = num_samples * 2
+        sm24_data_start = sm24_offset + 8 + sample_start
+        sm24_data_size = num_samples
 
+        # Only the I/O is guarded; a failure in the packing below is a bug
         try:
-            # Read smpl data (16-bit samples - LSB)
-            smpl_data_start = smpl_offset + 8 + (sample_start * 2)  # Skip header + offset to sample
-            smpl_data_size = num_samples * 2
-
-            self._file_handle.seek(smpl_data_start)
-            smpl_bytes = self._file_handle.read(smpl_data_size)
-
-            if len(smpl_bytes) < smpl_data_size:
-                return None
+            smpl_bytes = self._read_at(smpl_data_start, smpl_data_size)
+            sm24_bytes = self._read_at(sm24_data_start, sm24_data_size)
+        except (OSError, ValueError) as e:
+            key = (sample_start, sample_end)
+            if key not in self._failed_sample_reads:
+                self._failed_sample_reads.add(key)
+                logger.error("Error reading 24-bit sample data from file: %s", e)
+            return None
 
-            # Read sm24 data (MSB of 24-bit samples)
-            sm24_data_start = sm24_offset + 8 + sample_start  # Skip header + offset to sample
-            sm24_data_size = num_samples
+        if len(smpl_bytes) < smpl_data_size or len(sm24_bytes) < sm24_data_size:
+            return None
 
-            self._file_handle.seek(sm24_data_start)
-            sm24_bytes = self._file_handle.read(sm24_data_size)
+        return self._interleave_24bit(smpl_bytes, sm24_bytes)
 
-            if len(sm24_bytes) < sm24_data_size:
-                return None
+    @staticmethod
+    def _interleave_24bit(smpl_bytes: bytes, sm24_bytes: bytes) -> bytes:
+        """
+        Pack smpl words and sm24 bytes into little-endian 24-bit samples.
 
-            # Combine the data correctly: sm24_byte is MSB, smpl_word is LSB
-            for i in range(num_samples):
-                # Get 16-bit data from smpl (LSB of 24-bit sample)
-                lsb_word = int.from_bytes(
-                    smpl_bytes[i * 2 : i * 2 + 2], byteorder="little", signed=True
-                )
+        Per the SF2 specification the sm24 byte is the least significant byte
+        and the smpl word holds the upper 16 bits, so each packed sample is
+        simply ``sm24, smpl_lo, smpl_hi``.
 
-                # Get 8-bit MSB from sm24
-                msb_byte = sm24_bytes[i]
-
-                # Combine: shift MSB to upper 8 bits and combine with LSB.
-                # Then sign-extend the 24-bit result to 32-bit.
-                sample_24bit = (msb_byte << 16) | (lsb_word & 0xFFFF)
-                if sample_24bit & 0x800000:  # 24-bit sign bit set
-                    sample_24bit |= 0xFF000000  # Sign-extend to 32-bit
-
-                # Convert to 3-byte signed 24-bit representation
-                # We need to handle the sign correctly for 24-bit
-                if sample_24bit & 0x800000:  # If MSB of 24-bit is set, it's negative
-                    sample_24bit = (
-                        sample_24bit | 0xFF000000
-                    )  # Sign extend to 32-bit for proper conversion
-
-                # Convert to 3-byte signed representation
-                try:
-                    combined_bytes = sample_24bit.to_bytes(3, byteorder="little", signed=True)
-                    combined_data[i * 3 : (i + 1) * 3] = combined_bytes
-                except OverflowError:
-                    # Handle overflow by clamping to valid 24-bit range
-                    if sample_24bit > 0x7FFFFF:
-                        sample_24bit = 0x7FFFFF
-                    elif sample_24bit < -0x800000:
-                        sample_24bit = -0x800000
-                    combined_bytes = sample_24bit.to_bytes(3, byteorder="little", signed=True)
-                    combined_data[i * 3 : (i + 1) * 3] = combined_bytes
-
-            return bytes(combined_data)
+        Args:
+            smpl_bytes: 16-bit sample words (2 bytes per sample)
+            sm24_bytes: 8-bit extension bytes (1 byte per sample)
 
-        except Exception as e:
-            logger.error("Error reading 24-bit sample data from file: %s", e)
-            return None
+        Returns:
+            Packed 24-bit sample data (3 bytes per sample)
+        """
+        num_samples = min(len(smpl_bytes) // 2, len(sm24_bytes))
+        packed = np.empty((num_samples, 3), dtype=np.uint8)
+        packed[:, 0] = np.frombuffer(sm24_bytes, dtype=np.uint8, count=num_samples)
+        words = np.frombuffer(smpl_bytes, dtype=np.uint8, count=num_samples * 2)
+        packed[:, 1:] = words.reshape(-1, 2)
+        return packed.tobytes()
 
     def _combine_24bit_sample_data(
         self,
@@ -996,47 +1116,10 @@ class SF2FileLoader:
         if num_samples <= 0:
             return b""
 
-        # Each 24-bit sample needs: 2 bytes from smpl + 1 byte from sm24 = 3 bytes total
-        combined_data = bytearray(num_samples * 3)
-
         try:
-            for i in range(num_samples):
-                sample_idx = sample_start + i
-
-                # Get 16-bit data from smpl chunk (2 bytes per sample)
-                smpl_offset = sample_idx * 2
-                if smpl_offset + 2 > smpl_chunk.size:
-                    break
-
-                smpl_bytes = smpl_chunk.get_data_slice(smpl_offset, 2)
-                if len(smpl_bytes) < 2:
-                    break
-
-                # Get 8-bit extension from sm24 chunk (1 byte per sample)
-                sm24_offset = sample_idx * 1  # sm24 has 1 byte per sample
-                if sm24_offset + 1 > sm24_chunk.size:
-                    break
-
-                sm24_byte = sm24_chunk.get_data_slice(sm24_offset, 1)
-                if len(sm24_byte) < 1:
-                    break
-
-                # Reconstruct 24-bit sample: (sm24_byte << 16) | (smpl_word << 0)
-                smpl_word = int.from_bytes(smpl_bytes, byteorder="little", signed=True)
-                sm24_value = sm24_byte[0]
-
-                # Handle sign extension for 24-bit sample
-                if sm24_value & 0x80:  # If MSB is set, it's negative
-                    sm24_value |= 0xFFFFFF00  # Sign extend to 32-bit
-
-                # Combine: upper 8 bits from sm24, lower 16 bits from smpl
-                sample_24bit = (sm24_value << 16) | (smpl_word & 0xFFFF)
-
-                # Convert back to 3 bytes (24-bit)
-                combined_bytes = sample_24bit.to_bytes(3, byteorder="little", signed=True)
-                combined_data[i * 3 : (i + 1) * 3] = combined_bytes
-
-            return bytes(combined_data[: len(combined_data) // 3 * 3])  # Ensure complete samples
+            smpl_bytes = smpl_chunk.get_data_slice(sample_start * 2, num_samples * 2)
+            sm24_bytes = sm24_chunk.get_data_slice(sample_start, num_samples)
+            return self._interleave_24bit(smpl_bytes, sm24_bytes)
 
         except Exception as e:
             logger.error("Error combining 24-bit sample data: %s", e)
@@ -1060,18 +1143,8 @@ class SF2FileLoader:
         if not bag_chunk:
             return []
 
-        bags = []
-        data = bag_chunk.data
-
         # Each bag is 4 bytes: gen_ndx (2), mod_ndx (2)
-        for i in range(0, len(data), 4):
-            if i + 4 > len(data):
-                break
-
-            gen_ndx, mod_ndx = struct.unpack("<HH", data[i : i + 4])
-            bags.append((gen_ndx, mod_ndx))
-
-        return bags
+        return _unpack_records(_BAG_RECORD, bag_chunk.data)
 
     def get_bag_data_in_range(
         self, level_type: str, start_bag: int, end_bag: int
@@ -1095,25 +1168,8 @@ class SF2FileLoader:
         if not bag_chunk:
             return []
 
-        bags = []
-        data = bag_chunk.data
-
-        # Calculate byte range for the requested bags
-        start_offset = start_bag * 4  # 4 bytes per bag
-        end_offset = min(end_bag * 4, len(data))
-
-        if start_offset >= len(data):
-            return []
-
         # Parse only the requested range
-        for offset in range(start_offset, end_offset, 4):
-            if offset + 4 > len(data):
-                break
-
-            gen_ndx, mod_ndx = struct.unpack("<HH", data[offset : offset + 4])
-            bags.append((gen_ndx, mod_ndx))
-
-        return bags
+        return _unpack_records(_BAG_RECORD, bag_chunk.data, start_bag, end_bag)
 
     def get_generator_data_in_range(
         self, level_type: str, start_gen: int, end_gen: int
@@ -1134,25 +1190,8 @@ class SF2FileLoader:
         if not gen_chunk:
             return []
 
-        generators = []
-        data = gen_chunk.data
-
-        # Calculate byte range for the requested generators
-        start_offset = start_gen * 4  # 4 bytes per generator
-        end_offset = min(end_gen * 4, len(data))
-
-        if start_offset >= len(data):
-            return []
-
         # Parse only the requested range
-        for offset in range(start_offset, end_offset, 4):
-            if offset + 4 > len(data):
-                break
-
-            gen_type, gen_amount = struct.unpack("<Hh", data[offset : offset + 4])
-            generators.append((gen_type, gen_amount))
-
-        return generators
+        return _unpack_records(_GEN_RECORD, gen_chunk.data, start_gen, end_gen)
 
     def get_modulator_data_in_range(
         self, level_type: str, start_mod: int, end_mod: int
@@ -1173,37 +1212,19 @@ class SF2FileLoader:
         if not mod_chunk:
             return []
 
-        modulators = []
-        data = mod_chunk.data
-
-        # Calculate byte range for the requested modulators
-        start_offset = start_mod * 10  # 10 bytes per modulator
-        end_offset = min(end_mod * 10, len(data))
-
-        if start_offset >= len(data):
-            return []
-
         # Parse only the requested range
-        for offset in range(start_offset, end_offset, 10):
-            if offset + 10 > len(data):
-                break
-
-            mod_data = data[offset : offset + 10]
-            src_oper, dest_oper, mod_amount, amt_src_oper, mod_trans_oper = struct.unpack(
-                "<HHhHH", mod_data
+        return [
+            {
+                "src_operator": src_oper,
+                "dest_operator": dest_oper,
+                "mod_amount": mod_amount,
+                "amt_src_operator": amt_src_oper,
+                "mod_trans_operator": mod_trans_oper,
+            }
+            for src_oper, dest_oper, mod_amount, amt_src_oper, mod_trans_oper in _unpack_records(
+                _MOD_RECORD, mod_chunk.data, start_mod, end_mod
             )
-
-            modulators.append(
-                {
-                    "src_operator": src_oper,
-                    "dest_operator": dest_oper,
-                    "mod_amount": mod_amount,
-                    "amt_src_operator": amt_src_oper,
-                    "mod_trans_operator": mod_trans_oper,
-                }
-            )
-
-        return modulators
+        ]
 
     def get_generator_data(self, level_type: str) -> list[tuple[int, int]]:
         """
@@ -1220,18 +1241,8 @@ class SF2FileLoader:
         if not gen_chunk:
             return []
 
-        generators = []
-        data = gen_chunk.data
-
         # Each generator is 4 bytes: gen_type (2), gen_amount (2, signed)
-        for i in range(0, len(data), 4):
-            if i + 4 > len(data):
-                break
-
-            gen_type, gen_amount = struct.unpack("<Hh", data[i : i + 4])
-            generators.append((gen_type, gen_amount))
-
-        return generators
+        return _unpack_records(_GEN_RECORD, gen_chunk.data)
 
     def get_modulator_data(self, level_type: str) -> list[dict[str, Any]]:
         """
@@ -1248,30 +1259,19 @@ class SF2FileLoader:
         if not mod_chunk:
             return []
 
-        modulators = []
-        data = mod_chunk.data
-
         # Each modulator is 10 bytes: src_oper(2), dest_oper(2), mod_amount(2), amt_src_oper(2), mod_trans_oper(2)
-        for i in range(0, len(data), 10):
-            if i + 10 > len(data):
-                break
-
-            mod_data = data[i : i + 10]
-            src_oper, dest_oper, mod_amount, amt_src_oper, mod_trans_oper = struct.unpack(
-                "<HHhHH", mod_data
+        return [
+            {
+                "src_operator": src_oper,
+                "dest_operator": dest_oper,
+                "mod_amount": mod_amount,
+                "amt_src_operator": amt_src_oper,
+                "mod_trans_operator": mod_trans_oper,
+            }
+            for src_oper, dest_oper, mod_amount, amt_src_oper, mod_trans_oper in _unpack_records(
+                _MOD_RECORD, mod_chunk.data
             )
-
-            modulators.append(
-                {
-                    "src_operator": src_oper,
-                    "dest_operator": dest_oper,
-                    "mod_amount": mod_amount,
-                    "amt_src_operator": amt_src_oper,
-                    "mod_trans_operator": mod_trans_oper,
-                }
-            )
-
-        return modulators
+        ]
 
     def is_loaded(self) -> bool:
         """
@@ -1329,9 +1329,21 @@ class SF2FileLoader:
     def clear_cache(self) -> None:
         """Clear all parsed data caches."""
         self.chunk_index.clear()
+        self._preset_index = None
 
     def close(self) -> None:
         """Close the file handle and release resources."""
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Sample views handed out by get_sample_data are still alive;
+                # the mapping is released once the last of them is dropped.
+                pass
+            except Exception as e:
+                logger.debug("Failed to close file mapping for %s: %s", self.filepath, e)
+            self._mmap = None
+
         if self._file_handle is not None:
             try:
                 self._file_handle.close()
@@ -1353,6 +1365,7 @@ class SF2FileLoader:
         self.close()
 
         self.chunk_index.clear()
+        self._preset_index = None
         self._is_loaded = False
 
     def __del__(self):
@@ -6,6 +6,105 @@ from .sf2_constants import (
     SF2_GENERATORS,
 )
 
+# Parallel generator range tables indexed directly by generator type, so
+# clamping a generator is two list indexes instead of a nested dict lookup.
+# Slots for undefined generator types hold None.
+_GEN_TABLE_SIZE = max(SF2_GENERATORS) + 1
+_GEN_RANGE_MIN: list[int | None] = [None] * _GEN_TABLE_SIZE
+_GEN_RANGE_MAX: list[int | None] = [None] * _GEN_TABLE_SIZE
+for _gen_type, _gen_info in SF2_GENERATORS.items():
+    _GEN_RANGE_MIN[_gen_type], _GEN_RANGE_MAX[_gen_type] = _gen_info["range"]
+del _gen_type, _gen_info
+
+# SF2 default generator values, copied into every new generator processor
+_GEN_DEFAULTS: dict[int, int] = {
+    gen_type: gen_info["default"] for gen_type, gen_info in SF2_GENERATORS.items()
+}
+
+# Modulator source inputs indexed by the 7-bit source index of src_operator.
+# Each entry is (controller_values key, default, center, divisor); None marks
+# sources that are not implemented and always read as 0.0.
+_SOURCE_INPUTS: list[tuple[int, int, int, float] | None] = [None] * 128
+# Note-on velocity, stored at controller_values[2] by convention
+_SOURCE_INPUTS[1] = (2, 100, 64, 64.0)
+# Note-on key number, stored at controller_values[3] by convention
+_SOURCE_INPUTS[2] = (3, 60, 64, 64.0)
+# Channel pressure, stored at controller_values[130] by RealtimeControllerManager
+_SOURCE_INPUTS[4] = (130, 0, 0, 127.0)
+# Pitch wheel, stored at controller_values[131], range -1.0 to 1.0
+_SOURCE_INPUTS[5] = (131, 0, 0, 1.0)
+# Standard MIDI CC: normalize 0-127 to -1.0 to 1.0 (center 0)
+for _src_index in range(7, 128):
+    _SOURCE_INPUTS[_src_index] = (_src_index, 64, 64, 64.0)
+del _src_index
+
+# Raw modulation -> generator units, by destination generator type.
+# Destinations not listed use level units (x1000).
+_MODULATION_UNIT_SCALES: dict[int, float] = {
+    # Pitch/filter modulation (cents): gen 5-11
+    **dict.fromkeys((5, 6, 7, 8, 10, 11), 1200.0),
+    # Time parameters (timecents): gen 21, 23, 25-30, 33-36, 38
+    **dict.fromkeys((21, 23, 25, 26, 27, 28, 30, 33, 34, 35, 36, 38), 1200.0),
+    # Sustain levels (level): gen 29, 37
+    **dict.fromkeys((29, 37), 1000.0),
+    # Volume/resonance (Q): gen 9, 13
+    **dict.fromkeys((9, 13), 960.0),
+    # LFO rates (cents): gen 22, 24
+    **dict.fromkeys((22, 24), 1200.0),
+    # Effects (level): gen 15-17
+    **dict.fromkeys((15, 16, 17), 1000.0),
+    # Tuning (semitones/cents): gen 51-52
+    **dict.fromkeys((51, 52), 100.0),
+    # Scale tuning (percent): gen 56
+    56: 100.0,
+}
+
+# Modern synth parameter modulation factors: (name, SF2 gen, depth)
+_MODULATION_FACTORS: tuple[tuple[str, int, float], ...] = (
+    # VOLUME ENVELOPE MODULATION (SF2 gen 33-38)
+    ("amp_delay", 33, 2.0),  # ±2x time
+    ("amp_attack", 34, 2.0),  # ±2x time
+    ("amp_hold", 35, 2.0),  # ±2x time
+    ("amp_decay", 36, 2.0),  # ±2x time
+    ("amp_sustain", 37, 0.5),  # ±50% level
+    ("amp_release", 38, 2.0),  # ±2x time
+    # MODULATION ENVELOPE MODULATION (SF2 gen 25-30, 7)
+    ("mod_env_delay", 25, 2.0),
+    ("mod_env_attack", 26, 2.0),
+    ("mod_env_hold", 27, 2.0),
+    ("mod_env_decay", 28, 2.0),
+    ("mod_env_sustain", 29, 0.5),
+    ("mod_env_release", 30, 2.0),
+    ("mod_env_to_pitch", 7, 12.0),  # ±12 semitones
+    # LFO MODULATION (SF2 gen 21-24, 5-6, 10, 13)
+    ("mod_lfo_delay", 21, 2.0),
+    ("mod_lfo_rate", 22, 2.0),
+    ("mod_lfo_to_volume", 13, 0.5),
+    ("mod_lfo_to_filter", 10, 2.0),
+    ("mod_lfo_to_pitch", 5, 2.0),
+    ("vib_lfo_delay", 23, 2.0),
+    ("vib_lfo_rate", 24, 2.0),
+    ("vib_lfo_to_pitch", 6, 2.0),
+    # FILTER MODULATION (SF2 gen 8-9)
+    ("filter_cutoff", 8, 2.0),  # ±2 octaves
+    ("filter_resonance", 9, 0.5),  # ±50%
+    # EFFECTS MODULATION (SF2 gen 15-17)
+    ("reverb_send", 16, 0.5),
+    ("chorus_send", 15, 0.5),
+    ("pan", 17, 0.5),
+    # PITCH & TUNING MODULATION (SF2 gen 51-52, 56)
+    ("coarse_tune", 51, 12.0),  # ±12 semitones
+    ("fine_tune", 52, 1.0),  # ±100 cents
+    ("scale_tuning", 56, 0.5),  # ±50%
+)
+
+# The same factors with each destination's unit scale resolved up front:
+# (name, SF2 gen, unit scale, depth)
+_SCALED_MODULATION_FACTORS: tuple[tuple[str, int, float, float], ...] = tuple(
+    (name, gen_type, _MODULATION_UNIT_SCALES.get(gen_type, 1000.0), depth)
+    for name, gen_type, depth in _MODULATION_FACTORS
+)
+
 
 class SF2GeneratorProcessor:
     """
@@ -17,11 +116,10 @@ class SF2GeneratorProcessor:
 
     def __init__(self):
         """Initialize generator processor."""
-        self.generator_values: dict[int, int] = {}
-
         # Initialize with SF2 defaults
-        for gen_type, gen_info in SF2_GENERATORS.items():
-            self.generator_values[gen_type] = gen_info["default"]
+        self.generator_values: dict[int, int] = _GEN_DEFAULTS.copy()
+        # Converted parameters, rebuilt after any generator change
+        self._synth_params: dict[str, Any] | None = None
 
     def set_generator(self, generator_type: int, value: int) -> None:
         """
@@ -31,12 +129,36 @@ class SF2GeneratorProcessor:
             generator_type: SF2 generator type (0-65)
             value: Generator value
         """
-        if generator_type in SF2_GENERATORS:
-            # Validate range
-            gen_info = SF2_GENERATORS[generator_type]
-            min_val, max_val = gen_info["range"]
-            self.generator_values[generator_type] = max(min_val, min(max_val, value))
-        else:
+        if 0 <= generator_type < _GEN_TABLE_SIZE:
+            min_val = _GEN_RANGE_MIN[generator_type]
+            if min_val is not None:
+                # Validate range
+                max_val = _GEN_RANGE_MAX[generator_type]
+                self.generator_values[generator_type] = max(min_val, min(max_val, value))
+                self._synth_params = None
+                return
+        raise ValueError(f"Unknown SF2 generator type: {generator_type}")
+
+    def set_generators(self, generators: dict[int, int]) -> None:
+        """
+        Set several generator values at once.
+
+        Equivalent to calling set_generator() for each item, with the range
+        tables bound locally for the whole batch.
+
+        Args:
+            generators: Generator values keyed by SF2 generator type
+        """
+        self._synth_params = None
+        values = self.generator_values
+        range_min = _GEN_RANGE_MIN
+        range_max = _GEN_RANGE_MAX
+        for generator_type, value in generators.items():
+            if 0 <= generator_type < _GEN_TABLE_SIZE:
+                min_val = range_min[generator_type]
+                if min_val is not None:
+                    values[generator_type] = max(min_val, min(range_max[generator_type], value))
+                    continue
             raise ValueError(f"Unknown SF2 generator type: {generator_type}")
 
     def get_generator(self, generator_type: int, default: int = 0) -> int:
@@ -57,9 +179,18 @@ class SF2GeneratorProcessor:
         Convert ALL SF2 generators to modern synth parameters.
         Uses standard SF2 gen numbers matching sf2utils reference.
 
+        The conversion runs once per set of generator values; later calls
+        return a fresh copy of the cached result.
+
         Returns:
             Dictionary of modern synth parameters
         """
+        if self._synth_params is None:
+            self._synth_params = self._convert_generators()
+        return self._synth_params.copy()
+
+    def _convert_generators(self) -> dict[str, Any]:
+        """Convert the current generator values to modern synth parameters."""
         params = {}
 
         # VOLUME ENVELOPE (SF2 gen 33-38)
@@ -205,33 +336,37 @@ class SF2ZoneEngine:
         self.zone_id = zone_id
         self.processor = SF2GeneratorProcessor()
 
+        # Overlay the layers first so each generator is range-checked once,
+        # with the highest-priority layer winning.
+        merged: dict[int, int] = {}
         # Layer 1: Preset global generators
-        for gen_type, gen_value in (preset_global_generators or {}).items():
-            self.processor.set_generator(gen_type, gen_value)
-
+        if preset_global_generators:
+            merged.update(preset_global_generators)
         # Layer 2: Preset local generators
-        for gen_type, gen_value in preset_generators.items():
-            self.processor.set_generator(gen_type, gen_value)
-
+        merged.update(preset_generators)
         # Layer 3: Instrument global generators
-        for gen_type, gen_value in (instrument_global_generators or {}).items():
-            self.processor.set_generator(gen_type, gen_value)
-
+        if instrument_global_generators:
+            merged.update(instrument_global_generators)
         # Layer 4: Instrument local generators (highest priority)
-        for gen_type, gen_value in instrument_generators.items():
-            self.processor.set_generator(gen_type, gen_value)
+        merged.update(instrument_generators)
+        self.processor.set_generators(merged)
 
         # Store modulators for runtime processing
         self.instrument_modulators = instrument_modulators
         self.preset_modulators = preset_modulators
 
-    def get_modulated_parameters(self, note: int, velocity: int) -> dict[str, Any]:
+    def get_modulated_parameters(
+        self, note: int, velocity: int, controllers: dict[int, float] | None = None
+    ) -> dict[str, Any]:
         """
         Get final synthesis parameters after modulation.
 
         Args:
             note: MIDI note number
             velocity: MIDI velocity
+            controllers: Optional controller values; zone modulators are
+                evaluated per block by the region, so they do not alter the
+                note-on parameters
 
         Returns:
             Dictionary of synthesis parameters
@@ -425,49 +560,22 @@ class SF2ModulationEngine:
         Returns:
             Source value (-1.0 to 1.0)
         """
-        # Extract source index from lower 7 bits
-        src_index = src_operator & 0x7F
-
-        if src_index == 0:
+        # Source index lives in the lower 7 bits
+        source = _SOURCE_INPUTS[src_operator & 0x7F]
+        if source is None:
             return 0.0
 
-        if src_index == 1:
-            # Note-on velocity — stored at controller_values[2] by convention
-            return (self.controller_values.get(2, 100) - 64) / 64.0
-
-        if src_index == 2:
-            # Note-on key number — stored at controller_values[3] by convention
-            return (self.controller_values.get(3, 60) - 64) / 64.0
-
-        if src_index == 3:
-            # Poly pressure (not yet implemented)
-            return 0.0
-
-        if src_index == 4:
-            # Channel pressure — stored at controller_values[130] by RealtimeControllerManager
-            return self.controller_values.get(130, 0) / 127.0
-
-        if src_index == 5:
-            # Pitch wheel — stored at controller_values[131], range -1.0 to 1.0
-            return self.controller_values.get(131, 0)
-
-        if src_index == 6:
-            # Pitch wheel sensitivity (not yet implemented)
-            return 0.0
-
-        if 7 <= src_index <= 127:
-            # Standard MIDI CC: normalize 0-127 to -1.0 to 1.0 (center 0)
-            raw_value = self.controller_values.get(src_index, 64)
-            return (raw_value - 64) / 64.0
-
-        # Unknown source index (shouldn't happen with valid SF2 data)
-        return 0.0
+        controller, default, center, divisor = source
+        return (self.controller_values.get(controller, default) - center) / divisor
 
     def _calculate_modulation_factors(self, note: int, velocity: int) -> dict[str, float]:
         """
         Calculate modulation factors for ALL modern synth parameters.
         Uses standard SF2 gen numbers matching sf2utils reference.
 
+        Modulators are summed per destination in a single pass, so only
+        destinations that actually have modulators are scaled.
+
         Args:
             note: MIDI note
             velocity: MIDI velocity
@@ -475,53 +583,43 @@ class SF2ModulationEngine:
         Returns:
             Dictionary of parameter modulation factors
         """
+        totals = self._sum_modulation_by_destination()
+        if not totals:
+            return {}
+
         factors = {}
+        for name, gen_type, scale, depth in _SCALED_MODULATION_FACTORS:
+            total = totals.get(gen_type)
+            if total is None:
+                continue
+            value = total * scale * depth
+            # Remove zero modulations for performance
+            if abs(value) > 1e-6:
+                factors[name] = value
+        return factors
+
+    def _sum_modulation_by_destination(self) -> dict[int, float]:
+        """
+        Sum the contribution of every modulator per destination generator.
 
-        # VOLUME ENVELOPE MODULATION (SF2 gen 33-38)
-        factors["amp_delay"] = self._get_modulation(33, note, velocity) * 2.0  # ±2x time
-        factors["amp_attack"] = self._get_modulation(34, note, velocity) * 2.0  # ±2x time
-        factors["amp_hold"] = self._get_modulation(35, note, velocity) * 2.0  # ±2x time
-        factors["amp_decay"] = self._get_modulation(36, note, velocity) * 2.0  # ±2x time
-        factors["amp_sustain"] = self._get_modulation(37, note, velocity) * 0.5  # ±50% level
-        factors["amp_release"] = self._get_modulation(38, note, velocity) * 2.0  # ±2x time
-
-        # MODULATION ENVELOPE MODULATION (SF2 gen 25-30, 7)
-        factors["mod_env_delay"] = self._get_modulation(25, note, velocity) * 2.0
-        factors["mod_env_attack"] = self._get_modulation(26, note, velocity) * 2.0
-        factors["mod_env_hold"] = self._get_modulation(27, note, velocity) * 2.0
-        factors["mod_env_decay"] = self._get_modulation(28, note, velocity) * 2.0
-        factors["mod_env_sustain"] = self._get_modulation(29, note, velocity) * 0.5
-        factors["mod_env_release"] = self._get_modulation(30, note, velocity) * 2.0
-        factors["mod_env_to_pitch"] = (
-            self._get_modulation(7, note, velocity) * 12.0
-        )  # ±12 semitones
-
-        # LFO MODULATION (SF2 gen 21-24, 5-6, 10, 13)
-        factors["mod_lfo_delay"] = self._get_modulation(21, note, velocity) * 2.0
-        factors["mod_lfo_rate"] = self._get_modulation(22, note, velocity) * 2.0
-        factors["mod_lfo_to_volume"] = self._get_modulation(13, note, velocity) * 0.5
-        factors["mod_lfo_to_filter"] = self._get_modulation(10, note, velocity) * 2.0
-        factors["mod_lfo_to_pitch"] = self._get_modulation(5, note, velocity) * 2.0
-        factors["vib_lfo_delay"] = self._get_modulation(23, note, velocity) * 2.0
-        factors["vib_lfo_rate"] = self._get_modulation(24, note, velocity) * 2.0
-        factors["vib_lfo_to_pitch"] = self._get_modulation(6, note, velocity) * 2.0
-
-        # FILTER MODULATION (SF2 gen 8-9)
-        factors["filter_cutoff"] = self._get_modulation(8, note, velocity) * 2.0  # ±2 octaves
-        factors["filter_resonance"] = self._get_modulation(9, note, velocity) * 0.5  # ±50%
-
-        # EFFECTS MODULATION (SF2 gen 15-17)
-        factors["reverb_send"] = self._get_modulation(16, note, velocity) * 0.5
-        factors["chorus_send"] = self._get_modulation(15, note, velocity) * 0.5
-        factors["pan"] = self._get_modulation(17, note, velocity) * 0.5
-
-        # PITCH & TUNING MODULATION (SF2 gen 51-52, 56)
-        factors["coarse_tune"] = self._get_modulation(51, note, velocity) * 12.0  # ±12 semitones
-        factors["fine_tune"] = self._get_modulation(52, note, velocity) * 1.0  # ±100 cents
-        factors["scale_tuning"] = self._get_modulation(56, note, velocity) * 0.5  # ±50%
-
-        # Remove zero modulations for performance
-        return {k: v for k, v in factors.items() if abs(v) > 1e-6}
+        Returns:
+            Mapping of destination generator type to total modulation
+        """
+        totals: dict[int, float] = {}
+        source_values: dict[int, float] = {}
+        for modulator in self.modulators:
+            dest = modulator.get("dest_operator")
+            src_op = modulator.get("src_operator", 0)
+            source_value = source_values.get(src_op)
+            if source_value is None:
+                source_value = source_values[src_op] = self._get_source_value(src_op)
+
+            amount = modulator.get("mod_amount", 0) / 32768.0  # Normalize SF2 16-bit
+            transformed_value = self._apply_transform(
+                source_value, modulator.get("mod_trans_operator", 0)
+            )
+            totals[dest] = totals.get(dest, 0.0) + transformed_value * amount
+        return totals
 
     def _get_modulation(self, gen_type: int, note: int, velocity: int) -> float:
         """
@@ -536,34 +634,7 @@ class SF2ModulationEngine:
             Scaled modulation amount
         """
         modulation = self.get_modulation_for_generator(gen_type, note, velocity)
-
-        # Apply appropriate scaling based on generator type (standard SF2 numbers)
-        # Pitch/filter modulation (cents): gen 5-11
-        if gen_type in [5, 6, 7, 8, 10, 11]:
-            return modulation * 1200.0  # Convert to cents
-        # Time parameters (timecents): gen 21, 23, 25-30, 33-36, 38
-        elif gen_type in [21, 23, 25, 26, 27, 28, 30, 33, 34, 35, 36, 38]:
-            return modulation * 1200.0  # Convert to timecents
-        # Sustain levels (level): gen 29, 37
-        elif gen_type in [29, 37]:
-            return modulation * 1000.0  # Convert to level units
-        # Volume/resonance (Q): gen 9, 13
-        elif gen_type in [9, 13]:
-            return modulation * 960.0  # Convert to appropriate units
-        # LFO rates (cents): gen 22, 24
-        elif gen_type in [22, 24]:
-            return modulation * 1200.0  # Convert to cents
-        # Effects (level): gen 15-17
-        elif gen_type in [15, 16, 17]:
-            return modulation * 1000.0  # Convert to level units
-        # Tuning (semitones/cents): gen 51-52
-        elif gen_type in [51, 52]:
-            return modulation * 100.0  # Convert to appropriate units
-        # Scale tuning (percent): gen 56
-        elif gen_type in [56]:
-            return modulation * 100.0  # Convert to percentage
-        else:
-            return modulation * 1000.0  # Default scaling
+        return modulation * _MODULATION_UNIT_SCALES.get(gen_type, 1000.0)
 
     def get_modulation_for_generator(self, gen_type: int, note: int, velocity: int) -> float:
         """
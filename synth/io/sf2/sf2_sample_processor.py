@@ -11,13 +11,35 @@ import logging
 
 
 import threading
+from collections import OrderedDict, deque
+from collections.abc import Hashable
 from typing import Any
 
 import numpy as np
 
+from .sf2_data_model import decode_16bit_pcm, decode_24bit_pcm
+
 logger = logging.getLogger(__name__)
 
 
+def _buffer_nbytes(data: np.ndarray) -> int:
+    """
+    Get the bytes actually held by a sample array.
+
+    Mono samples presented as (frames, 2) share one buffer between both
+    columns (zero column stride), so that buffer is only counted once.
+
+    Args:
+        data: Sample data
+
+    Returns:
+        Size of the underlying sample buffer in bytes
+    """
+    if data.ndim == 2 and data.strides[1] == 0:
+        return data.nbytes // data.shape[1]
+    return data.nbytes
+
+
 class MipMapLevel:
     """
     Single mip-map level for a sample.
@@ -41,7 +63,7 @@ class MipMapLevel:
         self.pitch_ratio = pitch_ratio
         self.loop_start: int | None = None
         self.loop_end: int | None = None
-        self.memory_usage = data.nbytes if hasattr(data, "nbytes") else len(data) * 8
+        self.memory_usage = _buffer_nbytes(data)
 
 
 class SampleMipMap:
@@ -118,7 +140,7 @@ class SampleMipMap:
         current_data = self.levels[0].data
         downsample_factor = 2**level
 
-        is_stereo = len(current_data.shape) > 1 and current_data.shape[1] == 2
+        is_stereo = current_data.ndim == 2 and current_data.shape[1] == 2
 
         if is_stereo:
             frames = current_data.shape[0]
@@ -126,7 +148,13 @@ class SampleMipMap:
                 return
 
             filtered_left = self._apply_anti_aliasing_filter(current_data[:, 0], downsample_factor)
-            filtered_right = self._apply_anti_aliasing_filter(current_data[:, 1], downsample_factor)
+            if current_data.strides[1] == 0:
+                # Mono sample viewed as stereo: both columns are one buffer
+                filtered_right = filtered_left
+            else:
+                filtered_right = self._apply_anti_aliasing_filter(
+                    current_data[:, 1], downsample_factor
+                )
 
             new_frames = frames // downsample_factor
             downsampled = np.zeros((new_frames, 2), dtype=current_data.dtype)
@@ -464,9 +492,76 @@ class StereoProcessor:
         return (left_data + right_data) * 0.5
 
 
+# Multipliers spreading one key hash over the frequency sketch rows
+_SKETCH_SEEDS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93)
+_HASH_MASK = (1 << 64) - 1
+
+# Share of the cache budget reserved for samples hit more than once
+_PROTECTED_FRACTION = 0.8
+
+# Cache requests remembered between two drains into the eviction state
+_TOUCH_RING_SIZE = 4096
+
+
+class _FrequencySketch:
+    """
+    Count-min sketch estimating how often cache keys are requested.
+
+    Counters saturate at 15 and are halved after a fixed number of
+    increments, so the estimate tracks recent popularity.
+    """
+
+    def __init__(self, width: int):
+        """
+        Initialize frequency sketch.
+
+        Args:
+            width: Counters per row (rounded up to a power of two)
+        """
+        bits = max(4, (width - 1).bit_length())
+        self._shift = 64 - bits
+        self._table = np.zeros((len(_SKETCH_SEEDS), 1 << bits), dtype=np.uint8)
+        self._sample_size = 10 << bits
+        self._additions = 0
+
+    def _indices(self, key: Hashable) -> list[int]:
+        """Get the counter index of a key in each row."""
+        h = hash(key) & _HASH_MASK
+        return [((h * seed) & _HASH_MASK) >> self._shift for seed in _SKETCH_SEEDS]
+
+    def increment(self, key: Hashable) -> None:
+        """Record one request for a key."""
+        for row, index in enumerate(self._indices(key)):
+            if self._table[row, index] < 15:
+                self._table[row, index] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._table >>= 1
+            self._additions //= 2
+
+    def frequency(self, key: Hashable) -> int:
+        """Estimate how often a key was requested."""
+        return int(min(self._table[row, index] for row, index in enumerate(self._indices(key))))
+
+    def clear(self) -> None:
+        """Forget all recorded requests."""
+        self._table.fill(0)
+        self._additions = 0
+
+
 class SF2SampleCache:
     """
-    LRU cache for processed samples with memory limits.
+    Segmented LRU cache for processed samples with memory limits.
+
+    New entries start in a probationary segment and move to a protected
+    segment on their next hit, so a burst of one-off loads cannot flush
+    samples that are played repeatedly. A frequency sketch decides whether
+    a new entry may displace a probationary one.
+
+    Lookups do not take the lock: they read the entry map directly and log
+    the key in a bounded ring. The ring is drained into the segments and the
+    frequency sketch under the lock whenever the cache is modified, so
+    recency is applied lazily and requests beyond the ring size are dropped.
 
     Caches processed sample data across multiple SF2 files.
     """
@@ -480,10 +575,20 @@ class SF2SampleCache:
         """
         self.max_memory = max_memory_mb * 1024 * 1024  # Convert to bytes
         self.current_memory = 0
-        self.cache: dict[str, tuple[np.ndarray, int]] = {}  # key -> (data, size)
+        # key -> (data, size), least recently used first
+        self.cache: OrderedDict[Hashable, tuple[np.ndarray, int]] = OrderedDict()
+        # Segment membership, least recently used first
+        self._probation: OrderedDict[Hashable, None] = OrderedDict()
+        self._protected: OrderedDict[Hashable, None] = OrderedDict()
+        self._protected_memory = 0
+        self._protected_limit = int(self.max_memory * _PROTECTED_FRACTION)
+        # Roughly one counter per 64 kB of budget
+        self._sketch = _FrequencySketch(self.max_memory >> 16)
+        # Keys requested since the last drain, appended without the lock
+        self._touches: deque[Hashable] = deque(maxlen=_TOUCH_RING_SIZE)
         self.lock = threading.RLock()
 
-    def get(self, key: str) -> np.ndarray | None:
+    def get(self, key: Hashable) -> np.ndarray | None:
         """
         Get sample from cache.
 
@@ -493,57 +598,139 @@ class SF2SampleCache:
         Returns:
             Sample data or None if not cached
         """
-        with self.lock:
-            if key in self.cache:
-                # Move to end (most recently used)
-                data, size = self.cache.pop(key)
-                self.cache[key] = (data, size)
-                return data
-            return None
+        self._touches.append(key)
+        entry = self.cache.get(key)
+        return None if entry is None else entry[0]
 
-    def put(self, key: str, data: np.ndarray) -> None:
+    def put(self, key: Hashable, data: np.ndarray) -> np.ndarray | None:
         """
         Put sample in cache.
 
+        The sample is not cached when it exceeds the whole budget or when
+        every entry it would displace is requested more often.
+
+        The cache keeps a read-only view of ``data`` rather than a copy, so
+        the caller must not modify the array after handing it over.
+
         Args:
             key: Cache key
             data: Sample data to cache
+
+        Returns:
+            The read-only view now shared by cache readers, or None if the
+            sample was not admitted
         """
         with self.lock:
-            size = data.nbytes
+            self._drain_touches()
+            size = _buffer_nbytes(data)
 
             # Remove if already exists
-            if key in self.cache:
-                _old_data, old_size = self.cache[key]
-                self.current_memory -= old_size
+            self._remove(key)
 
             # Check memory limits
-            self._ensure_memory_available(size)
+            if not self._ensure_memory_available(key, size):
+                return None
 
-            # Add to cache
-            self.cache[key] = (data.copy(), size)
+            # Add to cache; readers share one read-only view of the buffer
+            cached = data.view()
+            cached.flags.writeable = False
+            self.cache[key] = (cached, size)
+            self._probation[key] = None
             self.current_memory += size
+            return cached
+
+    def _drain_touches(self) -> None:
+        """Apply the requests logged by get() to the sketch and the segments."""
+        touches = self._touches
+        while touches:
+            key = touches.popleft()
+            self._sketch.increment(key)
+            entry = self.cache.get(key)
+            if entry is None:
+                continue
+            # Move to end (most recently used)
+            self.cache.move_to_end(key)
+            if key in self._protected:
+                self._protected.move_to_end(key)
+            else:
+                self._promote(key, entry[1])
+
+    def _promote(self, key: Hashable, size: int) -> None:
+        """Move a probationary entry to the protected segment."""
+        del self._probation[key]
+        self._protected[key] = None
+        self._protected_memory += size
+
+        # Demote the least recently used protected entries over the limit
+        while self._protected_memory > self._protected_limit and len(self._protected) > 1:
+            demoted, _ = self._protected.popitem(last=False)
+            self._protected_memory -= self.cache[demoted][1]
+            self._probation[demoted] = None
+
+    def _remove(self, key: Hashable) -> None:
+        """Drop an entry from the cache and its segment."""
+        entry = self.cache.pop(key, None)
+        if entry is None:
+            return
+        self.current_memory -= entry[1]
+        if key in self._protected:
+            del self._protected[key]
+            self._protected_memory -= entry[1]
+        else:
+            del self._probation[key]
+
+    def _ensure_memory_available(self, key: Hashable, needed_size: int) -> bool:
+        """Evict entries to fit a new one; False if it should not be admitted.
+
+        Victims are chosen and checked against the sketch before any of them
+        is removed, so a rejected newcomer leaves the cache untouched.
+        """
+        if needed_size > self.max_memory:
+            return False
+
+        excess = self.current_memory + needed_size - self.max_memory
+        if excess <= 0:
+            return True
+
+        # Probationary entries go first; protected ones only when none are left
+        frequency = self._sketch.frequency(key)
+        victims = []
+        for victim in self._probation:
+            if self._sketch.frequency(victim) > frequency:
+                return False
+            victims.append(victim)
+            excess -= self.cache[victim][1]
+            if excess <= 0:
+                break
+        else:
+            for victim in self._protected:
+                victims.append(victim)
+                excess -= self.cache[victim][1]
+                if excess <= 0:
+                    break
 
-    def _ensure_memory_available(self, needed_size: int) -> None:
-        """Ensure enough memory by evicting LRU items."""
-        while self.current_memory + needed_size > self.max_memory and self.cache:
-            # Evict least recently used
-            _evicted_key, (evicted_data, evicted_size) = self.cache.popitem(last=False)
-            self.current_memory -= evicted_size
-            # Explicitly delete the evicted data to free memory
-            del evicted_data
+        for victim in victims:
+            self._remove(victim)
+        return True
 
     def clear(self) -> None:
         """Clear all cached samples."""
         with self.lock:
+            self._touches.clear()
             self.cache.clear()
+            self._probation.clear()
+            self._protected.clear()
+            self._sketch.clear()
             self.current_memory = 0
+            self._protected_memory = 0
 
     def get_stats(self) -> dict[str, Any]:
         """Get cache statistics."""
         with self.lock:
+            self._drain_touches()
             return {
                 "cached_samples": len(self.cache),
+                "protected_samples": len(self._protected),
                 "memory_usage_bytes": self.current_memory,
                 "memory_usage_mb": self.current_memory / (1024 * 1024),
                 "max_memory_mb": self.max_memory / (1024 * 1024),
@@ -609,17 +796,16 @@ class SF2SampleProcessor:
             mip_level = 3
         else:
             mip_level = 4
-        cache_key = f"{sample_name}_{mip_level}_{interpolation}"
+        cache_key = (sample_name, mip_level, interpolation)
 
         # Check cache first
         cached_data = self.sample_cache.get(cache_key)
+        # Counters are statistics only and may drift under concurrent voices
         if cached_data is not None:
-            with self.sample_cache.lock:  # Thread-safe increment
-                self.cache_hits += 1
+            self.cache_hits += 1
             return cached_data
 
-        with self.sample_cache.lock:  # Thread-safe increment
-            self.cache_misses += 1
+        self.cache_misses += 1
 
         # Process sample data
         processed_data = self._process_sample_data(
@@ -627,8 +813,11 @@ class SF2SampleProcessor:
         )
 
         if processed_data is not None:
-            # Cache the result
-            self.sample_cache.put(cache_key, processed_data)
+            # Cache the result; once cached, hand out the shared read-only view
+            # so this caller cannot write into the buffer later hits return
+            cached_data = self.sample_cache.put(cache_key, processed_data)
+            if cached_data is not None:
+                return cached_data
 
         return processed_data
 
@@ -671,66 +860,26 @@ class SF2SampleProcessor:
         if len(data) == 0:
             return np.array([], dtype=np.float32)
 
-        samples = np.frombuffer(data, dtype=np.int16)
-
-        if is_stereo:
+        # Decoded straight into float32 by the kernel, with no int-to-float temporary
+        if is_stereo and len(data) % 4 == 0:
             # Reshape to (frames, 2) for stereo
-            if len(samples) % 2 == 0 and len(samples) >= 2:
-                return samples.reshape(-1, 2).astype(np.float32) / 32768.0
-            else:
-                # Handle odd length or insufficient data
-                return samples.astype(np.float32) / 32768.0
-        else:
-            return samples.astype(np.float32) / 32768.0
+            return decode_16bit_pcm(data, 2)
+        # Mono data, or stereo data with a partial frame, stays flat
+        return decode_16bit_pcm(data)[:, 0]
 
     def _convert_24bit_data(self, data: bytes, is_stereo: bool) -> np.ndarray:
         """Convert 24-bit sample data."""
         if len(data) == 0:
             return np.array([], dtype=np.float32)
 
-        samples = []
+        samples = decode_24bit_pcm(data)
 
         if is_stereo:
-            # Process 6 bytes per stereo frame
-            for i in range(0, len(data), 6):
-                if i + 6 > len(data):
-                    break
-
-                # Left channel (first 3 bytes)
-                left_bytes = data[i : i + 3]
-                left_int = int.from_bytes(left_bytes, byteorder="little", signed=True)
-                if left_int & 0x800000:
-                    left_int |= 0xFF000000
-                left_sample = left_int / 8388608.0
-
-                # Right channel (next 3 bytes)
-                right_bytes = data[i + 3 : i + 6]
-                right_int = int.from_bytes(right_bytes, byteorder="little", signed=True)
-                if right_int & 0x800000:
-                    right_int |= 0xFF000000
-                right_sample = right_int / 8388608.0
-
-                samples.extend([left_sample, right_sample])
-
-            # Only reshape if we have an even number of samples
-            if len(samples) % 2 == 0 and len(samples) >= 2:
-                return np.array(samples, dtype=np.float32).reshape(-1, 2)
-            else:
-                return np.array(samples, dtype=np.float32)
-        else:
-            # Process 3 bytes per mono sample
-            for i in range(0, len(data), 3):
-                if i + 3 > len(data):
-                    break
-
-                sample_bytes = data[i : i + 3]
-                sample_int = int.from_bytes(sample_bytes, byteorder="little", signed=True)
-                if sample_int & 0x800000:
-                    sample_int |= 0xFF000000
-                sample = sample_int / 8388608.0
-                samples.append(sample)
-
-            return np.array(samples, dtype=np.float32)
+            # 6 bytes per stereo frame; incomplete trailing frames are dropped
+            if len(samples) < 2:
+                return np.array([], dtype=np.float32)
+            return samples[: len(samples) // 2 * 2].reshape(-1, 2)
+        return samples
 
     def _apply_mip_mapping(
         self, sample_data: np.ndarray, sample_info: dict[str, Any], pitch_ratio: float
@@ -757,14 +906,14 @@ class SF2SampleProcessor:
                     # Ensure the returned data has the same shape and type as the original
                     if mip_data.shape != sample_data.shape:
                         # If shapes differ, we need to resample to match
-                        if len(sample_data.shape) == 1 and len(mip_data.shape) == 1:
+                        if sample_data.ndim == 1 and mip_data.ndim == 1:
                             # Both are mono, just adjust length
                             if len(mip_data) != len(sample_data):
                                 interpolator = Interpolator("linear")
                                 mip_data = interpolator.interpolate(
                                     mip_data, len(sample_data) / len(mip_data)
                                 )
-                        elif len(sample_data.shape) > 1 and len(mip_data.shape) > 1:
+                        elif sample_data.ndim > 1 and mip_data.ndim > 1:
                             # Both are stereo, adjust both channels
                             if mip_data.shape != sample_data.shape:
                                 interpolator = Interpolator("linear")
@@ -296,7 +296,10 @@ INDUSTRY COMPLIANCE:
 from __future__ import annotations
 
 import logging
+import os
 import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -340,6 +343,8 @@ class SF2SoundFont:
         self.presets: dict[tuple[int, int], SF2Preset] = {}
         self.instruments: dict[int, SF2Instrument] = {}
         self.samples: dict[int, SF2Sample] = {}
+        # (preset global, preset, instrument zone) -> merged zone engine
+        self._zone_engines: dict[tuple[SF2Zone | None, SF2Zone, SF2Zone], SF2ZoneEngine] = {}
 
         # Metadata
         self.name = ""
@@ -404,6 +409,7 @@ class SF2SoundFont:
             self.presets.clear()
             self.instruments.clear()
             self.samples.clear()
+            self._zone_engines.clear()
 
             self._is_loaded = False
 
@@ -438,11 +444,17 @@ class SF2SoundFont:
             if not preset:
                 return None
 
-            # Get matching zones from cache manager
-            matching_zones = self.zone_cache_manager.get_preset_zones(bank, program, note, velocity)
-            if not matching_zones:
+            # Only the first matching local zone is used, so stop scanning at
+            # the first hit instead of collecting every matching zone
+            preset_zone = preset.find_first_matching_zone(note, velocity)
+            if preset_zone is None:
                 return None
 
+            matching_zones = [preset_zone]
+            global_zone = preset.global_zone
+            if global_zone is not None and global_zone.matches_note_velocity(note, velocity):
+                matching_zones.insert(0, global_zone)
+
             # Process zones into synthesis parameters
             return self._process_zones_to_parameters(
                 matching_zones, note, velocity, controllers=controllers
@@ -731,8 +743,9 @@ class SF2SoundFont:
         mod_end: int,
     ) -> None:
         """Populate zone with modulators."""
-        for mod_idx in range(mod_start, min(mod_end, len(mod_data))):
-            zone.add_modulator(mod_data[mod_idx])
+        # Bag ranges never overlap, so each parsed dict belongs to one zone
+        if 0 <= mod_start < mod_end:
+            zone.add_modulators(mod_data[mod_start:mod_end])
 
     def _process_zones_to_parameters(
         self,
@@ -757,9 +770,9 @@ class SF2SoundFont:
 
         # Handle preset global zone: zones[0] may be the global zone
         primary_zone = zones[0]
-        preset_global_gens: dict[int, int] | None = None
+        preset_global_zone: SF2Zone | None = None
         if primary_zone.is_global:
-            preset_global_gens = primary_zone.generators
+            preset_global_zone = primary_zone
             if len(zones) > 1:
                 primary_zone = zones[1]
             else:
@@ -774,16 +787,12 @@ class SF2SoundFont:
         if not instrument:
             return {}
 
-        # Get instrument zones from cache manager
-        instrument_zones = self.zone_cache_manager.get_instrument_zones(
-            instrument_index, note, velocity
-        )
-        if not instrument_zones:
+        # Use the first matching local instrument zone; the global zone is
+        # merged separately below
+        instrument_zone = instrument.find_first_matching_zone(note, velocity)
+        if instrument_zone is None:
             return {}
 
-        # Use first instrument zone
-        instrument_zone = instrument_zones[0]
-
         # Get sample
         sample_id = instrument_zone.sample_id
         if sample_id < 0:
@@ -793,25 +802,35 @@ class SF2SoundFont:
         if not sample:
             return {}
 
-        # Collect instrument global generators for 4-layer merge
-        inst_global_gens: dict[int, int] | None = (
-            instrument.global_zone.generators if instrument.global_zone else None
-        )
+        # Zones are immutable once loaded, so the merged engine is built once
+        # per zone combination
+        engine_key = (preset_global_zone, primary_zone, instrument_zone)
+        zone_engine = self._zone_engines.get(engine_key)
+        if zone_engine is None:
+            # Collect global generators for 4-layer merge
+            preset_global_gens: dict[int, int] | None = (
+                preset_global_zone.generators if preset_global_zone else None
+            )
+            inst_global_gens: dict[int, int] | None = (
+                instrument.global_zone.generators if instrument.global_zone else None
+            )
 
-        # Create zone engine for modulation (4-layer merge:
-        # preset_global → preset_local → instrument_global → instrument_local)
-        zone_id = (
-            f"preset_{primary_zone.instrument_index}_inst_{instrument_index}_sample_{sample_id}"
-        )
-        zone_engine = self.modulation_engine.create_zone_engine(
-            zone_id,
-            instrument_zone.generators,
-            instrument_zone.modulators,
-            primary_zone.generators,
-            primary_zone.modulators,
-            preset_global_generators=preset_global_gens,
-            instrument_global_generators=inst_global_gens,
-        )
+            # Create zone engine for modulation (4-layer merge:
+            # preset_global → preset_local → instrument_global → instrument_local)
+            zone_id = (
+                f"preset_{primary_zone.instrument_index}_inst_{instrument_index}"
+                f"_sample_{sample_id}"
+            )
+            zone_engine = self.modulation_engine.create_zone_engine(
+                zone_id,
+                instrument_zone.generators,
+                instrument_zone.modulators,
+                primary_zone.generators,
+                primary_zone.modulators,
+                preset_global_generators=preset_global_gens,
+                instrument_global_generators=inst_global_gens,
+            )
+            self._zone_engines[engine_key] = zone_engine
 
         # Get modulated parameters (pass controllers for modulation matrix support)
         params = zone_engine.get_modulated_parameters(note, velocity, controllers=controllers)
@@ -823,7 +842,7 @@ class SF2SoundFont:
                 "sample_rate": sample.sample_rate,
                 "root_key": sample.original_pitch,
                 "loop_mode": sample.loop_mode,
-                "zone_id": zone_id,
+                "zone_id": zone_engine.zone_id,
             }
         )
 
@@ -990,44 +1009,155 @@ class SF2SoundFont:
     def _load_sample(self, sample_id: int) -> bool:
         """Load sample data on-demand with selective parsing and proper 24-bit support."""
         try:
-            from .sf2_data_model import SF2Sample
-
-            # Get sample header using selective parsing
-            header = self.file_loader.parse_sample_header_at_index(sample_id)
-            if not header:
+            sample = self._create_sample(sample_id)
+            if sample is None or not self._decode_sample(sample):
                 return False
 
-            # Detect if sample is 24-bit (SF2 specification section 7.10)
-            # Bit 15 of sample_type indicates 24-bit when set
-            sample_type = header["sample_type"]
-            is_24bit = bool(sample_type & 0x8000)  # Check bit 15
+            self._store_sample(sample_id, sample)
+            return True
 
-            # Create sample object
-            sample = SF2Sample(header)
-            sample.is_24bit = is_24bit  # Store 24-bit flag
+        except Exception:
+            return False
 
-            # Get sample data with proper 24-bit handling
-            sample_start = header["start"]
-            sample_end = header["end"]
-            raw_data = self.file_loader.get_sample_data(sample_start, sample_end, is_24bit)
+    def _create_sample(self, sample_id: int) -> SF2Sample | None:
+        """Create an undecoded sample from its header."""
+        # Get sample header using selective parsing
+        header = self.file_loader.parse_sample_header_at_index(sample_id)
+        if not header:
+            return None
+        return self._sample_from_header(header)
+
+    @staticmethod
+    def _sample_from_header(header: dict[str, Any]) -> SF2Sample:
+        """Create an undecoded sample from a parsed sample header."""
+        from .sf2_data_model import SF2Sample
+
+        # Detect if sample is 24-bit (SF2 specification section 7.10)
+        # Bit 15 of sample_type indicates 24-bit when set
+        sample_type = header["sample_type"]
+        is_24bit = bool(sample_type & 0x8000)  # Check bit 15
+
+        # Create sample object
+        sample = SF2Sample(header)
+        sample.is_24bit = is_24bit  # Store 24-bit flag
+        return sample
+
+    def _decode_sample(self, sample: SF2Sample) -> bool:
+        """Read and decode sample data; touches no shared caches."""
+        # Get sample data with proper 24-bit handling
+        raw_data = self.file_loader.get_sample_data(sample.start, sample.end, sample.is_24bit)
+        if not raw_data:
+            return False
+        return sample.load_data(raw_data)
 
-            if raw_data:
-                sample.load_data(raw_data)
+    def _store_sample(self, sample_id: int, sample: SF2Sample) -> None:
+        """Register a decoded sample with the mip-map processor and cache."""
+        # Preload into sample processor for mip-mapping
+        if self.sample_processor:
+            self.sample_processor.preload_sample(sample.name, sample.data, sample.sample_rate)
 
-                # Preload into sample processor for mip-mapping
-                if self.sample_processor:
-                    self.sample_processor.preload_sample(
-                        sample.name, sample.data, sample.sample_rate
-                    )
+        # Cache sample
+        self.samples[sample_id] = sample
 
-                # Cache sample
-                self.samples[sample_id] = sample
-                return True
-            else:
+    def preload_samples(self, sample_ids: list[int], max_workers: int | None = None) -> int:
+        """
+        Load several samples at once, decoding them in parallel.
+
+        Decoding runs in a thread pool (the numpy/numba conversion releases the
+        GIL); headers are parsed and caches are updated on the calling thread.
+
+        Args:
+            sample_ids: Sample IDs to load
+            max_workers: Worker thread count (defaults to the CPU count)
+
+        Returns:
+            Number of samples newly loaded
+        """
+        if not self._is_loaded or not self.file_loader:
+            return 0
+
+        # Re-preloading warm programs is the common case; the membership test
+        # needs no lock, so fully cached requests return without taking it
+        missing = [sample_id for sample_id in sample_ids if sample_id not in self.samples]
+        if not missing:
+            return 0
+
+        with self._lock:
+            # All needed headers are parsed in one batch rather than one call each
+            headers = self.file_loader.parse_sample_headers_at_indices(
+                [sample_id for sample_id in missing if sample_id not in self.samples]
+            )
+            pending = [
+                (sample_id, self._sample_from_header(header))
+                for sample_id, header in headers.items()
+            ]
+
+        if not pending:
+            return 0
+
+        def decode(sample: SF2Sample) -> bool:
+            # Preloading is best effort: an unreadable sample is left for the
+            # on-demand path, but anything other than an I/O failure is a bug
+            try:
+                return self._decode_sample(sample)
+            except (OSError, ValueError) as e:
+                logger.warning("Error preloading sample %s: %s", sample.name, e)
                 return False
 
-        except Exception:
-            return False
+        workers = min(len(pending), max_workers or os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            decoded = list(executor.map(decode, [sample for _, sample in pending]))
+
+        loaded = 0
+        with self._lock:
+            for (sample_id, sample), ok in zip(pending, decoded, strict=True):
+                if ok and sample_id not in self.samples:
+                    self._store_sample(sample_id, sample)
+                    loaded += 1
+        return loaded
+
+    def preload_programs(
+        self, programs: Iterable[tuple[int, int]], max_workers: int | None = None
+    ) -> int:
+        """
+        Load every sample used by several programs ahead of their first note.
+
+        Presets and instruments are resolved on the calling thread; the samples
+        they reference are then decoded in parallel by preload_samples().
+
+        Args:
+            programs: (bank, program) pairs to warm up
+            max_workers: Worker thread count (defaults to the CPU count)
+
+        Returns:
+            Number of samples newly loaded
+        """
+        if not self._is_loaded or not self.file_loader:
+            return 0
+
+        # Presets commonly layer or split the same instrument, and banks share
+        # instruments between programs, so each instrument is walked once
+        instrument_indices: dict[int, None] = {}
+        sample_ids: list[int] = []
+        with self._lock:
+            for bank, program in programs:
+                preset = self._get_or_load_preset(bank, program)
+                if preset is not None:
+                    instrument_indices.update(
+                        dict.fromkeys(
+                            zone.instrument_index
+                            for zone in preset.zones
+                            if zone.instrument_index >= 0
+                        )
+                    )
+            for instrument_index in instrument_indices:
+                instrument = self._get_or_load_instrument(instrument_index)
+                if instrument is not None:
+                    sample_ids.extend(
+                        zone.sample_id for zone in instrument.zones if zone.sample_id >= 0
+                    )
+
+        return self.preload_samples(sample_ids, max_workers=max_workers)
 
     def get_sample_data(self, sample_id: int) -> Any | None:
         """
@@ -9,8 +9,12 @@ Handles ordering, blacklisting, remapping, and orchestrates all SF2 components.
 from __future__ import annotations
 
 import logging
+import os
 import threading
 import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -18,6 +22,9 @@ import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Resolved program parameter sets kept per manager
+_PROGRAM_PARAMS_CACHE_SIZE = 1024
+
 
 class SF2SoundFontManager:
     """
@@ -45,6 +52,16 @@ class SF2SoundFontManager:
         self.file_remapping: dict[tuple[int, int], tuple[int, int]] = (
             {}
         )  # (bank, program) -> (new_bank, new_program)
+        # (bank, program) -> files defining it, in file_order; rebuilt lazily
+        self._program_files: dict[tuple[int, int], list[str]] | None = None
+        # Requested (bank, program) -> (resolved bank, resolved program, files)
+        self._program_routes: dict[tuple[int, int], tuple[int, int, list[str]]] = {}
+        # (bank, program, note, velocity) -> parameters, least recently used
+        # first; dropped together with the program routes. Controllers are not
+        # part of the key because they do not change note-on parameters.
+        self._program_params: OrderedDict[tuple, dict[str, Any] | None] = OrderedDict()
+        # Bumped whenever program lookups may resolve differently
+        self.state_version = 0
 
         # Core components
         self.sample_processor = None  # Will be initialized when first file is loaded
@@ -90,51 +107,132 @@ class SF2SoundFontManager:
                 if filepath in self.file_order:
                     self.file_order.remove(filepath)
                 self.file_order.append(filepath)
+                self._invalidate_program_index()
                 return True
 
-            # Enforce maximum loaded files limit
-            if len(self.loaded_files) >= self.max_loaded_files:
-                self._evict_least_recently_used()
+            soundfont, load_time = self._open_soundfont(filepath)
+            if soundfont is None:
+                return False
+            return self._register_soundfont(filepath, soundfont, priority, load_time)
+
+    def load_soundfonts(
+        self, filepaths: Iterable[str], priority: int = 0, max_workers: int | None = None
+    ) -> dict[str, bool]:
+        """
+        Load several SF2 soundfonts, parsing the files concurrently.
 
-            # Load the soundfont
-            start_time = time.time()
+        Files are opened and parsed in a thread pool outside the manager lock,
+        then registered one at a time in the given order, as if
+        load_soundfont() had been called for each.
 
-            try:
-                from .sf2_soundfont import SF2SoundFont
+        Args:
+            filepaths: Paths to SF2 files
+            priority: Loading priority applied to every file
+            max_workers: Worker thread count (defaults to one per file, up to the CPU count)
 
-                soundfont = SF2SoundFont(
-                    filepath, self.sample_processor, self.zone_cache_manager, self.modulation_engine
-                )
+        Returns:
+            Mapping of resolved file path to whether it loaded successfully
+        """
+        resolved = list(dict.fromkeys(str(Path(filepath).resolve()) for filepath in filepaths))
+        with self._lock:
+            pending = [filepath for filepath in resolved if filepath not in self.loaded_files]
+
+        opened: dict[str, tuple[SF2SoundFont | None, float]] = {}
+        if pending:
+            workers = max_workers or min(len(pending), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                opened = dict(zip(pending, pool.map(self._open_soundfont, pending), strict=True))
+
+        results: dict[str, bool] = {}
+        for filepath in resolved:
+            with self._lock:
+                soundfont, load_time = opened.get(filepath, (None, 0.0))
+                if filepath in self.loaded_files or filepath not in opened:
+                    # Already loaded, possibly by another caller meanwhile
+                    results[filepath] = self.load_soundfont(filepath, priority)
+                elif soundfont is None:
+                    results[filepath] = False
+                else:
+                    results[filepath] = self._register_soundfont(
+                        filepath, soundfont, priority, load_time
+                    )
+        return results
+
+    def _open_soundfont(self, filepath: str) -> tuple[SF2SoundFont | None, float]:
+        """
+        Create and parse a soundfont without registering it.
+
+        Touches no manager state, so it is safe to call outside the lock.
+
+        Args:
+            filepath: Resolved path to the SF2 file
+
+        Returns:
+            Tuple of (loaded soundfont or None on failure, load time in seconds)
+        """
+        start_time = time.time()
 
-                if soundfont.load():
-                    self.loaded_files[filepath] = soundfont
-                    self.load_times[filepath] = time.time() - start_time
-                    self.access_counts[filepath] = 1
-
-                    # Insert into order based on priority
-                    self._insert_file_by_priority(filepath, priority)
-
-                    # Auto-detect SF2 GM drum presets at bank 128 and remap to XG/GS bank 127
-                    programs = soundfont.get_available_programs()
-                    drum_count = 0
-                    for bank, program, _name in programs:
-                        if bank == 128:
-                            self.remap_program(127, program, 128, program)
-                            drum_count += 1
-                    if drum_count:
-                        logger.info(
-                            "SF2: Remapped %d drum preset(s) bank 128→127 for '%s'",
-                            drum_count,
-                            soundfont.name,
-                        )
+        try:
+            from .sf2_soundfont import SF2SoundFont
 
+            soundfont = SF2SoundFont(
+                filepath, self.sample_processor, self.zone_cache_manager, self.modulation_engine
+            )
+
+            if soundfont.load():
+                return soundfont, time.time() - start_time
+
+            logger.error("SF2: Failed to load '%s'", filepath)
+
+        except Exception as e:
+            logger.error("SF2: Error loading '%s': %s", filepath, e)
+
+        return None, time.time() - start_time
+
+    def _register_soundfont(
+        self, filepath: str, soundfont: SF2SoundFont, priority: int, load_time: float
+    ) -> bool:
+        """
+        Add a loaded soundfont to the managed set.
+
+        Args:
+            filepath: Resolved path to the SF2 file
+            soundfont: Soundfont returned by _open_soundfont()
+            priority: Loading priority
+            load_time: Time spent loading, in seconds
+
+        Returns:
+            True if registered successfully
+        """
+        with self._lock:
+            # Enforce maximum loaded files limit
+            if len(self.loaded_files) >= self.max_loaded_files:
+                self._evict_least_recently_used()
+
+            try:
+                self.loaded_files[filepath] = soundfont
+                self.load_times[filepath] = load_time
+                self.access_counts[filepath] = 1
+
+                # Insert into order based on priority
+                self._insert_file_by_priority(filepath, priority)
+
+                # Auto-detect SF2 GM drum presets at bank 128 and remap to XG/GS bank 127
+                programs = soundfont.get_available_programs()
+                drum_count = 0
+                for bank, program, _name in programs:
+                    if bank == 128:
+                        self.remap_program(127, program, 128, program)
+                        drum_count += 1
+                if drum_count:
                     logger.info(
-                        "SF2: Loaded '%s' in %.2fs", soundfont.name, self.load_times[filepath]
+                        "SF2: Remapped %d drum preset(s) bank 128→127 for '%s'",
+                        drum_count,
+                        soundfont.name,
                     )
-                    return True
-                else:
-                    logger.error("SF2: Failed to load '%s'", filepath)
-                    return False
+
+                logger.info("SF2: Loaded '%s' in %.2fs", soundfont.name, self.load_times[filepath])
+                return True
 
             except Exception as e:
                 logger.error("SF2: Error loading '%s': %s", filepath, e)
@@ -162,6 +260,7 @@ class SF2SoundFontManager:
             insert_pos = i + 1
 
         self.file_order.insert(insert_pos, filepath)
+        self._invalidate_program_index()
 
         # Update soundfont priority
         if filepath in self.loaded_files:
@@ -187,6 +286,7 @@ class SF2SoundFontManager:
             del self.access_counts[lru_file]
 
         self.file_order.remove(lru_file)
+        self._invalidate_program_index()
 
     def unload_soundfont(self, filepath: str) -> bool:
         """
@@ -209,6 +309,7 @@ class SF2SoundFontManager:
 
             if filepath in self.file_order:
                 self.file_order.remove(filepath)
+            self._invalidate_program_index()
 
             if filepath in self.load_times:
                 del self.load_times[filepath]
@@ -218,6 +319,73 @@ class SF2SoundFontManager:
 
             return True
 
+    def _invalidate_program_index(self) -> None:
+        """Drop the (bank, program) file index after the file order changes."""
+        self._program_files = None
+        self._invalidate_program_routes()
+
+    def _invalidate_program_routes(self) -> None:
+        """Drop resolved program routes after blacklisting or remapping changes."""
+        self._program_routes.clear()
+        self._program_params.clear()
+        self.state_version += 1
+
+    def get_program_files(self, bank: int, program: int) -> list[str]:
+        """
+        Get the loaded files that define a program, in priority order.
+
+        The (bank, program) index is built from the preset headers of every
+        loaded file on first use and dropped whenever the file order changes,
+        so lookups skip files that cannot contain the program.
+
+        Args:
+            bank: MIDI bank number
+            program: MIDI program number
+
+        Returns:
+            File paths in file_order order
+        """
+        with self._lock:
+            if self._program_files is None:
+                program_files: dict[tuple[int, int], list[str]] = {}
+                for filepath in self.file_order:
+                    soundfont = self.loaded_files.get(filepath)
+                    if soundfont is None:
+                        continue
+                    for file_bank, file_program, _name in soundfont.get_available_programs():
+                        files = program_files.setdefault((file_bank, file_program), [])
+                        if not files or files[-1] != filepath:
+                            files.append(filepath)
+                self._program_files = program_files
+
+            return self._program_files.get((bank, program), [])
+
+    def _resolve_program(self, bank: int, program: int) -> tuple[int, int, list[str]]:
+        """
+        Resolve a requested program to its remapped numbers and defining files.
+
+        Blacklisting and remapping are applied once per (bank, program) and the
+        result is kept until either changes, so a note-on costs one dict lookup.
+
+        Args:
+            bank: Requested MIDI bank number
+            program: Requested MIDI program number
+
+        Returns:
+            (bank, program, files) after remapping; files is empty if blacklisted
+        """
+        key = (bank, program)
+        route = self._program_routes.get(key)
+        if route is None:
+            with self._lock:
+                if key in self.file_blacklist:
+                    route = (bank, program, [])
+                else:
+                    bank, program = self.file_remapping.get(key, key)
+                    route = (bank, program, self.get_program_files(bank, program))
+                self._program_routes[key] = route
+        return route
+
     def get_program_parameters(
         self,
         bank: int,
@@ -229,6 +397,12 @@ class SF2SoundFontManager:
         """
         Get program parameters with remapping and blacklisting support.
 
+        Results are cached per (bank, program, note, velocity) until the
+        loaded files, blacklist or remapping change; each call returns its
+        own copy. Controllers are left out of the key because zone
+        modulators are evaluated per block by the region and do not change
+        the note-on parameters.
+
         Args:
             bank: MIDI bank number
             program: MIDI program number
@@ -239,36 +413,86 @@ class SF2SoundFontManager:
         Returns:
             Program parameters or None if not found/blacklisted
         """
-        # Check blacklisting
-        if (bank, program) in self.file_blacklist:
-            return None
+        key = (bank, program, note, velocity)
+        with self._lock:
+            if key in self._program_params:
+                self._program_params.move_to_end(key)
+                params = self._program_params[key]
+                if params is None:
+                    return None
+                self.access_counts[params["source_file"]] += 1
+                return params.copy()
+
+            params = self._compute_program_parameters(bank, program, note, velocity, controllers)
+            self._program_params[key] = params
+            if len(self._program_params) > _PROGRAM_PARAMS_CACHE_SIZE:
+                self._program_params.popitem(last=False)
+            return None if params is None else params.copy()
+
+    def preload_programs(
+        self, programs: Iterable[tuple[int, int]], max_workers: int | None = None
+    ) -> int:
+        """
+        Decode the samples of several programs before they are played.
+
+        Each program is resolved through blacklisting and remapping to the
+        highest-priority file defining it, and that file decodes the samples
+        in parallel, so first notes do not pay for cold sample loads.
 
-        # Check remapping
+        Args:
+            programs: (bank, program) pairs to warm up
+            max_workers: Worker thread count per file (defaults to the CPU count)
+
+        Returns:
+            Number of samples newly loaded
+        """
+        file_programs: dict[str, list[tuple[int, int]]] = {}
+        for bank, program in dict.fromkeys(programs):
+            bank, program, program_files = self._resolve_program(bank, program)
+            if program_files:
+                file_programs.setdefault(program_files[0], []).append((bank, program))
+
+        loaded = 0
+        for filepath, requested in file_programs.items():
+            with self._lock:
+                soundfont = self.loaded_files.get(filepath)
+            if soundfont is not None:
+                loaded += soundfont.preload_programs(requested, max_workers=max_workers)
+        return loaded
+
+    def _compute_program_parameters(
+        self,
+        bank: int,
+        program: int,
+        note: int,
+        velocity: int,
+        controllers: dict[int, float] | None,
+    ) -> dict[str, Any] | None:
+        """Resolve and build program parameters, bypassing the cache."""
+        # Apply blacklisting and remapping
         original_bank, original_program = bank, program
-        if (bank, program) in self.file_remapping:
-            bank, program = self.file_remapping[(bank, program)]
+        bank, program, program_files = self._resolve_program(bank, program)
 
-        # Search through files in priority order
+        # Search through the files defining this program in priority order
         with self._lock:
-            for filepath in self.file_order:
-                if filepath in self.loaded_files:
-                    soundfont = self.loaded_files[filepath]
-                    params = soundfont.get_program_parameters(
-                        bank, program, note, velocity, controllers=controllers
-                    )
+            for filepath in program_files:
+                soundfont = self.loaded_files[filepath]
+                params = soundfont.get_program_parameters(
+                    bank, program, note, velocity, controllers=controllers
+                )
 
-                    if params:
-                        # Update access statistics
-                        self.access_counts[filepath] += 1
+                if params:
+                    # Update access statistics
+                    self.access_counts[filepath] += 1
 
-                        # Add metadata
-                        params["source_file"] = filepath
-                        params["original_bank"] = original_bank
-                        params["original_program"] = original_program
-                        params["remapped_bank"] = bank
-                        params["remapped_program"] = program
+                    # Add metadata
+                    params["source_file"] = filepath
+                    params["original_bank"] = original_bank
+                    params["original_program"] = original_program
+                    params["remapped_bank"] = bank
+                    params["remapped_program"] = program
 
-                        return params
+                    return params
 
         return None
 
@@ -323,6 +547,7 @@ class SF2SoundFontManager:
             program: MIDI program number
         """
         self.file_blacklist.add((bank, program))
+        self._invalidate_program_routes()
 
     def unblacklist_program(self, bank: int, program: int) -> None:
         """
@@ -333,6 +558,7 @@ class SF2SoundFontManager:
             program: MIDI program number
         """
         self.file_blacklist.discard((bank, program))
+        self._invalidate_program_routes()
 
     def remap_program(
         self, from_bank: int, from_program: int, to_bank: int, to_program: int
@@ -347,6 +573,7 @@ class SF2SoundFontManager:
             to_program: Target MIDI program number
         """
         self.file_remapping[(from_bank, from_program)] = (to_bank, to_program)
+        self._invalidate_program_routes()
 
     def clear_remapping(self, bank: int, program: int) -> None:
         """
@@ -359,6 +586,7 @@ class SF2SoundFontManager:
         key = (bank, program)
         if key in self.file_remapping:
             del self.file_remapping[key]
+            self._invalidate_program_routes()
 
     def set_file_priority(self, filepath: str, priority: int) -> bool:
         """
@@ -572,7 +800,7 @@ class SF2SoundFontManager:
             SF2Zone instance or None
         """
         with self._lock:
-            for filepath in self.file_order:
+            for filepath in self.get_program_files(bank, program):
                 soundfont = self.loaded_files.get(filepath)
                 if not soundfont or not hasattr(soundfont, "get_zone"):
                     continue
@@ -664,6 +892,8 @@ class SF2SoundFontManager:
             if self.modulation_engine:
                 self.modulation_engine.reset_all()
 
+            self._program_params.clear()
+
     def unload_all(self) -> None:
         """Unload all soundfonts and clear all data."""
         with self._lock:
@@ -672,6 +902,7 @@ class SF2SoundFontManager:
 
             self.loaded_files.clear()
             self.file_order.clear()
+            self._invalidate_program_index()
             self.load_times.clear()
             self.access_counts.clear()
 
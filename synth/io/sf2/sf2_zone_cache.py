@@ -7,6 +7,7 @@ Optimized for real-time synthesis with thousands of zones.
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from typing import Any
 
 from .sf2_data_model import SF2Zone
@@ -40,6 +41,8 @@ class RangeNode:
         self.left: RangeNode | None = None
         self.right: RangeNode | None = None
         self.height = 1
+        # Highest key_max in this node's subtree, used to prune queries
+        self.max_key = key_max
 
     def overlaps(self, key: int, velocity: int) -> bool:
         """
@@ -59,7 +62,9 @@ class AVLRangeTree:
     """
     AVL-balanced range tree for efficient 2D range queries.
 
-    Provides O(log n) lookup time for zone matching based on key/velocity ranges.
+    Nodes are ordered by low key and track the highest key in their subtree,
+    so a query skips only subtrees that cannot reach the key. This gives
+    O(log n + k) lookups that return every matching zone.
     """
 
     def __init__(self):
@@ -94,8 +99,8 @@ class AVLRangeTree:
         else:
             node.right = self._insert_recursive(node.right, zone)
 
-        # Update height
-        node.height = 1 + max(self._get_height(node.left), self._get_height(node.right))
+        # Update height and subtree key bound
+        self._update(node)
 
         # Balance the tree — check child balance factors, not key values,
         # because key comparison is unreliable after prior rotations.
@@ -140,20 +145,21 @@ class AVLRangeTree:
         self, node: RangeNode | None, key: int, velocity: int, result: list[SF2Zone]
     ) -> None:
         """Recursive range query with proper pruning."""
-        if node is None:
+        # Prune: no zone in this subtree reaches up to the key
+        if node is None or node.max_key < key:
+            return
+
+        self._query_recursive(node.left, key, velocity, result)
+
+        # Right subtree zones start at or above this node's low key
+        if key < node.key_min:
             return
 
         # Check current node
         if node.overlaps(key, velocity):
             result.append(node.zone)
 
-        # Prune: only search left subtree if key is within left subtree's range
-        if node.left and key >= node.left.key_min:
-            self._query_recursive(node.left, key, velocity, result)
-
-        # Prune: only search right subtree if key is within right subtree's range
-        if node.right and key <= node.right.key_max:
-            self._query_recursive(node.right, key, velocity, result)
+        self._query_recursive(node.right, key, velocity, result)
 
     def clear(self) -> None:
         """Clear the tree."""
@@ -177,6 +183,16 @@ class AVLRangeTree:
         """Get node height."""
         return node.height if node else 0
 
+    def _update(self, node: RangeNode) -> None:
+        """Recompute a node's height and subtree key bound from its children."""
+        node.height = 1 + max(self._get_height(node.left), self._get_height(node.right))
+        max_key = node.key_max
+        if node.left and node.left.max_key > max_key:
+            max_key = node.left.max_key
+        if node.right and node.right.max_key > max_key:
+            max_key = node.right.max_key
+        node.max_key = max_key
+
     def _get_balance(self, node: RangeNode | None) -> int:
         """Get balance factor."""
         if node is None:
@@ -191,8 +207,8 @@ class AVLRangeTree:
         y.left = z
         z.right = T2
 
-        z.height = 1 + max(self._get_height(z.left), self._get_height(z.right))
-        y.height = 1 + max(self._get_height(y.left), self._get_height(y.right))
+        self._update(z)
+        self._update(y)
 
         return y
 
@@ -204,8 +220,8 @@ class AVLRangeTree:
         y.right = z
         z.left = T3
 
-        z.height = 1 + max(self._get_height(z.left), self._get_height(z.right))
-        y.height = 1 + max(self._get_height(y.left), self._get_height(y.right))
+        self._update(z)
+        self._update(y)
 
         return y
 
@@ -214,16 +230,120 @@ class AVLRangeTree:
         return abs(self._get_balance(self.root)) <= 1
 
 
+class SortedIntervalIndex:
+    """
+    Sorted key-interval index for zone matching.
+
+    Zones are kept sorted by their low key together with the widest key span
+    seen, so a query binary-searches the last zone starting at or below the
+    key and walks back only as far as a zone could still reach it. This gives
+    O(log n + k) lookups that always return every matching zone, in the order
+    the zones were added.
+    """
+
+    def __init__(self):
+        """Initialize empty index."""
+        self._zones: list[SF2Zone] = []
+        self._key_mins: list[int] = []
+        self._entries: list[tuple[int, int, int, int, int, SF2Zone]] = []
+        self._max_span = 0
+        self._dirty = False
+
+    def insert(self, zone: SF2Zone) -> None:
+        """
+        Insert a zone into the index.
+
+        Args:
+            zone: SF2 zone to insert
+        """
+        self._zones.append(zone)
+        self._dirty = True
+
+    def __len__(self) -> int:
+        """Return the number of indexed zones."""
+        return len(self._zones)
+
+    def _build(self) -> None:
+        """Sort pending zones by low key and refresh the search arrays."""
+        entries = []
+        max_span = 0
+        for order, zone in enumerate(self._zones):
+            key_min, key_max = zone.key_range
+            vel_min, vel_max = zone.velocity_range
+            entries.append((key_min, key_max, vel_min, vel_max, order, zone))
+            if key_max - key_min > max_span:
+                max_span = key_max - key_min
+
+        # Stable sort keeps insertion order among zones with the same low key
+        entries.sort(key=lambda entry: entry[0])
+        self._entries = entries
+        self._key_mins = [entry[0] for entry in entries]
+        self._max_span = max_span
+        self._dirty = False
+
+    def query(self, key: int, velocity: int) -> list[SF2Zone]:
+        """
+        Query zones that match the given key/velocity.
+
+        Args:
+            key: MIDI key (0-127)
+            velocity: MIDI velocity (0-127)
+
+        Returns:
+            List of matching zones in insertion order
+        """
+        if self._dirty:
+            self._build()
+
+        entries = self._entries
+        lowest_start = key - self._max_span
+        matches = []
+        i = bisect_right(self._key_mins, key) - 1
+        while i >= 0:
+            key_min, key_max, vel_min, vel_max, order, zone = entries[i]
+            if key_min < lowest_start:
+                break
+            if key <= key_max and vel_min <= velocity <= vel_max:
+                matches.append((order, zone))
+            i -= 1
+
+        matches.sort(key=lambda match: match[0])
+        return [zone for _, zone in matches]
+
+    def clear(self) -> None:
+        """Clear the index."""
+        self._zones.clear()
+        self._key_mins = []
+        self._entries = []
+        self._max_span = 0
+        self._dirty = False
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get index statistics.
+
+        Returns:
+            Dictionary with index statistics
+        """
+        if self._dirty:
+            self._build()
+        return {
+            "node_count": len(self._zones),
+            "max_key_span": self._max_span,
+        }
+
+
 class HierarchicalZoneCache:
     """
     Hierarchical zone cache with multiple lookup strategies.
 
-    Combines range tree for fast lookups with hash-based caching for repeated queries.
+    Combines a sorted interval index for fast lookups with hash-based caching
+    for repeated queries.
     """
 
     def __init__(self):
         """Initialize hierarchical cache."""
-        self.range_tree = AVLRangeTree()
+        self.range_tree = SortedIntervalIndex()
         self.query_cache: dict[tuple[int, int], list[SF2Zone]] = {}
         self.max_cache_size = 1000  # Maximum cached queries
         self.cache_hits = 0
@@ -474,20 +594,16 @@ class SF2ZoneCacheManager:
         preset_cache_count = len(self.preset_caches)
         instrument_cache_count = len(self.instrument_caches)
 
-        total_preset_zones = sum(
-            cache.range_tree._node_count for cache in self.preset_caches.values()
-        )
+        total_preset_zones = sum(len(cache.range_tree) for cache in self.preset_caches.values())
         total_instrument_zones = sum(
-            cache.range_tree._node_count for cache in self.instrument_caches.values()
+            len(cache.range_tree) for cache in self.instrument_caches.values()
         )
 
         global_preset_zones = (
-            self.global_preset_cache.range_tree._node_count if self.global_preset_cache else 0
+            len(self.global_preset_cache.range_tree) if self.global_preset_cache else 0
         )
         global_instrument_zones = (
-            self.global_instrument_cache.range_tree._node_count
-            if self.global_instrument_cache
-            else 0
+            len(self.global_instrument_cache.range_tree) if self.global_instrument_cache else 0
         )
 
         return {
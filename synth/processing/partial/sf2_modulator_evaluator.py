@@ -24,6 +24,49 @@ from .sf2_default_modulators import (
     TRANSFORM_LINEAR,
 )
 
+# Source operator split into (index, concave, scale, offset); the polarity and
+# direction flags are folded into the affine map scale * raw + offset
+_SourceFields = tuple[int, bool, float, float]
+# (source fields, dest_operator, mod_amount, amount source fields, transform)
+_ModRecord = tuple[_SourceFields | None, int, int, _SourceFields | None, int]
+
+# Source indices whose value is fixed for the life of a note: none,
+# note-on velocity, key number, and the unused index 127
+_NOTE_CONSTANT_SOURCES = frozenset((0, 2, 3, 127))
+
+
+def _is_note_constant(src_operator: int) -> bool:
+    """Whether a source operator reads no controller state."""
+    return (src_operator & 0x7F) in _NOTE_CONSTANT_SOURCES
+
+
+# (scale, offset) mapping a raw [0, 1] source value to its normalised value,
+# indexed by bipolar | invert << 1. Direction reverses the range: negation
+# for bipolar sources, 1 - value for unipolar ones (SF2 spec).
+_POLARITY_MAPS: tuple[tuple[float, float], ...] = (
+    (1.0, 0.0),  # unipolar
+    (2.0, -1.0),  # bipolar
+    (-1.0, 1.0),  # unipolar, inverted
+    (-2.0, 1.0),  # bipolar, inverted
+)
+
+
+def _split_source(src_operator: int) -> _SourceFields | None:
+    """Split a source operator into (index, concave, scale, offset).
+
+    Returns:
+        The decoded fields, or None if the source is NONE.
+    """
+    if src_operator == NONE:
+        return None
+    scale, offset = _POLARITY_MAPS[(src_operator >> 7) & 0x3]  # bits 7-8
+    return (
+        src_operator & 0x7F,  # bits 0-6
+        bool(src_operator & 0x0200),
+        scale,
+        offset,
+    )
+
 
 class SF2ModulatorEvaluator:
     """Evaluates SF2 modulators against current controller state.
@@ -43,7 +86,12 @@ class SF2ModulatorEvaluator:
 
     __slots__ = (
         "_cc_cache",
+        "_mod_records",
         "_modulators",
+        "_note_constant",
+        "_note_key",
+        "_note_values",
+        "_results",
     )
 
     def __init__(self, zone_modulators: list[dict] | None = None) -> None:
@@ -74,11 +122,38 @@ class SF2ModulatorEvaluator:
 
         self._modulators = merged
 
+        # Field lookups and source bitfields resolved once per region instead
+        # of once per block:
+        # (source fields, dest_operator, mod_amount, amount source fields, transform)
+        self._mod_records: tuple[_ModRecord, ...] = tuple(
+            (
+                _split_source(mod["src_operator"]),
+                mod["dest_operator"],
+                mod.get("mod_amount", 0),
+                _split_source(mod.get("amt_src_operator", 0)),
+                mod.get("mod_trans_operator", TRANSFORM_LINEAR),
+            )
+            for mod in merged
+        )
+
+        # Modulators reading only note-constant sources are evaluated once
+        # per (velocity, keynum) instead of once per block
+        self._note_constant: tuple[bool, ...] = tuple(
+            _is_note_constant(mod["src_operator"])
+            and _is_note_constant(mod.get("amt_src_operator", 0))
+            for mod in merged
+        )
+        self._note_key: tuple[int, int] | None = None
+        self._note_values: list[float | None] = []
+
         # Per-block CC cache: dict[CC_number → normalized_value].
         # Built once per evaluate() call from the controllers dict.
         # Normalized to SF2 range: 0..127 → 0.0..1.0.
         self._cc_cache: dict[int, float] = {}
 
+        # Per-block result dict, cleared and refilled by each evaluate() call
+        self._results: dict[int, float] = {}
+
     # ── Per-block evaluation ───────────────────────────────────────────
 
     def evaluate(
@@ -98,34 +173,31 @@ class SF2ModulatorEvaluator:
         Returns:
             Dict of gen_type → modulation_value. Units match SF2 generator
             conventions (cents for pitch/filter, centibels for attenuation,
-            0-1000 range for sends).
+            0-1000 range for sends). The dict is reused by the next call,
+            so copy it to keep values across blocks.
         """
         self._build_cc_cache(controllers)
-        results: dict[int, float] = {}
-
-        for mod in self._modulators:
-            src = mod["src_operator"]
-            dest = mod["dest_operator"]
-            amount = mod.get("mod_amount", 0)
-            amt_src = mod.get("amt_src_operator", 0)
-            transform = mod.get("mod_trans_operator", TRANSFORM_LINEAR)
-
-            # Decode primary source
-            primary = self._decode_source(src, velocity, keynum)
-            if primary is None:
+        if self._note_key != (velocity, keynum):
+            self._note_key = (velocity, keynum)
+            self._note_values = [
+                self._evaluate_record(record, velocity, keynum) if constant else None
+                for record, constant in zip(self._mod_records, self._note_constant, strict=True)
+            ]
+
+        results = self._results
+        results.clear()
+        for record, constant, note_value in zip(
+            self._mod_records, self._note_constant, self._note_values, strict=True
+        ):
+            if constant:
+                modulation = note_value
+            else:
+                modulation = self._evaluate_record(record, velocity, keynum)
+            if modulation is None:
                 continue
 
-            # Apply amount source (secondary modulation depth)
-            if amt_src and amt_src != NONE:
-                amt_val = self._decode_source(amt_src, velocity, keynum)
-                if amt_val is not None:
-                    amount = amount * amt_val
-
-            # Apply transform
-            transformed = self._apply_transform(primary, transform)
-
             # Accumulate to destination
-            modulation = transformed * amount
+            dest = record[1]
             if dest in results:
                 results[dest] += modulation
             else:
@@ -133,27 +205,49 @@ class SF2ModulatorEvaluator:
 
         return results
 
-    # ── Source decoding ────────────────────────────────────────────────
-
-    def _decode_source(
+    def _evaluate_record(
         self,
-        src_operator: int,
+        record: _ModRecord,
         velocity: int,
         keynum: int,
     ) -> float | None:
-        """Decode an SF2 source operator bitfield into a normalised value.
+        """Evaluate one modulator's contribution to its destination.
 
         Returns:
-            Normalised float (range varies by source type), or None
-            if the source is NONE (index 0).
+            Modulation value, or None if the primary source is NONE.
         """
-        if src_operator == NONE:
+        src, _dest, amount, amt_src, transform = record
+
+        # Decode primary source
+        if src is None:
             return None
+        primary = self._decode_source(src, velocity, keynum)
+
+        # Apply amount source (secondary modulation depth)
+        if amt_src is not None:
+            amount = amount * self._decode_source(amt_src, velocity, keynum)
 
-        index = src_operator & 0x7F  # bits 0-6
-        is_bipolar = bool(src_operator & 0x0080)
-        invert = bool(src_operator & 0x0100)
-        is_concave = bool(src_operator & 0x0200)
+        # Apply transform
+        transformed = self._apply_transform(primary, transform)
+        return transformed * amount
+
+    # ── Source decoding ────────────────────────────────────────────────
+
+    def _decode_source(
+        self,
+        source: _SourceFields,
+        velocity: int,
+        keynum: int,
+    ) -> float:
+        """Turn a split SF2 source operator into a normalised value.
+
+        Args:
+            source: (index, concave, scale, offset) from _split_source().
+
+        Returns:
+            Normalised float (range varies by source type).
+        """
+        index, is_concave, scale, offset = source
 
         raw = self._get_raw_source_value(index, velocity, keynum)
 
@@ -161,23 +255,8 @@ class SF2ModulatorEvaluator:
         if index == 2 and is_concave and raw <= 1.0 and raw >= 0.0:
             raw = raw * raw  # Square for concave velocity curve
 
-        # Normalise to [-1, 1] range
-        if is_bipolar:
-            normalised = 2.0 * raw - 1.0
-        else:
-            normalised = raw
-
-        if invert:
-            # SF2 spec: Direction flag reverses the source range.
-            # For bipolar sources this means negation (-value).
-            # For unipolar sources this means 1.0 - value
-            # (reversed within [0, 1]).
-            if is_bipolar:
-                normalised = -normalised
-            else:
-                normalised = 1.0 - normalised
-
-        return normalised
+        # Polarity and direction, precomputed by _split_source()
+        return scale * raw + offset
 
     def _get_raw_source_value(
         self,
@@ -28,6 +28,26 @@ from .sf2_modulator_evaluator import (
 
 logger = logging.getLogger(__name__)
 
+# Descriptor generator_params keys for common generator types (SF2 spec gen numbers)
+_GENERATOR_PARAM_NAMES: dict[int, str] = {
+    33: "amp_delay",  # delayVolEnv
+    34: "amp_attack",  # attackVolEnv
+    35: "amp_hold",  # holdVolEnv
+    36: "amp_decay",  # decayVolEnv
+    37: "amp_sustain",  # sustainVolEnv
+    38: "amp_release",  # releaseVolEnv
+    8: "filter_cutoff",  # initialFilterFc
+    9: "filter_resonance",  # initialFilterQ
+    51: "coarse_tune",  # coarseTune
+    52: "fine_tune",  # fineTune
+}
+
+# Controllers with per-region handling in _drain_param_updates; anything else
+# (including volume, which the channel pre-gain handles) is skipped up front
+_REGION_CONTROLLERS = frozenset(
+    (1, 2, 4, 5, 8, 10, 11, 64, 65, 66, 67, 68, 69, 71, 72, 73, 74, 75, 76, 77, 78, 79, 91, 92, 93)
+)
+
 
 class SF2Region(IRegion):
     """
@@ -104,6 +124,7 @@ class SF2Region(IRegion):
         "_filter_key_track",
         "_filter_mod",
         "_filter_sub_blocks",
+        "_filter_sub_layout",
         "_filter_type",
         "_filter_type_str",
         "_filter_work_left",
@@ -150,10 +171,13 @@ class SF2Region(IRegion):
         "_loop_mode",
         "_loop_start",
         "_mod_env_buffer",
+        "_mod_env_flags",
         "_mod_env_level",
+        "_mod_env_ramp",
         "_mod_env_stage",
         "_mod_env_stage_time",
         "_mod_env_time_in_stage",
+        "_mod_env_times",
         "_mod_env_to_filter",
         "_mod_env_to_pan",
         "_mod_env_to_pitch",
@@ -320,7 +344,14 @@ class SF2Region(IRegion):
 
         # Filter sub-block count for modulation (configurable, was hardcoded 4)
         self._filter_sub_blocks: int = 4
+        # Sub-block layout cached per block size: (block_size, starts, lengths, bounds,
+        # sum buffer, mean buffer)
+        self._filter_sub_layout: tuple | None = None
         self._mod_env_buffer: np.ndarray | None = None
+        # Mod envelope work buffers: sample ramp 1..N, stage times, transition flags
+        self._mod_env_ramp: np.ndarray | None = None
+        self._mod_env_times: np.ndarray | None = None
+        self._mod_env_flags: np.ndarray | None = None
         self._pitch_env_buffer: np.ndarray | None = None
         self._read_positions: np.ndarray | None = None
         self._filter_work_left: np.ndarray | None = None
@@ -704,21 +735,7 @@ class SF2Region(IRegion):
 
         # Fall back to descriptor generator params
         if self.descriptor.generator_params:
-            # Map common generator types (SF2 spec gen numbers)
-            gen_mapping = {
-                33: "amp_delay",  # delayVolEnv
-                34: "amp_attack",  # attackVolEnv
-                35: "amp_hold",  # holdVolEnv
-                36: "amp_decay",  # decayVolEnv
-                37: "amp_sustain",  # sustainVolEnv
-                38: "amp_release",  # releaseVolEnv
-                8: "filter_cutoff",  # initialFilterFc
-                9: "filter_resonance",  # initialFilterQ
-                51: "coarse_tune",  # coarseTune
-                52: "fine_tune",  # fineTune
-            }
-
-            param_name = gen_mapping.get(gen_type)
+            param_name = _GENERATOR_PARAM_NAMES.get(gen_type)
             if param_name and param_name in self.descriptor.generator_params:
                 return self.descriptor.generator_params[param_name]
 
@@ -1053,7 +1070,7 @@ class SF2Region(IRegion):
         # Filter type: lowpass (standard SF2 has no dedicated filter type generator).
         # bandpass and highpass are available via XG modulation ("gs_filter_type" key).
         self._filter_type = 0
-        filter_type_str = getattr(self, "_filter_type_str", "lowpass")
+        filter_type_str = self._filter_type_str
 
         filter_obj = UltraFastResonantFilter(
             cutoff=cutoff,
@@ -1168,7 +1185,7 @@ class SF2Region(IRegion):
         # the voice_instance's pre-populated _portamento_source_candidate.
         if self._portamento_active:
             source_note: int | None = None
-            mod = getattr(self, "_modulation_state", None) or {}
+            mod = self._modulation_state
             ch_source = mod.get("_portamento_last_note")
             if ch_source is not None and ch_source >= 0:
                 source_note = int(ch_source)
@@ -1176,7 +1193,7 @@ class SF2Region(IRegion):
             # portamento works on the very first block before the modulation
             # dict is delivered.
             if source_note is None:
-                pre = getattr(self, "_portamento_source_candidate", None)
+                pre = self._portamento_source_candidate
                 if pre is not None and pre >= 0 and pre != note:
                     source_note = int(pre)
             if source_note is not None and source_note != note:
@@ -1329,6 +1346,8 @@ class SF2Region(IRegion):
         """
         while self._param_updates:
             controller, value = self._param_updates.pop(0)
+            if controller not in _REGION_CONTROLLERS:
+                continue
             normalized = value / 127.0
 
             if controller == 1:
@@ -1342,8 +1361,6 @@ class SF2Region(IRegion):
                 self._vib_lfo_to_pitch_base = self._vib_lfo_to_pitch
             elif controller == 5:
                 self._portamento_time = self._calculate_portamento_time(value)
-            elif controller == 7:
-                pass  # Volume — handled by channel pre-gain
             elif controller == 8:
                 self._balance = (value - 64) / 64.0
             elif controller == 10:
@@ -1435,9 +1452,7 @@ class SF2Region(IRegion):
             self._held_by_hold2 = False
 
     def _apply_harmonic_content(self, normalized: float) -> None:
-        """CC71: XG Harmonic Content - modify filter resonance."""
-        if hasattr(self, "_filter_resonance"):
-            self._filter_resonance = 0.5 + normalized * 1.5
+        """CC71: XG Harmonic Content - modify filter modulation depth."""
         self._mod_env_to_filter = normalized * 0.5
 
     def _apply_brightness(self, normalized: float) -> None:
@@ -1553,13 +1568,10 @@ class SF2Region(IRegion):
         if chorus_send is not None:
             self._chorus_send = max(0.0, min(1.0, float(chorus_send)))
 
-        # XG harmonic content (CC71): modify filter resonance
+        # XG harmonic content (CC71): modify filter modulation depth
         harmon_content = modulation.get("harmon_content")
         if harmon_content is not None:
-            normalized = float(harmon_content)
-            if hasattr(self, "_filter_resonance"):
-                self._filter_resonance = 0.5 + normalized * 1.5
-            self._mod_env_to_filter = normalized * 0.5
+            self._mod_env_to_filter = float(harmon_content) * 0.5
 
         # XG brightness (CC72): modify filter cutoff
         brightness = modulation.get("brightness")
@@ -1636,77 +1648,123 @@ class SF2Region(IRegion):
             self._vib_lfo.generate_block(self._vib_lfo_buffer[:block_size], block_size)
 
     def _generate_modulation_envelope_block(self, block_size: int) -> np.ndarray:
-        """Generate modulation envelope block sample-by-sample (zero-allocation)."""
+        """Generate modulation envelope block (sample-accurate, zero-allocation output).
+
+        The envelope is rendered one stage segment at a time: within a stage
+        the level is constant, linear in time or a fixed-ratio exponential, so
+        each segment is filled with a single numpy expression and the Python
+        loop only runs once per stage transition instead of once per sample.
+        """
         if self._mod_env_buffer is None or len(self._mod_env_buffer) < block_size:
             self._mod_env_buffer = np.zeros(block_size, dtype=np.float32)
+        if self._mod_env_ramp is None or len(self._mod_env_ramp) < block_size:
+            self._mod_env_ramp = np.arange(1, block_size + 1, dtype=np.float64)
+            self._mod_env_times = np.empty(block_size, dtype=np.float64)
+            self._mod_env_flags = np.empty(block_size, dtype=np.bool_)
+
+        buffer = self._mod_env_buffer
+        ramp = self._mod_env_ramp
+        dt = 1.0 / self.sample_rate
+        pos = 0
+
+        while pos < block_size:
+            remaining = block_size - pos
+            stage = self._mod_env_stage
+            level = self._mod_env_level
+            # Each output sample holds the level before that sample's update
+            buffer[pos] = level
+
+            if stage == 0 or stage == 5:  # idle / sustain: no further transitions
+                if stage == 5:
+                    level = self._sustain_mod_env
+                    self._mod_env_level = level
+                buffer[pos + 1 : block_size] = level
+                self._mod_env_time_in_stage += remaining * dt
+                break
+
+            if stage == 1:
+                stage_end = self._delay_mod_env
+            elif stage == 2:
+                stage_end = self._attack_mod_env
+            elif stage == 3:
+                stage_end = self._mod_env_hold_time()
+            elif stage == 4:
+                stage_end = self._mod_env_decay_time()
+            else:  # release
+                stage_end = self._release_mod_env
+
+            # Stage time after each remaining update; the first one reaching
+            # stage_end triggers the transition
+            time_in_stage = self._mod_env_time_in_stage
+            stage_times = self._mod_env_times[:remaining]
+            np.multiply(ramp[:remaining], dt, out=stage_times)
+            stage_times += time_in_stage
+            finished = self._mod_env_flags[:remaining]
+            np.greater_equal(stage_times, stage_end, out=finished)
+            transition = bool(finished.any())
+            updates = int(finished.argmax()) + 1 if transition else remaining
+            end_time = time_in_stage + updates * dt
+            # Updates that stay in this stage set the following samples
+            inner = stage_times[: updates - 1]
+            segment = buffer[pos + 1 : pos + updates]
+
+            if stage == 1 or stage == 3:  # delay / hold: level unchanged
+                segment[:] = level
+            elif stage == 2:  # attack: linear 0 -> 1
+                segment[:] = inner / stage_end
+                if not transition:
+                    self._mod_env_level = end_time / stage_end
+                elif updates > 1:
+                    self._mod_env_level = float(inner[-1] / stage_end)
+            elif stage == 4:  # decay: linear 1 -> sustain
+                depth = 1.0 - self._sustain_mod_env
+                segment[:] = 1.0 - inner / stage_end * depth
+                if transition:
+                    self._mod_env_level = self._sustain_mod_env
+                else:
+                    self._mod_env_level = 1.0 - end_time / stage_end * depth
+            else:  # release: exponential decay, level *= exp(-dt / tau)
+                tau = self._release_mod_env if self._release_mod_env > 0.001 else 0.001
+                ratio = math.exp(-dt / tau)
+                # Stage times are no longer needed, so reuse them for the decay curve
+                np.power(ratio, ramp[: updates - 1], out=inner)
+                inner *= level
+                segment[:] = inner
+                self._mod_env_level = 0.0 if transition else level * ratio**updates
+
+            if transition and stage in (1, 2, 3):
+                self._mod_env_stage = stage + 1
+                self._mod_env_time_in_stage = 0.0
+            else:
+                if transition:
+                    self._mod_env_stage = 5 if stage == 4 else 0
+                self._mod_env_time_in_stage = end_time
 
-        for i in range(block_size):
-            self._mod_env_buffer[i] = self._mod_env_level
-            self._update_modulation_envelope_state(1.0 / self.sample_rate)
-
-        return self._mod_env_buffer[:block_size]
+            pos += updates
 
-    def _update_modulation_envelope_state(self, delta_time: float) -> None:
-        """Update modulation envelope state (sample-accurate)."""
-        self._mod_env_time_in_stage += delta_time
-        stage_time = self._mod_env_time_in_stage
+        return buffer[:block_size]
 
-        if self._mod_env_stage == 0:  # idle
-            pass
-        elif self._mod_env_stage == 1:  # delay
-            if stage_time >= self._delay_mod_env:
-                self._mod_env_stage = 2  # attack
-                self._mod_env_time_in_stage = 0.0
-        elif self._mod_env_stage == 2:  # attack
-            if stage_time >= self._attack_mod_env:
-                self._mod_env_stage = 3  # hold
-                self._mod_env_time_in_stage = 0.0
-            else:
-                self._mod_env_level = (
-                    stage_time / self._attack_mod_env if self._attack_mod_env > 0 else 1.0
-                )
-        elif self._mod_env_stage == 3:  # hold
-            # Apply key tracking to mod envelope hold (generator 31)
-            if self._keynum_to_mod_env_hold != 0 and self.current_note > 0:
-                key_offset = (self.current_note - 60) / 60.0
-                adjusted_hold_tc = max(
-                    -12000,
-                    self._hold_mod_env_tc + self._keynum_to_mod_env_hold * key_offset * 100.0,
-                )
-                hold_time = self._timecents_to_seconds(adjusted_hold_tc)
-            else:
-                hold_time = self._hold_mod_env
-            if stage_time >= hold_time:
-                self._mod_env_stage = 4  # decay
-                self._mod_env_time_in_stage = 0.0
-        elif self._mod_env_stage == 4:  # decay
-            # Apply key tracking to mod envelope decay (generator 32)
-            if self._keynum_to_mod_env_decay != 0 and self.current_note > 0:
-                key_offset = (self.current_note - 60) / 60.0
-                adjusted_decay_tc = max(
-                    -12000,
-                    self._decay_mod_env_tc + self._keynum_to_mod_env_decay * key_offset * 100.0,
-                )
-                decay_time = self._timecents_to_seconds(adjusted_decay_tc)
-            else:
-                decay_time = self._decay_mod_env
-            if stage_time >= decay_time:
-                self._mod_env_stage = 5  # sustain
-                self._mod_env_level = self._sustain_mod_env
-            else:
-                decay_progress = stage_time / decay_time if decay_time > 0 else 1.0
-                self._mod_env_level = 1.0 - decay_progress * (1.0 - self._sustain_mod_env)
-        elif self._mod_env_stage == 5:  # sustain
-            self._mod_env_level = self._sustain_mod_env
-        elif self._mod_env_stage == 6:  # release
-            if stage_time >= self._release_mod_env:
-                self._mod_env_level = 0.0
-                self._mod_env_stage = 0  # idle
-            else:
-                # Exponential decay: level *= exp(-dt / tau)
-                tau = self._release_mod_env if self._release_mod_env > 0.001 else 0.001
-                decay_factor = np.exp(-delta_time / tau)
-                self._mod_env_level *= decay_factor
+    def _mod_env_hold_time(self) -> float:
+        """Modulation envelope hold time in seconds, with key tracking (generator 31)."""
+        if self._keynum_to_mod_env_hold != 0 and self.current_note > 0:
+            key_offset = (self.current_note - 60) / 60.0
+            adjusted_hold_tc = max(
+                -12000,
+                self._hold_mod_env_tc + self._keynum_to_mod_env_hold * key_offset * 100.0,
+            )
+            return self._timecents_to_seconds(adjusted_hold_tc)
+        return self._hold_mod_env
+
+    def _mod_env_decay_time(self) -> float:
+        """Modulation envelope decay time in seconds, with key tracking (generator 32)."""
+        if self._keynum_to_mod_env_decay != 0 and self.current_note > 0:
+            key_offset = (self.current_note - 60) / 60.0
+            adjusted_decay_tc = max(
+                -12000,
+                self._decay_mod_env_tc + self._keynum_to_mod_env_decay * key_offset * 100.0,
+            )
+            return self._timecents_to_seconds(adjusted_decay_tc)
+        return self._decay_mod_env
 
     def _generate_pitch_envelope(self, block_size: int) -> None:
         """Generate pitch envelope buffer for this block.
@@ -1808,14 +1866,45 @@ class SF2Region(IRegion):
 
         return total
 
+    def _build_filter_sub_layout(self, block_size: int) -> tuple:
+        """
+        Build and cache the LFO filter sub-block layout for a block size.
+
+        Args:
+            block_size: Number of samples per block
+
+        Returns:
+            Tuple of (block_size, starts, lengths, bounds, sum buffer, mean buffer)
+        """
+        sub_blocks = self._filter_sub_blocks
+        sub_size = block_size // sub_blocks
+        if sub_size == 0:
+            sub_blocks = 1
+            sub_size = block_size
+
+        starts = np.arange(sub_blocks, dtype=np.intp) * sub_size
+        lengths = np.full(sub_blocks, sub_size, dtype=np.float64)
+        lengths[-1] = block_size - starts[-1]
+        bounds = tuple(
+            (int(start), int(start + length)) for start, length in zip(starts, lengths, strict=True)
+        )
+        layout = (
+            block_size,
+            starts,
+            lengths,
+            bounds,
+            np.empty(sub_blocks, dtype=np.float32),
+            np.empty(sub_blocks, dtype=np.float64),
+        )
+        self._filter_sub_layout = layout
+        return layout
+
     def _apply_filter_with_modulation(self, output: np.ndarray, block_size: int) -> None:
         """Apply filter with LFO and modulation envelope (zero-allocation)."""
         if "filter" not in self._filters:
             return
 
         filter_obj = self._filters["filter"]
-        if not hasattr(filter_obj, "process_block"):
-            return
 
         try:
             # Get base filter parameters
@@ -1849,19 +1938,27 @@ class SF2Region(IRegion):
                 # block-constant modulation (stepping artifacts) and per-sample modulation
                 # (which would require per-sample filter parameter updates, causing zipper noise).
                 # 4 sub-blocks capture the LFO envelope shape with minimal overhead.
-                sub_blocks = self._filter_sub_blocks
-                sub_size = block_size // sub_blocks
-                for sb in range(sub_blocks):
-                    start = sb * sub_size
-                    end = start + sub_size if sb < sub_blocks - 1 else block_size
-
-                    # Mean LFO value for this sub-block
-                    mean_lfo = np.mean(self._mod_lfo_buffer[start:end])
-                    sub_filter_mod = filter_mod_total + mean_lfo * self._mod_lfo_to_filter * 12.0
+                layout = self._filter_sub_layout
+                if layout is None or layout[0] != block_size:
+                    layout = self._build_filter_sub_layout(block_size)
+                _, starts, lengths, bounds, sums, means = layout
+
+                # Mean LFO value of every sub-block in one reduction
+                np.add.reduceat(self._mod_lfo_buffer[:block_size], starts, out=sums)
+                np.divide(sums, lengths, out=means)
+                mean_lfos = means.tolist()
+
+                for sb, (start, end) in enumerate(bounds):
+                    sub_filter_mod = (
+                        filter_mod_total + mean_lfos[sb] * self._mod_lfo_to_filter * 12.0
+                    )
 
                     # Update filter cutoff for this sub-block
                     sub_cutoff = base_cutoff * (2.0**sub_filter_mod)
-                    sub_cutoff = max(20.0, min(20000.0, sub_cutoff))
+                    if sub_cutoff < 20.0:
+                        sub_cutoff = 20.0
+                    elif sub_cutoff > 20000.0:
+                        sub_cutoff = 20000.0
                     filter_obj.set_parameters(cutoff=sub_cutoff, resonance=base_resonance)
 
                     # Process this sub-block (2D interleaved format)
@@ -1879,7 +1976,10 @@ class SF2Region(IRegion):
             else:
                 # No LFO modulation, constant filter per block
                 modulated_cutoff = base_cutoff * (2.0**filter_mod_total)
-                modulated_cutoff = max(20.0, min(20000.0, modulated_cutoff))
+                if modulated_cutoff < 20.0:
+                    modulated_cutoff = 20.0
+                elif modulated_cutoff > 20000.0:
+                    modulated_cutoff = 20000.0
                 filter_obj.set_parameters(cutoff=modulated_cutoff, resonance=base_resonance)
 
                 # Process (2D interleaved format)
@@ -1898,38 +1998,35 @@ class SF2Region(IRegion):
             pass  # Skip filter on error
 
     def _apply_tremolo_and_pan(self, output: np.ndarray, block_size: int) -> None:
-        """Apply tremolo (LFO→volume), balance, and auto-pan (LFO→pan) (zero-allocation)."""
-        # Apply tremolo (mod LFO → volume)
-        if self._mod_lfo_to_volume != 0.0 and self._mod_lfo_buffer is not None:
-            tremolo = 1.0 + self._mod_lfo_buffer[:block_size] * self._mod_lfo_to_volume * 0.5
-            output[:, :] *= tremolo[:, np.newaxis]
+        """Apply tremolo (LFO→volume), balance, and auto-pan (LFO→pan) (zero-allocation).
 
-        # Apply tremolo (vib LFO → volume, SF2 gen 14)
+        All per-sample volume factors and the balance/pan channel gains are
+        folded into one left and one right gain curve first, so the stereo
+        output is scaled in a single pass.
+        """
+        # Tremolo (mod LFO → volume), tremolo (vib LFO → volume, SF2 gen 14),
+        # CC92 tremolo depth and mod env → volume, combined into one curve
+        gain = None
+        if self._mod_lfo_to_volume != 0.0 and self._mod_lfo_buffer is not None:
+            gain = 1.0 + self._mod_lfo_buffer[:block_size] * self._mod_lfo_to_volume * 0.5
         if self._vib_lfo_to_volume != 0.0 and self._vib_lfo_buffer is not None:
             tremolo = 1.0 + self._vib_lfo_buffer[:block_size] * self._vib_lfo_to_volume * 0.5
-            output[:, :] *= tremolo[:, np.newaxis]
-
-        # Apply tremolo depth from CC92
+            gain = tremolo if gain is None else np.multiply(gain, tremolo, out=gain)
         if self._tremolo_depth > 0.0 and self._mod_lfo_buffer is not None:
             tremolo = 1.0 - self._tremolo_depth * (1.0 - self._mod_lfo_buffer[:block_size])
-            output[:, :] *= tremolo[:, np.newaxis]
-
-        # Apply mod env to volume
+            gain = tremolo if gain is None else np.multiply(gain, tremolo, out=gain)
         if self._mod_env_to_volume != 0.0 and self._mod_env_buffer is not None:
             env_mod = 1.0 + self._mod_env_buffer[:block_size] * self._mod_env_to_volume * 0.5
-            output[:, :] *= env_mod[:, np.newaxis]
-
-        # Apply balance (CC8)
-        if self._balance != 0.0:
-            balance = self._balance
-            if balance < 0:
-                left_gain = 1.0 + balance
-                right_gain = 1.0
-            else:
-                left_gain = 1.0
-                right_gain = 1.0 - balance
-            output[:, 0] *= left_gain
-            output[:, 1] *= right_gain
+            gain = env_mod if gain is None else np.multiply(gain, env_mod, out=gain)
+
+        # Balance (CC8)
+        left_gain = 1.0
+        right_gain = 1.0
+        balance = self._balance
+        if balance < 0:
+            left_gain = 1.0 + balance
+        elif balance > 0:
+            right_gain = 1.0 - balance
 
         # Per-sample LFO → pan modulation (replaces block-mean for waveform-accurate pan)
         pan_center = self._pan_position  # -1 to 1
@@ -1951,8 +2048,24 @@ class SF2Region(IRegion):
             # Constant-power pan law per sample
             left_gains = np.cos((pan_positions + 1.0) * np.pi / 4.0)
             right_gains = np.sin((pan_positions + 1.0) * np.pi / 4.0)
+            if gain is not None:
+                left_gains *= gain
+                right_gains *= gain
+            if left_gain != 1.0:
+                left_gains *= left_gain
+            if right_gain != 1.0:
+                right_gains *= right_gain
             output[:, 0] *= left_gains
             output[:, 1] *= right_gains
+        elif gain is not None:
+            if left_gain == right_gain:
+                output *= gain[:, np.newaxis]
+            else:
+                output[:, 0] *= gain * left_gain
+                output[:, 1] *= gain * right_gain
+        elif left_gain != right_gain:
+            output[:, 0] *= left_gain
+            output[:, 1] *= right_gain
 
         # Apply stereo width (mid/side processing)
         if self._stereo_width != 1.0:
@@ -2139,7 +2252,7 @@ class SF2Region(IRegion):
                     pw = float(modulation["pitch"])
                     if pw < -1.5 or pw > 1.5:
                         pw = (pw - 8192) / 8192.0
-                    self._cc_state[0] = max(-1.0, min(1.0, pw))
+                    self._cc_state[0] = -1.0 if pw < -1.0 else 1.0 if pw > 1.0 else pw
 
             # Evaluate modulators — uses the pre-allocated _cc_state array
             mod_values = self._mod_evaluator.evaluate(
@@ -2187,15 +2300,18 @@ class SF2Region(IRegion):
 
                 # ── Pan ─────────────────────────────────────────────────
                 if 17 in mod_values:  # pan (SF2 units: -500 … +500)
-                    self._pan_position = max(-1.0, min(1.0, int(mod_values[17]) / 500.0))
+                    pan = int(mod_values[17]) / 500.0
+                    self._pan_position = -1.0 if pan < -1.0 else 1.0 if pan > 1.0 else pan
 
                 # ── Effect sends ────────────────────────────────────────
                 if 16 in mod_values:  # reverbEffectsSend (SF2: 0-1000 -> 0.0-1.0)
-                    rv = max(0, min(1000, self._get_generator_value(16, 0) + int(mod_values[16])))
+                    rv = self._get_generator_value(16, 0) + int(mod_values[16])
+                    rv = 0 if rv < 0 else 1000 if rv > 1000 else rv
                     self._reverb_send = rv / 1000.0
 
                 if 15 in mod_values:  # chorusEffectsSend
-                    ch = max(0, min(1000, self._get_generator_value(15, 0) + int(mod_values[15])))
+                    ch = self._get_generator_value(15, 0) + int(mod_values[15])
+                    ch = 0 if ch < 0 else 1000 if ch > 1000 else ch
                     self._chorus_send = ch / 1000.0
 
                 # ── Vibrato / Mod LFO depths ────────────────────────────
@@ -2262,12 +2378,10 @@ class SF2Region(IRegion):
 
         # 6. Apply amplitude envelope
         if "amp_env" in self._envelopes:
-            env = self._envelopes["amp_env"]
-            if hasattr(env, "generate_block"):
-                env_buffer = self._work_buffer
-                if env_buffer is not None:
-                    env.generate_block(env_buffer[:block_size], block_size)
-                    output[:, :] *= env_buffer[:block_size, np.newaxis]
+            env_buffer = self._work_buffer
+            if env_buffer is not None:
+                self._envelopes["amp_env"].generate_block(env_buffer[:block_size], block_size)
+                output[:, :] *= env_buffer[:block_size, np.newaxis]
 
         # 6a. Apply expression (CC11) — multiplicative with channel volume
         if self._expression_mod != 1.0:
@@ -2295,18 +2409,18 @@ class SF2Region(IRegion):
 
         # 9a. Apply GS pan if set
         if self._gs_pan >= -1.0:
-            # GS pan: -1.0 (left) to 1.0 (right), applied as additional pan factor
-            gs_left = min(1.0, max(0.0, 1.0 - max(0.0, self._gs_pan)))
-            gs_right = min(1.0, max(0.0, 1.0 + min(0.0, self._gs_pan)))
+            # GS pan: -1.0 (left) to 1.0 (right), applied as additional pan factor;
+            # _gs_pan is already clamped to that range, so each side stays in [0, 1]
+            gs_pan = self._gs_pan
+            gs_left = 1.0 - gs_pan if gs_pan > 0.0 else 1.0
+            gs_right = 1.0 + gs_pan if gs_pan < 0.0 else 1.0
             output[:, 0] *= gs_left
             output[:, 1] *= gs_right
 
         # Check if voice is done
-        if "amp_env" in self._envelopes:
-            env = self._envelopes["amp_env"]
-            if hasattr(env, "is_active") and not env.is_active():
-                if self.state == RegionState.RELEASING:
-                    self._active = False
+        if "amp_env" in self._envelopes and not self._envelopes["amp_env"].is_active():
+            if self.state == RegionState.RELEASING:
+                self._active = False
 
         if output.shape[0] != block_size:
             output = (
@@ -2371,7 +2485,10 @@ class SF2Region(IRegion):
             if self._effective_end > 0
             else mip_sample_length
         )
-        effective_end_mip = max(1, min(effective_end_mip, mip_sample_length))
+        if effective_end_mip > mip_sample_length:
+            effective_end_mip = mip_sample_length
+        if effective_end_mip < 1:
+            effective_end_mip = 1
 
         pos = self._sample_position / decimation_factor
         loop_start_mip = self._loop_start / decimation_factor
@@ -2802,11 +2919,9 @@ class SF2Region(IRegion):
         if self.state == RegionState.RELEASING:
             # Check if envelope has completed
             if "amp_env" in self._envelopes:
-                env = self._envelopes["amp_env"]
-                if hasattr(env, "is_active"):
-                    return env.is_active()
+                return self._envelopes["amp_env"].is_active()
             # Default to True — a RELEASING voice should not be killed
-            # prematurely if the envelope doesn't expose is_active().
+            # prematurely if it has no amplitude envelope.
             return True
 
         return self.state in (RegionState.ACTIVE, RegionState.INITIALIZED)
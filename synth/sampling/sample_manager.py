@@ -161,7 +161,8 @@ class SampleCache:
                 import scipy.io.wavfile as wavfile
 
                 sr, audio_data = wavfile.read(file_path)
-                audio_data = audio_data.astype(np.float32) / 32768.0
+                audio_data = audio_data.astype(np.float32)
+                audio_data *= np.float32(1.0 / 32768.0)
 
                 if len(audio_data.shape) > 1:
                     audio_data = np.mean(audio_data, axis=1)
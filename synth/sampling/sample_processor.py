@@ -159,12 +159,15 @@ class SampleProcessor:
         """
         # Convert from source format to float32
         if from_format == "int16":
-            sample_data = sample_data.astype(np.float32) / 32768.0
+            sample_data = sample_data.astype(np.float32)
+            sample_data *= np.float32(1.0 / 32768.0)
         elif from_format == "int24":
             # 24-bit samples are typically stored as 32-bit with padding
-            sample_data = sample_data.astype(np.float32) / 8388608.0
+            sample_data = sample_data.astype(np.float32)
+            sample_data *= np.float32(1.0 / 8388608.0)
         elif from_format == "int32":
-            sample_data = sample_data.astype(np.float32) / 2147483648.0
+            sample_data = sample_data.astype(np.float32)
+            sample_data *= np.float32(1.0 / 2147483648.0)
         elif from_format == "float32":
             pass  # Already in correct format
         else:
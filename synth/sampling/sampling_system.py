@@ -564,7 +564,8 @@ class SampleManager:
                 # Convert based on sample width
                 if sample_width == 2:  # 16-bit
                     data = np.frombuffer(raw_data, dtype=np.int16)
-                    data = data.astype(np.float32) / 32768.0
+                    data = data.astype(np.float32)
+                    data *= np.float32(1.0 / 32768.0)
                 elif sample_width == 4:  # 32-bit float
                     data = np.frombuffer(raw_data, dtype=np.float32)
                 else:
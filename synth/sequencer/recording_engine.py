@@ -612,7 +612,8 @@ class RecordingEngine:
                     audio_int16 = audio_int16.reshape(-1, num_channels)
 
                 # Convert to float32
-                audio_float = audio_int16.astype(np.float32) / 32768.0
+                audio_float = audio_int16.astype(np.float32)
+                audio_float *= np.float32(1.0 / 32768.0)
 
                 # Mix to stereo if needed
                 if num_channels == 1:
@@ -7,6 +7,9 @@ Provides shared fixtures for SF2 engine, synthesizer, and test utilities.
 from __future__ import annotations
 
 import os
+import threading
+from contextlib import contextmanager
+
 import pytest
 import numpy as np
 
@@ -335,6 +338,40 @@ def ref_sf2_path():
     return sf2_path
 
 
+@pytest.fixture
+def lock_held_by_other_thread():
+    """
+    Hold a lock in a background thread for the duration of a with block.
+
+    Every wait is bounded so a test that blocks on the lock fails instead of
+    hanging the suite.
+    """
+
+    @contextmanager
+    def hold(lock, timeout: float = 5.0):
+        locked = threading.Event()
+        release = threading.Event()
+        released_in_time = []
+
+        def hold_lock():
+            with lock:
+                locked.set()
+                released_in_time.append(release.wait(timeout))
+
+        holder = threading.Thread(target=hold_lock, daemon=True)
+        holder.start()
+        assert locked.wait(timeout), "lock holder thread did not acquire the lock"
+        try:
+            yield
+        finally:
+            release.set()
+            holder.join(timeout)
+        assert not holder.is_alive(), "lock holder thread did not exit"
+        assert released_in_time == [True], "lock was held until the timeout expired"
+
+    return hold
+
+
 def pytest_configure(config):
     """Configure pytest markers."""
     config.addinivalue_line("markers", "unit: Unit tests")
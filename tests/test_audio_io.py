@@ -109,6 +109,27 @@ class TestSampleCache:
         assert cache.get("key1") is None
         assert cache.current_memory_bytes == 0
 
+    @pytest.mark.unit
+    def test_evicts_least_recently_used_by_stored_size(self) -> None:
+        """Eviction drops the least recently used entry and subtracts its stored size."""
+        from types import SimpleNamespace
+
+        import numpy as np
+
+        from synth.io.audio.sample_manager import SampleCache
+
+        cache = SampleCache(max_memory_mb=1)
+        block = SimpleNamespace(data=np.zeros(100_000, dtype=np.float32))  # 400 kB
+
+        cache.put("a", block)
+        cache.put("b", block)
+        cache.put("a", block)  # replacing must not double count
+        cache.get("a")
+        cache.put("c", block)
+
+        assert list(cache.cache) == ["a", "c"]
+        assert cache.current_memory_bytes == 2 * block.data.nbytes
+
 
 class TestSampleCacheManager:
     """Tests for SampleCacheManager (pure numpy/stdlib, always importable)."""
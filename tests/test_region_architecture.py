@@ -312,6 +312,26 @@ class TestPresetInfo:
         assert len(matching) == 1
         assert matching[0].region_id == 4
 
+    def test_get_matching_descriptors_many_regions(self):
+        """Test vectorized matching on a large preset keeps region order."""
+        descriptors = [
+            RegionDescriptor(
+                i, "mock", key_range=(i * 4, i * 4 + 7), velocity_range=(0, 63 + (i % 2) * 64)
+            )
+            for i in range(32)
+        ]
+        preset = PresetInfo(
+            bank=0,
+            program=1,
+            name="Multisample",
+            engine_type="mock",
+            region_descriptors=descriptors,
+        )
+
+        for note, velocity in [(0, 0), (10, 100), (60, 64), (127, 127), (127, 10)]:
+            expected = [d for d in descriptors if d.should_play_for_note(note, velocity)]
+            assert preset.get_matching_descriptors(note, velocity) == expected
+
     def test_has_velocity_splits(self):
         """Test velocity split detection."""
         # No splits
@@ -128,9 +128,15 @@ class TestSF2ModulatorConstants:
         assert 0 in sf2_constants.SF2_MODULATOR_SOURCES  # none
         assert 2 in sf2_constants.SF2_MODULATOR_SOURCES  # velocity
         assert 3 in sf2_constants.SF2_MODULATOR_SOURCES  # key
-        assert 10 in sf2_constants.SF2_MODULATOR_SOURCES  # pan
+        assert 10 in sf2_constants.SF2_MODULATOR_SOURCES  # poly pressure
         assert 14 in sf2_constants.SF2_MODULATOR_SOURCES  # pitch_wheel
 
+    def test_modulator_source_names_not_shadowed(self):
+        """Test general controller names win over the generic CC names."""
+        assert sf2_constants.SF2_MODULATOR_SOURCES[2] == "velocity"
+        assert sf2_constants.SF2_MODULATOR_SOURCES[14] == "pitch_wheel"
+        assert sf2_constants.SF2_MODULATOR_SOURCES[74] == "cc74"
+
     def test_modulator_sources_cc_complete(self):
         """Test CC sources 0-127 are defined."""
         for cc in range(128):
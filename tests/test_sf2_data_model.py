@@ -6,6 +6,8 @@ Tests SF2Zone, SF2Instrument, SF2Preset, SF2Sample, and RangeTree.
 
 from __future__ import annotations
 
+import numpy as np
+
 from synth.io.sf2 import sf2_data_model
 
 
@@ -20,6 +22,19 @@ class TestSF2Zone:
         assert zone.key_range == (0, 127)
         assert zone.velocity_range == (0, 127)
 
+    def test_zone_defaults_stay_per_instance(self):
+        """Test setting parsed fields on one zone leaves other zones at defaults."""
+        zone = sf2_data_model.SF2Zone("instrument")
+        zone.add_generator(43, 36 | (96 << 8))
+        zone.add_generator(53, 7)
+        zone.modulators.append({"src_operator": 2})
+
+        fresh = sf2_data_model.SF2Zone("instrument")
+        assert fresh.key_range == (0, 127)
+        assert fresh.sample_id == -1
+        assert fresh.modulators == []
+        assert fresh.matches_note_velocity(10, 100) is True
+
     def test_add_generator_sample_id(self):
         """Test adding sampleID generator at index 53."""
         zone = sf2_data_model.SF2Zone("instrument")
@@ -54,6 +69,19 @@ class TestSF2Zone:
         zone.add_generator(53, 1)  # exclusiveClass
         assert zone.get_generator_value(53) == 1
 
+    def test_add_modulators_batch(self):
+        """Test batch modulator adds keep order and append to existing ones."""
+        zone = sf2_data_model.SF2Zone("instrument")
+        zone.add_modulator({"src_operator": 2, "dest_operator": 48, "mod_amount": 960})
+        batch = [
+            {"src_operator": 1, "dest_operator": 8, "mod_amount": -2400},
+            {"src_operator": 13, "dest_operator": 6, "mod_amount": 50},
+        ]
+        zone.add_modulators(batch)
+
+        assert [mod["dest_operator"] for mod in zone.modulators] == [48, 8, 6]
+        assert zone.get_modulators_for_destination(8) == [batch[0]]
+
     def test_matches_note_velocity_in_range(self):
         """Test zone matching when note/velocity in range."""
         zone = sf2_data_model.SF2Zone("preset")
@@ -82,6 +110,20 @@ class TestSF2Zone:
         assert zone.matches_note_velocity(35, 100) is False  # just below
         assert zone.matches_note_velocity(97, 100) is False  # just above
 
+    def test_matches_note_velocity_from_generators(self):
+        """Test keyRange/velRange generators drive zone matching."""
+        zone = sf2_data_model.SF2Zone("instrument")
+        zone.add_generator(43, (72 << 8) | 60)  # keyRange 60-72
+        zone.add_generator(44, (127 << 8) | 100)  # velRange 100-127
+
+        assert zone.key_range == (60, 72)
+        assert zone.matches_note_velocity(60, 127) is True
+        assert zone.matches_note_velocity(72, 100) is True
+        assert zone.matches_note_velocity(59, 110) is False
+        assert zone.matches_note_velocity(73, 110) is False
+        assert zone.matches_note_velocity(66, 99) is False
+        assert zone.matches_note_velocity(-1, 110) is False
+
     def test_zone_finalize_preset_global(self):
         """Test preset global zone detection."""
         zone = sf2_data_model.SF2Zone("preset")
@@ -191,6 +233,43 @@ class TestSF2Instrument:
         assert 0 in sample_ids
         assert 3 in sample_ids
 
+    def test_find_first_matching_zone_many_zones(self):
+        """Test vectorized zone lookup agrees with a per-zone scan."""
+        inst = sf2_data_model.SF2Instrument(0, "Drums")
+        for i in range(40):
+            zone = sf2_data_model.SF2Zone("instrument")
+            zone.sample_id = i
+            zone.key_range = (i * 3, i * 3 + 5)
+            zone.velocity_range = (0, 63) if i % 2 else (64, 127)
+            inst.add_zone(zone)
+
+        for note in range(128):
+            for velocity in (0, 63, 64, 127):
+                expected = next(
+                    (z for z in inst.zones if z.matches_note_velocity(note, velocity)), None
+                )
+                assert inst.find_first_matching_zone(note, velocity) is expected
+
+        assert inst.find_first_matching_zone(-1, 100) is None
+
+    def test_find_first_matching_zone_cache_tracks_new_zones(self):
+        """Test cached first-match results, including misses, reset on add_zone."""
+        inst = sf2_data_model.SF2Instrument(0, "Bass")
+        low = sf2_data_model.SF2Zone("instrument")
+        low.sample_id = 0
+        low.key_range = (0, 59)
+        inst.add_zone(low)
+
+        assert inst.find_first_matching_zone(30, 100) is low
+        assert inst.find_first_matching_zone(72, 100) is None
+
+        high = sf2_data_model.SF2Zone("instrument")
+        high.sample_id = 1
+        high.key_range = (60, 127)
+        inst.add_zone(high)
+
+        assert inst.find_first_matching_zone(72, 100) is high
+
 
 class TestSF2Preset:
     """Tests for SF2Preset class."""
@@ -213,6 +292,21 @@ class TestSF2Preset:
         assert 5 in instruments
         assert preset.has_instruments() is True
 
+    def test_get_matching_zones_many_zones(self):
+        """Test vectorized layer lookup returns every matching zone in order."""
+        preset = sf2_data_model.SF2Preset(0, 0, "Layers")
+        for i in range(32):
+            zone = sf2_data_model.SF2Zone("preset")
+            zone.instrument_index = i
+            zone.key_range = (i * 4, i * 4 + 11)
+            zone.velocity_range = (0, 63) if i % 2 else (0, 127)
+            preset.add_zone(zone)
+
+        for note in (0, 30, 64, 127):
+            for velocity in (10, 100):
+                expected = [z for z in preset.zones if z.matches_note_velocity(note, velocity)]
+                assert preset.get_matching_zones(note, velocity) == expected
+
 
 class TestSF2Sample:
     """Tests for SF2Sample class."""
@@ -278,6 +372,71 @@ class TestSF2Sample:
         assert sample.is_24bit is True
         assert sample.bit_depth == 24
 
+    def test_sample_24bit_load_data(self):
+        """Test packed 24-bit data decodes to normalized stereo-interleaved floats."""
+        header = {
+            "name": "Test24",
+            "start": 0,
+            "end": 3,
+            "start_loop": 0,
+            "end_loop": 0,
+            "sample_rate": 48000,
+            "original_pitch": 60,
+            "pitch_correction": 0,
+            "sample_link": 0,
+            "sample_type": 0x8001,
+        }
+        sample = sf2_data_model.SF2Sample(header)
+        data = b"".join(v.to_bytes(3, "little", signed=True) for v in (0x400000, -0x800000, -1))
+
+        assert sample.load_data(data)
+        assert sample.data.shape == (3, 2)
+        assert sample.data[:, 0].tolist() == [0.5, -1.0, -1.0 / 8388608.0]
+        assert sample.data[:, 1].tolist() == sample.data[:, 0].tolist()
+
+    def test_sample_16bit_stereo_load_data(self):
+        """Test interleaved 16-bit data decodes to float32 frames, dropping a stray sample."""
+        header = {
+            "name": "Test16",
+            "start": 0,
+            "end": 5,
+            "start_loop": 0,
+            "end_loop": 0,
+            "sample_rate": 44100,
+            "original_pitch": 60,
+            "pitch_correction": 0,
+            "sample_link": 0,
+            "sample_type": 4,  # left sample of a stereo pair
+        }
+        sample = sf2_data_model.SF2Sample(header)
+        data = np.array([16384, -32768, 32767, 0, 1], dtype="<i2").tobytes()
+
+        assert sample.load_data(data)
+        assert sample.data.dtype == np.float32
+        assert sample.data.tolist() == [[0.5, -1.0], [32767 / 32768.0, 0.0]]
+
+    def test_sample_16bit_mono_shares_channel_buffer(self):
+        """Test mono data is exposed as stereo frames without duplicating the buffer."""
+        header = {
+            "name": "Test16",
+            "start": 0,
+            "end": 3,
+            "start_loop": 0,
+            "end_loop": 0,
+            "sample_rate": 44100,
+            "original_pitch": 60,
+            "pitch_correction": 0,
+            "sample_link": 0,
+            "sample_type": 1,
+        }
+        sample = sf2_data_model.SF2Sample(header)
+
+        assert sample.load_data(np.array([16384, -32768, 1], dtype="<i2").tobytes())
+        assert sample.data.shape == (3, 2)
+        assert sample.data.tolist() == [[0.5, 0.5], [-1.0, -1.0], [1 / 32768.0, 1 / 32768.0]]
+        assert sample.data.strides[1] == 0
+        assert not sample.data.flags.writeable
+
     def test_sample_stereo_detection(self):
         """Test stereo sample detection."""
         header = {
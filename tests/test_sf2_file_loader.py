@@ -7,6 +7,7 @@ Tests RIFF parsing, chunk handling, sample data retrieval.
 from __future__ import annotations
 
 import os
+import struct
 from pathlib import Path
 
 import pytest
@@ -18,6 +19,11 @@ TESTS_DIR = Path(__file__).parent
 REF_SF2 = TESTS_DIR / "ref.sf2"
 
 
+def riff_chunk(chunk_id: bytes, data: bytes) -> bytes:
+    """Build a RIFF chunk from its ID and payload."""
+    return chunk_id + struct.pack("<I", len(data)) + data
+
+
 @pytest.fixture
 def ref_sf2_path():
     """Get path to ref.sf2."""
@@ -234,6 +240,146 @@ class TestSF2FileLoader:
         assert result is False
 
 
+def _loader_with_pdta(**chunks: bytes) -> sf2_file_loader.SF2FileLoader:
+    """Build a loader whose pdta LIST holds the given raw subchunks."""
+    loader = sf2_file_loader.SF2FileLoader("/nonexistent/path.sf2")
+    for chunk_id, data in chunks.items():
+        loader.chunk_index.add_list_subchunk(
+            "pdta", chunk_id, sf2_file_loader.SF2BinaryChunk(chunk_id, data)
+        )
+    return loader
+
+
+class TestSF2SyntheticChunks:
+    """Tests for table parsing against hand-built pdta chunks."""
+
+    def test_sample_headers_from_raw_records(self):
+        """Test shdr records decode with loop points made sample-relative."""
+        shdr = struct.pack(
+            "<20sIIIIIbbHH", b"Piano C4", 100, 600, 150, 550, 44100, 60, -5, 0, 1
+        ) + struct.pack("<20sIIIIIbbHH", b"EOS", 0, 0, 0, 0, 0, 0, 0, 0, 0)
+        loader = _loader_with_pdta(shdr=shdr)
+
+        samples = loader.parse_sample_headers()
+
+        assert len(samples) == 2
+        assert samples[0] == {
+            "name": "Piano C4",
+            "start": 100,
+            "end": 600,
+            "start_loop": 50,
+            "end_loop": 450,
+            "sample_rate": 44100,
+            "original_pitch": 60,
+            "pitch_correction": -5,
+            "sample_link": 0,
+            "sample_type": 1,
+            "header_index": 0,
+        }
+        assert samples[1]["name"] == "EOS"
+        assert loader.parse_sample_header_at_index(0) == samples[0]
+        assert loader.parse_sample_header_at_index(2) is None
+
+    def test_sample_headers_at_indices_match_single_parse(self):
+        """Test batched header parsing matches per-index parsing and skips bad indices."""
+        shdr = b"".join(
+            struct.pack(
+                "<20sIIIIIbbHH", name, start, start + 50, start, start + 40, 22050, 60, 0, 0, 1
+            )
+            for name, start in ((b"A", 0), (b"B", 100), (b"C", 200))
+        )
+        loader = _loader_with_pdta(shdr=shdr)
+
+        headers = loader.parse_sample_headers_at_indices([2, 0, 2, 5, -1])
+
+        assert list(headers) == [2, 0]
+        for index, header in headers.items():
+            assert header == loader.parse_sample_header_at_index(index)
+
+    def test_find_preset_by_bank_program_uses_first_match(self):
+        """Test indexed preset lookup keeps front-to-back scan semantics."""
+        phdr = b"".join(
+            struct.pack("<20sHHHIII", name, program, bank, bag, 0, 0, 0)
+            for name, program, bank, bag in (
+                (b"Piano", 0, 0, 0),
+                (b"Kit", 0, 128, 1),
+                (b"Piano Dup", 0, 0, 2),
+                (b"EOP", 0, 0, 3),
+            )
+        )
+        loader = _loader_with_pdta(phdr=phdr)
+
+        preset = loader.find_preset_by_bank_program(0, 0)
+        assert preset["name"] == "Piano"
+        assert preset["header_index"] == 0
+        assert loader.find_preset_by_bank_program(128, 0)["bag_index"] == 1
+        assert loader.find_preset_by_bank_program(1, 5) is None
+
+    def test_24bit_samples_use_sm24_as_low_byte(self):
+        """Test smpl/sm24 interleaving places sm24 in the least significant byte."""
+        smpl = struct.pack("<3h", 0x1234, -1, -32768)
+        sm24 = bytes([0x56, 0xFF, 0x00])
+        smpl_chunk = sf2_file_loader.SF2BinaryChunk("smpl", smpl, 0)
+        sm24_chunk = sf2_file_loader.SF2BinaryChunk("sm24", sm24, 0)
+        loader = sf2_file_loader.SF2FileLoader("unused.sf2")
+
+        packed = loader._combine_24bit_sample_data(smpl_chunk, sm24_chunk, 0, 3)
+
+        values = [
+            int.from_bytes(packed[i : i + 3], byteorder="little", signed=True)
+            for i in range(0, len(packed), 3)
+        ]
+        assert values == [0x123456, -1, -0x800000]
+
+    def test_24bit_read_failure_logged_once(self, monkeypatch, caplog):
+        """Test a failing 24-bit sample read is reported once per sample range."""
+        loader = sf2_file_loader.SF2FileLoader("unused.sf2")
+        loader.sample_data_chunks = {"smpl": (0, 100), "sm24": (100, 50)}
+
+        def failing_read(offset, size):
+            raise OSError("device gone")
+
+        monkeypatch.setattr(loader, "_read_at", failing_read)
+
+        with caplog.at_level("ERROR", logger=sf2_file_loader.__name__):
+            assert loader._read_24bit_sample_data_from_file(0, 10) is None
+            assert loader._read_24bit_sample_data_from_file(0, 10) is None
+            assert loader._read_24bit_sample_data_from_file(10, 20) is None
+
+        assert len(caplog.records) == 2
+
+    def test_16bit_sample_data_from_mapped_file(self, tmp_path):
+        """Test 16-bit sample reads return the smpl range and survive close()."""
+        smpl = struct.pack("<4h", 1, -2, 3, -4)
+        body = b"sfbk" + riff_chunk(b"LIST", b"sdta" + riff_chunk(b"smpl", smpl))
+        path = tmp_path / "tiny.sf2"
+        path.write_bytes(riff_chunk(b"RIFF", body + riff_chunk(b"LIST", b"pdta")))
+
+        loader = sf2_file_loader.SF2FileLoader(str(path))
+        assert loader.load_file()
+
+        data = loader.get_sample_data(1, 3)
+        assert bytes(data) == struct.pack("<2h", -2, 3)
+
+        loader.close()
+        assert bytes(data) == struct.pack("<2h", -2, 3)
+
+    def test_sample_reads_do_not_wait_for_file_lock(self, tmp_path, lock_held_by_other_thread):
+        """Test positional sample reads proceed while the file lock is held."""
+        smpl = struct.pack("<4h", 1, -2, 3, -4)
+        body = b"sfbk" + riff_chunk(b"LIST", b"sdta" + riff_chunk(b"smpl", smpl))
+        path = tmp_path / "tiny.sf2"
+        path.write_bytes(riff_chunk(b"RIFF", body + riff_chunk(b"LIST", b"pdta")))
+
+        loader = sf2_file_loader.SF2FileLoader(str(path))
+        assert loader.load_file()
+        try:
+            with lock_held_by_other_thread(loader._file_lock):
+                assert bytes(loader.get_sample_data(0, 2)) == struct.pack("<2h", 1, -2)
+        finally:
+            loader.close()
+
+
 class TestSF2BinaryChunk:
     """Tests for SF2BinaryChunk class."""
 
@@ -52,6 +52,26 @@ class TestSF2Integration:
         assert len(sf2_manager.loaded_files) >= 1
         assert sf2_manager.file_order
 
+    def test_sf2_manager_loads_soundfonts_concurrently(self, sf2_soundfont_path, tmp_path):
+        """Test batch loading registers every readable file in the given order."""
+        import shutil
+
+        from synth.io.sf2.sf2_soundfont_manager import SF2SoundFontManager
+
+        first = shutil.copy(sf2_soundfont_path, tmp_path / "first.sf2")
+        second = shutil.copy(sf2_soundfont_path, tmp_path / "second.sf2")
+        missing = tmp_path / "missing.sf2"
+        manager = SF2SoundFontManager(cache_memory_mb=16)
+
+        results = manager.load_soundfonts([first, second, missing], max_workers=2)
+
+        first, second, missing = (str(Path(p).resolve()) for p in (first, second, missing))
+        assert results == {first: True, second: True, missing: False}
+        assert manager.file_order == [first, second]
+
+        assert manager.load_soundfonts([first]) == {first: True}
+        assert len(manager.loaded_files) == 2
+
     def test_sf2_manager_get_sample_data(self, sf2_manager):
         """Test SF2SoundFontManager sample data retrieval."""
         # Get first sample from first soundfont
@@ -67,6 +87,150 @@ class TestSF2Integration:
 
         pytest.skip("No samples found in soundfont")
 
+    def test_sf2_soundfont_preload_samples(self, sf2_manager):
+        """Test parallel preload caches the same data as on-demand loading."""
+        soundfont = sf2_manager.loaded_files[sf2_manager.file_order[0]]
+        sample_ids = list(range(len(soundfont.file_loader.parse_sample_headers())))
+
+        loaded = soundfont.preload_samples([*sample_ids, sample_ids[0]], max_workers=2)
+
+        assert loaded == len(soundfont.samples) > 0
+        assert soundfont.preload_samples(sample_ids) == 0
+        for sample_id, sample in list(soundfont.samples.items()):
+            soundfont.samples.pop(sample_id)
+            assert np.array_equal(soundfont.get_sample_data(sample_id), sample.data)
+
+    def test_sf2_soundfont_warm_preload_skips_lock(self, sf2_manager, lock_held_by_other_thread):
+        """Test preloading already cached samples returns while the lock is held."""
+        soundfont = sf2_manager.loaded_files[sf2_manager.file_order[0]]
+        sample_ids = list(range(len(soundfont.file_loader.parse_sample_headers())))
+        soundfont.preload_samples(sample_ids)
+        cached = [sample_id for sample_id in sample_ids if sample_id in soundfont.samples]
+
+        with lock_held_by_other_thread(soundfont._lock):
+            assert soundfont.preload_samples(cached) == 0
+
+    def test_sf2_manager_resolves_program_routes(self, sf2_manager):
+        """Test program routes follow blacklisting and remapping changes."""
+        filepath = sf2_manager.file_order[0]
+
+        assert sf2_manager._resolve_program(0, 0) == (0, 0, [filepath])
+        assert sf2_manager._resolve_program(8, 1) == (8, 1, [])
+
+        sf2_manager.remap_program(8, 1, 0, 0)
+        assert sf2_manager._resolve_program(8, 1) == (0, 0, [filepath])
+
+        sf2_manager.blacklist_program(8, 1)
+        assert sf2_manager._resolve_program(8, 1) == (8, 1, [])
+
+        sf2_manager.unblacklist_program(8, 1)
+        sf2_manager.clear_remapping(8, 1)
+        assert sf2_manager._resolve_program(8, 1) == (8, 1, [])
+
+    def test_sf2_soundfont_reuses_merged_zone_engine(self, sf2_manager, monkeypatch):
+        """Test the merged zone engine is built once per zone combination."""
+        from synth.io.sf2.sf2_data_model import SF2Instrument, SF2Zone
+
+        soundfont = sf2_manager.loaded_files[sf2_manager.file_order[0]]
+        soundfont.preload_samples([0])
+        instrument = SF2Instrument(7, "Test")
+        instrument_zone = SF2Zone("instrument")
+        instrument_zone.sample_id = 0
+        instrument.add_zone(instrument_zone)
+        soundfont.instruments[7] = instrument
+        preset_zone = SF2Zone("preset")
+        preset_zone.instrument_index = 7
+
+        created = []
+        create_zone_engine = soundfont.modulation_engine.create_zone_engine
+
+        def counting_create_zone_engine(*args, **kwargs):
+            engine = create_zone_engine(*args, **kwargs)
+            created.append(engine)
+            monkeypatch.setattr(
+                engine,
+                "get_modulated_parameters",
+                lambda note, velocity, controllers=None: {"note": note},
+            )
+            return engine
+
+        monkeypatch.setattr(
+            soundfont.modulation_engine, "create_zone_engine", counting_create_zone_engine
+        )
+
+        first = soundfont._process_zones_to_parameters([preset_zone], 60, 100)
+        second = soundfont._process_zones_to_parameters([preset_zone], 64, 100)
+
+        assert len(created) == 1
+        assert first["zone_id"] == second["zone_id"] == created[0].zone_id
+        assert second["note"] == 64
+
+    def test_sf2_manager_caches_program_parameters(self, sf2_manager, monkeypatch):
+        """Test program parameters are cached until program routing changes."""
+        filepath = sf2_manager.file_order[0]
+        soundfont = sf2_manager.loaded_files[filepath]
+        calls = []
+
+        def fake_get_program_parameters(bank, program, note, velocity, controllers=None):
+            calls.append((bank, program, note, velocity))
+            return {"note": note}
+
+        monkeypatch.setattr(soundfont, "get_program_parameters", fake_get_program_parameters)
+
+        first = sf2_manager.get_program_parameters(0, 0, 60, 100, controllers={1: 0.5})
+        first["note"] = 0
+        second = sf2_manager.get_program_parameters(0, 0, 60, 100, controllers={1: 0.5})
+
+        assert second["note"] == 60
+        assert second["source_file"] == filepath
+        assert len(calls) == 1
+
+        # Continuous controllers do not change note-on parameters
+        sf2_manager.get_program_parameters(0, 0, 60, 100, controllers={1: 1.0, 224: -0.5})
+        assert len(calls) == 1
+
+        sf2_manager.get_program_parameters(0, 0, 64, 100, controllers={1: 0.5})
+        assert len(calls) == 2
+
+        sf2_manager.blacklist_program(0, 0)
+        assert sf2_manager.get_program_parameters(0, 0, 60, 100, controllers={1: 0.5}) is None
+        sf2_manager.unblacklist_program(0, 0)
+        sf2_manager.get_program_parameters(0, 0, 60, 100, controllers={1: 0.5})
+        assert len(calls) == 3
+
+    def test_sf2_manager_preloads_program_samples(self, sf2_manager, monkeypatch):
+        """Test preloading resolves programs and decodes their instruments' samples."""
+        from synth.io.sf2.sf2_data_model import SF2Instrument, SF2Preset, SF2Zone
+
+        soundfont = sf2_manager.loaded_files[sf2_manager.file_order[0]]
+        preset = SF2Preset(0, 0, "Layered")
+        instrument = SF2Instrument(3, "Keys")
+        for instrument_index in (3, -1, 3):
+            zone = SF2Zone("preset")
+            zone.instrument_index = instrument_index
+            preset.zones.append(zone)
+        for sample_id in (7, -1, 9):
+            zone = SF2Zone("instrument")
+            zone.sample_id = sample_id
+            instrument.zones.append(zone)
+        requested = []
+
+        monkeypatch.setattr(
+            soundfont, "_get_or_load_preset", lambda bank, program: preset if bank == 0 else None
+        )
+        monkeypatch.setattr(soundfont, "_get_or_load_instrument", {3: instrument}.get)
+        monkeypatch.setattr(
+            soundfont,
+            "preload_samples",
+            lambda sample_ids, max_workers=None: requested.append(sample_ids) or len(sample_ids),
+        )
+
+        assert sf2_manager.preload_programs([(0, 0), (0, 0), (99, 99)], max_workers=2) == 2
+        assert requested == [[7, 9]]
+
+        sf2_manager.blacklist_program(0, 0)
+        assert sf2_manager.preload_programs([(0, 0)]) == 0
+
     def test_sf2_manager_get_sample_info(self, sf2_manager):
         """Test SF2SoundFontManager sample info retrieval."""
         for filepath in sf2_manager.file_order:
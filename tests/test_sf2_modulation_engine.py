@@ -39,6 +39,20 @@ class TestSF2GeneratorProcessor:
         proc.set_generator(51, -200)  # coarseTune min is -120
         assert proc.get_generator(51) >= -120
 
+    def test_to_modern_synth_params_tracks_generator_changes(self):
+        """Test cached parameters are refreshed and never shared with callers."""
+        proc = sf2_modulation_engine.SF2GeneratorProcessor()
+        params = proc.to_modern_synth_params()
+        params["coarse_tune"] = 99
+
+        assert proc.to_modern_synth_params()["coarse_tune"] == 0
+
+        proc.set_generator(51, 7)
+        assert proc.to_modern_synth_params()["coarse_tune"] == 7
+
+        proc.set_generators({51: -3})
+        assert proc.to_modern_synth_params()["coarse_tune"] == -3
+
     def test_to_modern_synth_params_complete(self):
         """Test parameter conversion produces all expected params."""
         proc = sf2_modulation_engine.SF2GeneratorProcessor()
@@ -166,6 +180,19 @@ class TestSF2ModulationEngine:
         mod = engine.get_modulation_for_generator(21, 60, 100)
         assert isinstance(mod, float)
 
+    def test_modulation_factors_match_per_generator_lookup(self):
+        """Test factors agree with per-generator modulation and skip idle destinations."""
+        engine = sf2_modulation_engine.SF2ModulationEngine()
+        engine.controller_values[1] = 127.0
+        engine.add_modulator({"src_operator": 1, "dest_operator": 8, "mod_amount": 16384})
+        engine.add_modulator({"src_operator": 1, "dest_operator": 8, "mod_amount": -8192})
+        engine.add_modulator({"src_operator": 5, "dest_operator": 17, "mod_amount": 1000})
+
+        factors = engine._calculate_modulation_factors(60, 100)
+
+        assert list(factors) == ["filter_cutoff"]
+        assert factors["filter_cutoff"] == engine._get_modulation(8, 60, 100) * 2.0
+
     def test_get_performance_state(self):
         """Test performance state retrieval."""
         engine = sf2_modulation_engine.SF2ModulationEngine()
@@ -210,6 +237,23 @@ class TestSF2ZoneEngine:
         assert params["coarse_tune"] == 5
         assert params["fine_tune"] == -0.25  # -25/100
 
+    def test_zone_engine_layer_priority(self):
+        """Test later layers override earlier ones and merged values are clamped."""
+        zone_engine = sf2_modulation_engine.SF2ZoneEngine(
+            "test_zone",
+            {51: 200},  # instrument local: coarseTune, clamped to 120
+            [],
+            {51: 3, 52: 10, 17: 100},  # preset local
+            [],
+            preset_global_generators={51: 1, 52: 1, 56: 50},
+            instrument_global_generators={52: -40},
+        )
+
+        assert zone_engine.processor.get_generator(51) == 120
+        assert zone_engine.processor.get_generator(52) == -40
+        assert zone_engine.processor.get_generator(17) == 100
+        assert zone_engine.processor.get_generator(56) == 50
+
     def test_get_modulated_parameters_note_velocity(self):
         """Test parameters include note and velocity."""
         zone_engine = sf2_modulation_engine.SF2ZoneEngine("test", {}, [], {}, [])
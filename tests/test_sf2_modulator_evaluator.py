@@ -0,0 +1,70 @@
+"""
+Test suite for SF2 modulator evaluator.
+
+Tests SF2ModulatorEvaluator.
+"""
+
+from __future__ import annotations
+
+from synth.processing.partial.sf2_modulator_evaluator import SF2ModulatorEvaluator
+
+
+class TestSF2ModulatorEvaluator:
+    """Tests for SF2ModulatorEvaluator class."""
+
+    def test_velocity_modulator_follows_note(self):
+        """Test note-constant modulators are re-evaluated when the note changes."""
+        evaluator = SF2ModulatorEvaluator(
+            [{"src_operator": 0x0002, "dest_operator": 21, "mod_amount": 127}]
+        )
+
+        assert evaluator.evaluate({}, 127, 60)[21] == 127.0
+        assert evaluator.evaluate({}, 127, 60)[21] == 127.0
+        assert evaluator.evaluate({}, 0, 60)[21] == 0.0
+
+    def test_controller_modulator_follows_each_block(self):
+        """Test controller-driven modulators are evaluated on every call."""
+        evaluator = SF2ModulatorEvaluator(
+            [{"src_operator": 0x004A, "dest_operator": 11, "mod_amount": 1000}]
+        )
+
+        assert evaluator.evaluate({74: 0.0}, 100, 60)[11] == 0.0
+        assert evaluator.evaluate({74: 127.0}, 100, 60)[11] == 1000.0
+
+    def test_none_source_contributes_nothing(self):
+        """Test a modulator without a primary source leaves its destination out."""
+        evaluator = SF2ModulatorEvaluator(
+            [{"src_operator": 0, "dest_operator": 3, "mod_amount": 500}]
+        )
+
+        assert 3 not in evaluator.evaluate({}, 100, 60)
+
+    def test_source_polarity_and_direction(self):
+        """Test bipolar and direction flags map the source range per the SF2 spec."""
+        evaluator = SF2ModulatorEvaluator(
+            [
+                {"src_operator": 0x0102, "dest_operator": 21, "mod_amount": 100},
+                {"src_operator": 0x0082, "dest_operator": 22, "mod_amount": 100},
+                {"src_operator": 0x0182, "dest_operator": 23, "mod_amount": 100},
+            ]
+        )
+
+        loud = dict(evaluator.evaluate({}, 127, 60))
+        silent = evaluator.evaluate({}, 0, 60)
+
+        assert (loud[21], silent[21]) == (0.0, 100.0)
+        assert (loud[22], silent[22]) == (100.0, -100.0)
+        assert (loud[23], silent[23]) == (-100.0, 100.0)
+
+    def test_evaluate_reuses_result_dict(self):
+        """Test each block refills the same result dict instead of allocating one."""
+        evaluator = SF2ModulatorEvaluator(
+            [{"src_operator": 0x004A, "dest_operator": 11, "mod_amount": 1000}]
+        )
+
+        first = evaluator.evaluate({74: 127.0}, 100, 60)
+        assert first[11] == 1000.0
+
+        second = evaluator.evaluate({74: 0.0}, 100, 60)
+        assert second is first
+        assert second[11] == 0.0
@@ -614,6 +614,66 @@ class TestSF2EdgeCases:
         pass  # Implicitly tested by other tests
 
 
+class TestSF2ModulationEnvelope:
+    """Test the block-rendered SF2 modulation envelope."""
+
+    @staticmethod
+    def _make_region(**overrides):
+        from synth.processing.partial.sf2_region import SF2Region
+
+        region = object.__new__(SF2Region)
+        settings = {
+            "sample_rate": 1000,
+            "current_note": 60,
+            "_mod_env_buffer": None,
+            "_mod_env_ramp": None,
+            "_mod_env_times": None,
+            "_mod_env_flags": None,
+            "_mod_env_level": 0.0,
+            "_mod_env_stage": 1,
+            "_mod_env_time_in_stage": 0.0,
+            "_delay_mod_env": 0.0025,
+            "_attack_mod_env": 0.004,
+            "_hold_mod_env": 0.0025,
+            "_hold_mod_env_tc": 0,
+            "_decay_mod_env": 0.004,
+            "_decay_mod_env_tc": 0,
+            "_sustain_mod_env": 0.5,
+            "_release_mod_env": 0.01,
+            "_keynum_to_mod_env_hold": 0,
+            "_keynum_to_mod_env_decay": 0,
+        }
+        settings.update(overrides)
+        for name, value in settings.items():
+            setattr(region, name, value)
+        return region
+
+    def test_stages_render_in_order(self):
+        """Test delay, attack, hold and decay settle at the sustain level."""
+        region = self._make_region()
+
+        block = region._generate_modulation_envelope_block(20).copy()
+
+        np.testing.assert_allclose(block[:4], 0.0)
+        np.testing.assert_allclose(block[4:7], [0.25, 0.5, 0.75], atol=1e-6)
+        np.testing.assert_allclose(block[7:11], 0.75, atol=1e-6)
+        np.testing.assert_allclose(block[11:14], [0.875, 0.75, 0.625], atol=1e-6)
+        np.testing.assert_allclose(block[14:], 0.5)
+        assert region._mod_env_stage == 5
+
+    def test_release_decays_exponentially_across_blocks(self):
+        """Test release continues seamlessly from one block to the next."""
+        region = self._make_region(
+            _mod_env_stage=6, _mod_env_level=1.0, _release_mod_env=0.5, sample_rate=100
+        )
+
+        first = region._generate_modulation_envelope_block(4).copy()
+        second = region._generate_modulation_envelope_block(4).copy()
+
+        expected = np.exp(-0.02 * np.arange(8))
+        np.testing.assert_allclose(np.concatenate([first, second]), expected, rtol=1e-6)
+
+
 # ========== Test Runner ==========
 
 if __name__ == "__main__":
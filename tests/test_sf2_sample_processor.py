@@ -0,0 +1,165 @@
+"""
+Test suite for SF2 sample processor.
+
+Tests SF2SampleCache and SampleMipMap.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from synth.io.sf2 import sf2_sample_processor
+
+
+class TestSF2SampleCache:
+    """Tests for SF2SampleCache class."""
+
+    def test_get_returns_cached_copy(self):
+        """Test cached data is returned for a tuple key."""
+        cache = sf2_sample_processor.SF2SampleCache(max_memory_mb=1)
+        data = np.arange(4, dtype=np.float32)
+
+        cache.put(("piano", 0, "linear"), data)
+
+        cached = cache.get(("piano", 0, "linear"))
+        assert np.array_equal(cached, data)
+        assert cache.get(("piano", 1, "linear")) is None
+
+    def test_put_shares_buffer_read_only(self):
+        """Test the cache keeps a read-only view of the data instead of a copy."""
+        cache = sf2_sample_processor.SF2SampleCache(max_memory_mb=1)
+        data = np.arange(4, dtype=np.float32)
+
+        stored = cache.put("a", data)
+
+        cached = cache.get("a")
+        assert cached is stored
+        assert np.shares_memory(cached, data)
+        assert not cached.flags.writeable
+        assert data.flags.writeable
+
+    def test_get_does_not_wait_for_lock(self, lock_held_by_other_thread):
+        """Test lookups succeed while another thread holds the cache lock."""
+        cache = sf2_sample_processor.SF2SampleCache(max_memory_mb=1)
+        cache.put("a", np.zeros(4, dtype=np.float32))
+
+        with lock_held_by_other_thread(cache.lock):
+            assert cache.get("a") is not None
+            assert cache.get("b") is None
+
+        assert cache.get_stats()["protected_samples"] == 1
+
+    def test_evicts_least_recently_used(self):
+        """Test eviction drops the least recently used entry first."""
+        cache = sf2_sample_processor.SF2SampleCache(max_memory_mb=1)
+        block = np.zeros(100_000, dtype=np.float32)  # 400 kB
+
+        cache.put("a", block)
+        cache.put("b", block)
+        cache.get("a")
+        cache.put("c", block)
+
+        assert list(cache.cache) == ["a", "c"]
+        assert cache.current_memory == 2 * block.nbytes
+
+    def test_put_counts_shared_mono_buffer_once(self):
+        """Test a mono sample viewed as stereo is charged at its real size."""
+        cache = sf2_sample_processor.SF2SampleCache(max_memory_mb=1)
+        mono = np.zeros(1000, dtype=np.float32)
+
+        cache.put("a", np.broadcast_to(mono.reshape(-1, 1), (1000, 2)))
+
+        assert cache.current_memory == mono.nbytes
+
+    def test_put_replaces_existing_entry(self):
+        """Test re-putting a key does not double count its size."""
+        cache = sf2_sample_processor.SF2SampleCache(max_memory_mb=1)
+        cache.put("a", np.zeros(10, dtype=np.float32))
+        cache.put("a", np.zeros(20, dtype=np.float32))
+
+        assert cache.current_memory == 80
+        assert len(cache.get("a")) == 20
+
+    def test_repeatedly_used_entry_survives_scan(self):
+        """Test a one-off scan evicts probationary entries before protected ones."""
+        cache = sf2_sample_processor.SF2SampleCache(max_memory_mb=1)
+        block = np.zeros(25_000, dtype=np.float32)  # 100 kB
+
+        cache.put("hot", block)
+        cache.get("hot")
+        for i in range(50):
+            cache.put(("scan", i), block)
+
+        assert cache.get("hot") is not None
+        assert cache.current_memory <= cache.max_memory
+
+    def test_cold_entry_does_not_displace_popular_one(self):
+        """Test admission rejects a newcomer requested less often than its victim."""
+        cache = sf2_sample_processor.SF2SampleCache(max_memory_mb=1)
+        block = np.zeros(200_000, dtype=np.float32)  # 800 kB
+
+        for _ in range(3):
+            cache.get("popular")  # misses are counted too
+        cache.put("popular", block)
+
+        cache.put("cold", block)
+
+        assert list(cache.cache) == ["popular"]
+        assert cache.get("cold") is None
+
+    def test_rejected_entry_evicts_nothing(self):
+        """Test a newcomer refused at a later victim does not evict earlier ones."""
+        cache = sf2_sample_processor.SF2SampleCache(max_memory_mb=1)
+        block = np.zeros(100_000, dtype=np.float32)  # 400 kB
+
+        cache.put("cold", block)
+        for _ in range(3):
+            cache.get("popular")
+        cache.put("popular", block)
+
+        cache.put("big", np.zeros(200_000, dtype=np.float32))  # needs both slots
+
+        assert list(cache.cache) == ["cold", "popular"]
+        assert cache.current_memory == 2 * block.nbytes
+
+
+class TestSampleMipMap:
+    """Tests for SampleMipMap class."""
+
+    def test_memory_usage_counts_shared_mono_buffer_once(self):
+        """Test a mono sample viewed as stereo is accounted at its real size."""
+        mono = np.zeros(1000, dtype=np.float32)
+        shared = np.broadcast_to(mono.reshape(-1, 1), (1000, 2))
+        stereo = np.zeros((1000, 2), dtype=np.float32)
+
+        assert sf2_sample_processor.SampleMipMap(shared, 44100).get_memory_usage() == 4000
+        assert sf2_sample_processor.SampleMipMap(stereo, 44100).get_memory_usage() == 8000
+
+
+class TestSF2SampleProcessor:
+    """Tests for SF2SampleProcessor class."""
+
+    def test_convert_16bit_data_scales_frames(self):
+        """Test 16-bit PCM decodes to normalized float32 frames."""
+        proc = sf2_sample_processor.SF2SampleProcessor(cache_memory_mb=1)
+        data = np.array([0, 16384, -32768, 32767], dtype="<i2").tobytes()
+
+        stereo = proc._convert_16bit_data(data, is_stereo=True)
+        mono = proc._convert_16bit_data(data + b"\x00", is_stereo=False)
+
+        assert stereo.dtype == np.float32
+        assert stereo.shape == (2, 2)
+        assert stereo[1, 0] == -1.0
+        assert np.array_equal(mono, stereo.reshape(-1))
+
+    def test_process_sample_miss_returns_cached_view(self):
+        """Test a cache miss returns the same read-only buffer later hits return."""
+        proc = sf2_sample_processor.SF2SampleProcessor(cache_memory_mb=1)
+        data = np.array([0, 16384, -32768, 32767], dtype="<i2").tobytes()
+        info = {"name": "piano", "bit_depth": 16}
+
+        first = proc.process_sample(data, info)
+        second = proc.process_sample(data, info)
+
+        assert not first.flags.writeable
+        assert second is first
@@ -1,7 +1,7 @@
 """
 Test suite for SF2 zone cache.
 
-Tests AVLRangeTree, HierarchicalZoneCache, and SF2ZoneCacheManager.
+Tests AVLRangeTree, SortedIntervalIndex, HierarchicalZoneCache, and SF2ZoneCacheManager.
 """
 
 from __future__ import annotations
@@ -79,6 +79,23 @@ class TestAVLRangeTree:
 
         assert len(results) == 2
 
+    def test_query_finds_zones_behind_rotations(self):
+        """Test overlapping zones are found wherever rotations place them."""
+        tree = sf2_zone_cache.AVLRangeTree()
+        zones = []
+        for key_range in ((0, 102), (80, 98), (0, 56), (80, 114)):
+            zone = SF2Zone("preset")
+            zone.key_range = key_range
+            zone.velocity_range = (0, 127)
+            tree.insert(zone)
+            zones.append(zone)
+
+        for key in range(128):
+            expected = {id(zone) for zone in zones if zone.key_range[0] <= key <= zone.key_range[1]}
+            results = tree.query(key, 100)
+            assert len(results) == len(expected)
+            assert {id(zone) for zone in results} == expected
+
     def test_query_velocity_matching(self):
         """Test velocity-based matching."""
         tree = sf2_zone_cache.AVLRangeTree()
@@ -156,6 +173,55 @@ class TestRangeNode:
         assert node.overlaps(60, 50) is False
 
 
+class TestSortedIntervalIndex:
+    """Tests for SortedIntervalIndex class."""
+
+    def test_query_matches_brute_force(self):
+        """Test every overlapping zone is found, in insertion order."""
+        index = sf2_zone_cache.SortedIntervalIndex()
+        zones = []
+        for key_range, vel_range in (
+            ((0, 127), (0, 127)),  # wide zone inserted first
+            ((60, 72), (0, 63)),
+            ((36, 48), (0, 127)),
+            ((60, 64), (64, 127)),
+            ((40, 100), (0, 127)),
+        ):
+            zone = SF2Zone("preset")
+            zone.key_range = key_range
+            zone.velocity_range = vel_range
+            index.insert(zone)
+            zones.append(zone)
+
+        for key in range(128):
+            for velocity in (1, 64, 127):
+                expected = [
+                    zone
+                    for zone in zones
+                    if zone.key_range[0] <= key <= zone.key_range[1]
+                    and zone.velocity_range[0] <= velocity <= zone.velocity_range[1]
+                ]
+                assert index.query(key, velocity) == expected
+
+        assert len(index) == 5
+
+    def test_insert_after_query(self):
+        """Test zones added after a query are picked up by the next one."""
+        index = sf2_zone_cache.SortedIntervalIndex()
+        first = SF2Zone("preset")
+        first.key_range = (48, 72)
+        index.insert(first)
+        assert index.query(60, 100) == [first]
+
+        second = SF2Zone("preset")
+        second.key_range = (0, 60)
+        index.insert(second)
+        assert index.query(60, 100) == [first, second]
+
+        index.clear()
+        assert index.query(60, 100) == []
+
+
 class TestHierarchicalZoneCache:
     """Tests for HierarchicalZoneCache class."""
 
@@ -21,8 +21,9 @@ class TestSF2ZoneSelection:
     def test_key_range_matching(self, ref_sf2_path):
         """Test zone matching based on key ranges."""
         from synth.engines.sf2_engine import SF2Engine
+
         engine = SF2Engine(sf2_file_path=ref_sf2_path, sample_rate=44100, block_size=1024)
-        
+
         # Get preset info
         preset_info = engine.get_preset_info(0, 0)
         assert preset_info is not None, "Should be able to load preset from reference SF2"
@@ -37,7 +38,7 @@ class TestSF2ZoneSelection:
             matching = [d for d in descriptors if d.should_play_for_note(note, 100)]
             if matching:
                 matched_notes += 1
-        
+
         # Most notes should match at least one zone in a real SF2 file
         assert matched_notes > 0, "At least some notes should match zones"
 
@@ -45,8 +46,9 @@ class TestSF2ZoneSelection:
     def test_velocity_range_matching(self, ref_sf2_path):
         """Test zone matching based on velocity ranges."""
         from synth.engines.sf2_engine import SF2Engine
+
         engine = SF2Engine(sf2_file_path=ref_sf2_path, sample_rate=44100, block_size=1024)
-        
+
         preset_info = engine.get_preset_info(0, 0)
         assert preset_info is not None, "Should be able to load preset from reference SF2"
 
@@ -229,7 +231,10 @@ class TestSF2ZoneSelection:
         for i, desc1 in enumerate(descriptors):
             for desc2 in descriptors[i + 1 :]:
                 # Check if key ranges overlap
-                if desc1.key_range[0] <= desc2.key_range[1] and desc2.key_range[0] <= desc1.key_range[1]:
+                if (
+                    desc1.key_range[0] <= desc2.key_range[1]
+                    and desc2.key_range[0] <= desc1.key_range[1]
+                ):
                     overlaps.append((desc1.region_id, desc2.region_id))
 
         # Overlaps are allowed in SF2 (for layering)
@@ -292,4 +297,28 @@ class TestSF2ZoneSelection:
 
         # Preset should have a name
         assert isinstance(preset_info.name, str)
-        assert len(preset_info.name) > 0
\ No newline at end of file
+        assert len(preset_info.name) > 0
+
+    @pytest.mark.unit
+    def test_preset_info_is_memoized(self, sf2_engine, monkeypatch):
+        """Test preset info is reused until the manager state changes."""
+        built = []
+
+        def build_preset_info(bank, program):
+            built.append((bank, program))
+            return object() if program == 0 else None
+
+        monkeypatch.setattr(sf2_engine, "_build_preset_info", build_preset_info)
+        sf2_engine._preset_info_cache.clear()
+
+        preset_info = sf2_engine.get_preset_info(0, 0)
+        assert sf2_engine.get_preset_info(0, 0) is preset_info
+        assert built == [(0, 0)]
+
+        # Misses are not cached
+        assert sf2_engine.get_preset_info(0, 1) is None
+        assert sf2_engine.get_preset_info(0, 1) is None
+        assert built == [(0, 0), (0, 1), (0, 1)]
+
+        sf2_engine.soundfont_manager.remap_program(5, 0, 0, 0)
+        assert sf2_engine.get_preset_info(0, 0) is not preset_info